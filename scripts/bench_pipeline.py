@@ -0,0 +1,494 @@
+"""
+Benchmark the data pipeline stages on synthetic datasets.
+
+Each stage runs against generated datasets of 1k, 10k and 100k rows
+(--sizes), in a fresh process per measurement so peak RSS belongs to that
+stage alone (it includes loading the stage's inputs). Stages:
+
+    xlsx_read     stream the spreadsheet rows (extract_coordinates.iter_excel)
+    url_extract   locate coordinate sources in every full URL (url_matcher.scan_url)
+    decode        S2 cell and Plus Code decoding, one value at a time
+    decode_batch  the same values through batch_decode.py
+    resolve       short URL resolution against a local stand-in server
+    cache_save    store every row in a fresh CoordinateCache
+    cache_load    look every row up in that cache
+    ts_generate   render every record as a masjids.ts entry and write the file
+    url_rewrite   rewrite half of the audioUrl literals (update_audio_urls.rewrite_file)
+    dedup         find duplicate masjids through the spatial hash (dedup_masjids.py)
+
+Short URLs resolve against a local HTTP server that answers like Google
+Maps (a 302 to a ?q=<plus code>&ftid=... URL), so no request leaves the
+machine; the per-host rate limit is lifted for the run.
+
+Wall time, peak RSS and throughput (rows/s) per stage and size are
+written to --output. When a baseline file exists, any stage whose wall
+time or peak RSS grew by more than --threshold (a fraction, default 0.25)
+fails the run with exit status 1; measurements under
+MIN_COMPARABLE_SECONDS are too noisy to compare and only their RSS is
+checked. --update-baseline stores this run as the new baseline.
+
+Usage:
+    python scripts/bench_pipeline.py [--sizes 1000,10000,100000] [--stages a,b]
+        [--repeat N] [--output PATH] [--baseline PATH] [--threshold F]
+        [--stage-threshold STAGE=F ...] [--update-baseline]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_PATH = os.path.join(SCRIPT_DIR, 'bench_results.json')
+BASELINE_PATH = os.path.join(SCRIPT_DIR, 'bench_baseline.json')
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_THRESHOLD = 0.25
+MIN_COMPARABLE_SECONDS = 0.05
+SEED = 1447
+
+REGIONS = [('الشمال', 'north'), ('الشرق', 'east'), ('الغرب والجنوب', 'westSouth')]
+# Share of rows per URL shape, roughly as in riyadh_list.xlsx
+URL_KINDS = ['@coords'] * 4 + ['!3d!4d'] * 2 + ['short'] * 2 + ['plus_code', 'ftid']
+SHORT_URL_BASE = 'https://maps.app.goo.gl/'
+SHEET_NAME = 'جميع القراء'
+
+
+# ── Synthetic data ──
+
+def synthetic_row(i):
+    """Row `i` of every synthetic dataset (deterministic)."""
+    import s2sphere
+    from openlocationcode import openlocationcode as olc
+
+    rng = random.Random(SEED * 1_000_003 + i)
+    lat = round(rng.uniform(24.45, 25.0), 7)
+    lng = round(rng.uniform(46.45, 46.95), 7)
+    region_ar, region = REGIONS[i % len(REGIONS)]
+    name = f'مسجد {i}'
+    quoted = urllib.parse.quote(name)
+    cell = s2sphere.CellId.from_lat_lng(s2sphere.LatLng.from_degrees(lat, lng))
+    ftid = f'0x{cell.id():x}:0x{rng.getrandbits(60):x}'
+    plus_code = olc.encode(lat, lng)[4:]  # short code, recovered near Riyadh
+
+    kind = URL_KINDS[i % len(URL_KINDS)]
+    if kind == '@coords':
+        url = f'https://www.google.com/maps/place/{quoted}/@{lat},{lng},17z'
+    elif kind == '!3d!4d':
+        url = f'https://www.google.com/maps/place/{quoted}/data=!4m6!3m5!8m2!3d{lat}!4d{lng}!16s'
+    elif kind == 'short':
+        url = f'{SHORT_URL_BASE}bench{i}'
+    elif kind == 'plus_code':
+        url = 'https://www.google.com/maps?' + urllib.parse.urlencode({'q': f'{plus_code} الرياض'})
+    else:
+        url = f'https://www.google.com/maps?ftid={ftid}'
+
+    return {
+        'id': f'{region[0]}-{i:06d}',
+        'readerName': f'القارئ {i}',
+        'masjidName': name,
+        'region_ar': region_ar,
+        'region': region,
+        'lat': lat,
+        'lng': lng,
+        'googleMapsUrl': url,
+        'audioUrl': f'https://www.youtube.com/watch?v=bench{i:06d}',
+        'notes': 'ملاحظة' if i % 7 == 0 else None,
+        'plusCode': plus_code,
+        'ftid': ftid,
+    }
+
+
+def resolved_url(i):
+    """Where short URL `i` redirects to, in the shape Google Maps uses."""
+    row = synthetic_row(i)
+    return 'https://www.google.com/maps?' + urllib.parse.urlencode({
+        'q': f"{row['plusCode']} الرياض", 'ftid': row['ftid'],
+    })
+
+
+def write_inputs(size, data_dir):
+    """Generate the rows and spreadsheet for one dataset size; return their directory."""
+    import openpyxl
+
+    size_dir = os.path.join(data_dir, str(size))
+    os.makedirs(size_dir, exist_ok=True)
+    rows = [synthetic_row(i) for i in range(size)]
+    with open(os.path.join(size_dir, 'rows.json'), 'w', encoding='utf-8') as f:
+        json.dump(rows, f, ensure_ascii=False)
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(SHEET_NAME)
+    ws.append(['القارئ', 'المسجد', 'المنطقة', 'الموقع', 'التلاوة', 'ملاحظات'])
+    for row in rows:
+        ws.append([row['readerName'], row['masjidName'], row['region_ar'],
+                   row['googleMapsUrl'], row['audioUrl'], row['notes']])
+    wb.save(os.path.join(size_dir, 'dataset.xlsx'))
+    return size_dir
+
+
+# ── Local stand-in server ──
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers short URLs with a 302 to their resolved URL, anything else with 200."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        token = self.path.lstrip('/')
+        if token.startswith('bench'):
+            self.send_response(302)
+            self.send_header('Location', resolved_url(int(token[len('bench'):])))
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_GET = do_HEAD
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stand_in_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def stand_in_transport(address):
+    """An HTTPTransport that sends every request to the stand-in server."""
+    from redirect_resolver import HTTPTransport
+
+    class StandInTransport(HTTPTransport):
+        def request(self, method, url, headers=None):
+            parsed = urllib.parse.urlsplit(url)
+            local = urllib.parse.urlunsplit(('http', f'{address[0]}:{address[1]}', parsed.path, parsed.query, ''))
+            return super().request(method, local, headers)
+
+    return StandInTransport()
+
+
+# ── Stages ──
+# Each stage takes (rows, size_dir, server address) and returns the timed
+# callable plus the number of rows it processes; setup is not timed.
+
+def stage_xlsx_read(rows, size_dir, address):
+    from city_profiles import RIYADH
+    from extract_coordinates import iter_excel
+
+    city = RIYADH._replace(xlsx_path=os.path.join(size_dir, 'dataset.xlsx'))
+    return lambda: sum(1 for _ in iter_excel(city)), len(rows)
+
+
+def full_urls(rows):
+    return [r['googleMapsUrl'] for r in rows if not r['googleMapsUrl'].startswith(SHORT_URL_BASE)]
+
+
+def stage_url_extract(rows, size_dir, address):
+    from url_matcher import scan_url
+
+    urls = full_urls(rows)
+    return lambda: [scan_url(url) for url in urls], len(urls)
+
+
+def encoded_values(rows):
+    from url_matcher import scan_url
+
+    s2, plus = [], []
+    for url in full_urls(rows):
+        for candidate in scan_url(url):
+            if candidate.method == 's2cell':
+                s2.append(candidate.value)
+            elif candidate.method == 'plus_code':
+                plus.append(candidate.value)
+    return s2, plus
+
+
+def stage_decode(rows, size_dir, address):
+    from extract_coordinates import decode_plus_code, decode_s2_cell
+
+    s2, plus = encoded_values(rows)
+
+    def run():
+        for value in s2:
+            decode_s2_cell(value)
+        for value in plus:
+            decode_plus_code(value)
+
+    return run, len(s2) + len(plus)
+
+
+def stage_decode_batch(rows, size_dir, address):
+    from batch_decode import decode_plus_codes, decode_s2_cells, s2_ids_from_hex
+
+    s2, plus = encoded_values(rows)
+
+    def run():
+        decode_s2_cells(s2_ids_from_hex(s2))
+        decode_plus_codes(plus)
+
+    return run, len(s2) + len(plus)
+
+
+def stage_resolve(rows, size_dir, address):
+    from extract_coordinates import DEFAULT_WORKERS, HostRateLimiter, resolve_and_extract
+    from redirect_resolver import RedirectResolver
+
+    urls = [r['googleMapsUrl'] for r in rows if r['googleMapsUrl'].startswith(SHORT_URL_BASE)]
+    resolver = RedirectResolver(transport=stand_in_transport(address))
+    limiter = HostRateLimiter(rate=1e9, burst=1e9)
+
+    def run():
+        with ThreadPoolExecutor(max_workers=DEFAULT_WORKERS) as executor:
+            results = list(executor.map(lambda url: resolve_and_extract(url, limiter, resolver), urls))
+        failed = sum(1 for result, _, _ in results if result is None)
+        if failed:
+            raise RuntimeError(f'{failed} short URLs did not resolve to coordinates')
+
+    return run, len(urls)
+
+
+def cache_path(size_dir):
+    return os.path.join(size_dir, 'cache.sqlite3')
+
+
+def fill_cache(rows, path):
+    from coordinate_cache import CoordinateCache
+
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    cache = CoordinateCache(path, legacy_path=None)
+    for row in rows:
+        cache.put(row['googleMapsUrl'], row['lat'], row['lng'], '@coords')
+    cache.close()
+
+
+def stage_cache_save(rows, size_dir, address):
+    return lambda: fill_cache(rows, cache_path(size_dir)), len(rows)
+
+
+def stage_cache_load(rows, size_dir, address):
+    from coordinate_cache import CoordinateCache
+
+    path = cache_path(size_dir)
+    if not os.path.exists(path):
+        fill_cache(rows, path)
+
+    def run():
+        cache = CoordinateCache(path, legacy_path=None)
+        missing = sum(1 for row in rows if cache.get(row['googleMapsUrl']) is None)
+        cache.close()
+        if missing:
+            raise RuntimeError(f'{missing} rows missing from the cache')
+
+    return run, len(rows)
+
+
+def ts_path(size_dir):
+    return os.path.join(size_dir, 'masjids.ts')
+
+
+def write_ts(rows, path):
+    from generate_masjids_ts import render_entry
+    from pipeline_state import write_atomic
+
+    lines = ["import type { Masjid } from '@/types'", '', 'export const MASJIDS: Masjid[] = [']
+    for row in rows:
+        lines.extend(render_entry(row['id'], row['region'], row))
+    lines.extend([']', ''])
+    write_atomic(path, '\n'.join(lines))
+
+
+def stage_ts_generate(rows, size_dir, address):
+    return lambda: write_ts(rows, ts_path(size_dir)), len(rows)
+
+
+def stage_url_rewrite(rows, size_dir, address):
+    from pathlib import Path
+
+    from update_audio_urls import rewrite_file
+
+    path = Path(size_dir) / 'rewrite.ts'
+    write_ts(rows, str(path))
+    manifest = {
+        row['id']: {'sourceUrl': row['audioUrl'], 'filename': f"{row['id']}.m4a"}
+        for row in rows[::2]
+    }
+    return lambda: rewrite_file(path, manifest), len(rows)
+
+
+def stage_dedup(rows, size_dir, address):
+    from dedup_masjids import find_duplicates
+
+    return lambda: find_duplicates(rows), len(rows)
+
+
+STAGES = {
+    'xlsx_read': stage_xlsx_read,
+    'url_extract': stage_url_extract,
+    'decode': stage_decode,
+    'decode_batch': stage_decode_batch,
+    'resolve': stage_resolve,
+    'cache_save': stage_cache_save,
+    'cache_load': stage_cache_load,
+    'ts_generate': stage_ts_generate,
+    'url_rewrite': stage_url_rewrite,
+    'dedup': stage_dedup,
+}
+
+
+# ── Measurement ──
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def measure(stage, size_dir, address):
+    """Run one stage in this (fresh) process and return its measurements."""
+    with open(os.path.join(size_dir, 'rows.json'), 'r', encoding='utf-8') as f:
+        rows = json.load(f)
+    run, count = STAGES[stage](rows, size_dir, address)
+    start = time.perf_counter()
+    run()
+    wall = time.perf_counter() - start
+    return {
+        'wall_s': round(wall, 6),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'rows': count,
+        'throughput': round(count / wall, 1) if wall > 0 else None,
+    }
+
+
+def measure_in_subprocess(stage, size_dir, address):
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, stage, size_dir, address).result()
+
+
+def compare(results, baseline, thresholds, default_threshold):
+    """Return a list of regression messages (empty when within thresholds)."""
+    regressions = []
+    for stage, by_size in results.items():
+        threshold = thresholds.get(stage, default_threshold)
+        for size, current in by_size.items():
+            previous = baseline.get(stage, {}).get(size)
+            if not previous:
+                continue
+            metrics = ['peak_rss_mb']
+            if previous['wall_s'] >= MIN_COMPARABLE_SECONDS:
+                metrics.insert(0, 'wall_s')
+            for metric in metrics:
+                limit = previous[metric] * (1 + threshold)
+                if current[metric] > limit:
+                    regressions.append(
+                        f"{stage} @ {size} rows: {metric} {current[metric]:g} > {limit:g} "
+                        f"(baseline {previous[metric]:g}, threshold {threshold:.0%})"
+                    )
+    return regressions
+
+
+def parse_stage_thresholds(values):
+    thresholds = {}
+    for value in values:
+        stage, _, fraction = value.partition('=')
+        if stage not in STAGES or not fraction:
+            raise SystemExit(f"Invalid --stage-threshold {value!r}; expected STAGE=FRACTION")
+        thresholds[stage] = float(fraction)
+    return thresholds
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the data pipeline on synthetic datasets.')
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='comma-separated dataset sizes in rows (default: %(default)s)')
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help='comma-separated stages to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='runs per stage and size; the fastest is kept (default: 1)')
+    parser.add_argument('--output', default=RESULTS_PATH,
+                        help=f'results file (default: {os.path.relpath(RESULTS_PATH)})')
+    parser.add_argument('--baseline', default=BASELINE_PATH,
+                        help=f'baseline to compare against (default: {os.path.relpath(BASELINE_PATH)})')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'allowed growth as a fraction (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--stage-threshold', action='append', default=[], metavar='STAGE=F',
+                        help='allowed growth for one stage; may be repeated')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='store this run as the baseline')
+    args = parser.parse_args()
+    args.sizes = [int(s) for s in args.sizes.split(',')]
+    args.stages = args.stages.split(',')
+    unknown = [s for s in args.stages if s not in STAGES]
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+    args.stage_threshold = parse_stage_thresholds(args.stage_threshold)
+    return args
+
+
+def main():
+    args = parse_args()
+    server = start_stand_in_server()
+    results = {stage: {} for stage in args.stages}
+
+    with tempfile.TemporaryDirectory(prefix='bench_pipeline_') as data_dir:
+        for size in args.sizes:
+            print(f"Generating {size:,} rows...")
+            size_dir = write_inputs(size, data_dir)
+            for stage in args.stages:
+                runs = [measure_in_subprocess(stage, size_dir, server.server_address)
+                        for _ in range(args.repeat)]
+                best = min(runs, key=lambda r: r['wall_s'])
+                results[stage][str(size)] = best
+                print(f"  {stage:<13} {best['wall_s']:9.3f} s  {best['peak_rss_mb']:8.1f} MB  "
+                      f"{best['throughput'] or 0:>12,.0f} rows/s  ({best['rows']:,} rows)")
+    server.shutdown()
+
+    report = {
+        'meta': {
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.stage_threshold, args.threshold)
+        print(f"Compared against {args.baseline}: {len(regressions)} regression(s)")
+        for message in regressions:
+            print(f"  REGRESSION {message}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Micro-benchmark: legacy multi-regex URL extraction vs url_matcher.scan_url.
+
+The corpus is every googleMapsUrl in masjids_extracted.json plus the
+resolved URLs described by url_analysis.json (rebuilt from their q/ftid
+and plus_code fields). Both sides only locate coordinate sources; S2 and
+Plus Code decoding is identical and excluded, so the benchmark runs
+without s2sphere/openlocationcode installed.
+
+Usage:
+    python scripts/bench_url_matcher.py [--repeat N]
+"""
+
+import json
+import os
+import re
+import sys
+import time
+import urllib.parse
+
+from url_matcher import scan_url
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ANALYSIS_PATH = os.path.join(SCRIPT_DIR, 'url_analysis.json')
+EXTRACTED_PATH = os.path.join(SCRIPT_DIR, 'masjids_extracted.json')
+
+# Patterns and control flow of extract_from_url/extract_from_resolved
+# before the single-pass matcher
+AT_COORD_PATTERN = re.compile(r'@([-\d.]+),([-\d.]+)')
+DATA_3D_PATTERN = re.compile(r'!3d([-\d.]+)!4d([-\d.]+)')
+PLUS_CODE_PATTERN = re.compile(r'([2-9CFGHJMPQRVWX]{4,8})[+ ]([2-9CFGHJMPQRVWX]{2,3})\b')
+FTID_PATTERN = re.compile(r'(?:ftid=|!1s)(0x[0-9a-f]+:0x[0-9a-f]+)')
+
+
+def legacy_sources(url):
+    """Return the first source the legacy code would try, as (method, value)."""
+    for candidate_url in (url, urllib.parse.unquote(urllib.parse.unquote(url))):
+        match = AT_COORD_PATTERN.search(candidate_url)
+        if match:
+            return '@coords', (float(match.group(1)), float(match.group(2)))
+        match = DATA_3D_PATTERN.search(candidate_url)
+        if match:
+            return '!3d!4d', (float(match.group(1)), float(match.group(2)))
+        match = FTID_PATTERN.search(candidate_url)
+        if match:
+            return 's2cell', match.group(1).split(':')[0]
+
+    decoded = urllib.parse.unquote(urllib.parse.unquote(url))
+    params = urllib.parse.parse_qs(urllib.parse.urlparse(decoded).query)
+    q = urllib.parse.unquote(params.get('q', [''])[0])
+    plus_match = PLUS_CODE_PATTERN.search(q)
+    if plus_match:
+        return 'plus_code', plus_match.group(1) + '+' + plus_match.group(2)
+    ftid = params.get('ftid', [''])[0]
+    if ftid:
+        return 's2cell', ftid.split(':')[0]
+    return None
+
+
+def single_pass_sources(url):
+    candidates = scan_url(url)
+    return (candidates[0].method, candidates[0].value) if candidates else None
+
+
+def build_corpus():
+    urls = []
+    with open(EXTRACTED_PATH, 'r', encoding='utf-8') as f:
+        urls.extend(e['googleMapsUrl'] for e in json.load(f))
+    with open(ANALYSIS_PATH, 'r', encoding='utf-8') as f:
+        for item in json.load(f):
+            params = {}
+            if item.get('plus_code'):
+                params['q'] = item['plus_code'] + ' الرياض'
+            elif item.get('q'):
+                params['q'] = item['q']
+            if item.get('ftid'):
+                params['ftid'] = item['ftid']
+            if item.get('lat') is not None:
+                urls.append(f"https://www.google.com/maps/place/@{item['lat']},{item['lng']},17z")
+            elif params:
+                urls.append('https://www.google.com/maps?' + urllib.parse.urlencode(params))
+    return urls
+
+
+def bench(fn, urls, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for url in urls:
+            fn(url)
+    return len(urls) * repeat / (time.perf_counter() - start)
+
+
+def main():
+    repeat = int(sys.argv[sys.argv.index('--repeat') + 1]) if '--repeat' in sys.argv else 200
+    urls = build_corpus()
+    print(f"Corpus: {len(urls)} URLs x {repeat} repeats")
+
+    mismatches = [u for u in urls if legacy_sources(u) != single_pass_sources(u)]
+    print(f"Best-source mismatches: {len(mismatches)}")
+    for url in mismatches[:5]:
+        print(f"  {url}\n    legacy: {legacy_sources(url)}\n    single: {single_pass_sources(url)}")
+
+    before = bench(legacy_sources, urls, repeat)
+    after = bench(single_pass_sources, urls, repeat)
+    print(f"  legacy (multi-regex):  {before:12,.0f} URLs/s")
+    print(f"  single-pass matcher:   {after:12,.0f} URLs/s")
+    print(f"  speedup:               {after / before:12.2f}x")
+
+
+if __name__ == '__main__':
+    main()
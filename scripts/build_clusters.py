@@ -0,0 +1,100 @@
+"""
+Precompute marker clusters for every clustered map zoom level.
+
+Supercluster-style: points are projected to Web Mercator, then merged
+greedily level by level, from the highest clustered zoom down, within
+RADIUS screen pixels (on EXTENT-pixel tiles) at that zoom. Each level
+clusters the previous level's output, so clusters nest hierarchically.
+A cluster's expansionZoom is the first higher zoom at which its members
+are no longer one cluster, so clicking it zooms straight to where it
+breaks apart.
+Regions are clustered separately, so a cluster has a single region color
+and the region filter still works on precomputed data.
+
+vector_tiles.py puts level z into the tiles of zoom z, so the map does no
+clustering work at runtime.
+"""
+
+import math
+
+MIN_ZOOM = 9  # MAP_CONFIG.MIN_ZOOM
+MAX_CLUSTER_ZOOM = 15
+RADIUS = 60
+EXTENT = 512
+
+
+def project(lat, lng):
+    """Web Mercator position in [0, 1] x [0, 1]."""
+    sin = math.sin(math.radians(lat))
+    y = 0.5 - 0.25 * math.log((1 + sin) / (1 - sin)) / math.pi
+    return lng / 360 + 0.5, min(1.0, max(0.0, y))
+
+
+def cluster_level(items, zoom, radius=RADIUS):
+    """Merge `items` (dicts with x, y, count, ...) that lie within `radius` px at `zoom`."""
+    r = radius / (EXTENT * 2 ** zoom)
+    grid = {}
+    for i, item in enumerate(items):
+        grid.setdefault((int(item['x'] / r), int(item['y'] / r)), []).append(i)
+
+    visited = [False] * len(items)
+    merged = []
+    for i, item in enumerate(items):
+        if visited[i]:
+            continue
+        visited[i] = True
+        cx, cy = int(item['x'] / r), int(item['y'] / r)
+        neighbours = [
+            j
+            for gx in (cx - 1, cx, cx + 1)
+            for gy in (cy - 1, cy, cy + 1)
+            for j in grid.get((gx, gy), ())
+            if not visited[j] and (items[j]['x'] - item['x']) ** 2 + (items[j]['y'] - item['y']) ** 2 <= r * r
+        ]
+        if not neighbours:
+            merged.append(item)
+            continue
+        members = [item] + [items[j] for j in neighbours]
+        for j in neighbours:
+            visited[j] = True
+        count = sum(m['count'] for m in members)
+        merged.append({
+            'x': sum(m['x'] * m['count'] for m in members) / count,
+            'y': sum(m['y'] * m['count'] for m in members) / count,
+            'count': count,
+            'ids': [record_id for m in members for record_id in m.get('ids', [m.get('id')])],
+        })
+    return merged
+
+
+def set_expansion_zooms(clusters, zoom, above):
+    """Give each cluster at `zoom` the zoom its members split at.
+
+    `above` maps the member ids of each cluster one zoom higher to that
+    cluster; a cluster found there unchanged splits where it does.
+    """
+    for cluster in clusters:
+        same = above.get(frozenset(cluster['ids']))
+        cluster['expansionZoom'] = same['expansionZoom'] if same else zoom + 1
+
+
+def build_levels(records, radius=RADIUS, min_zoom=MIN_ZOOM, max_zoom=MAX_CLUSTER_ZOOM):
+    """Return {zoom: [item]} for min_zoom..max_zoom; items carry x, y, count, region and id or expansionZoom."""
+    levels = {z: [] for z in range(min_zoom, max_zoom + 1)}
+    for region in dict.fromkeys(r['region'] for r in records):
+        items = []
+        for r in records:
+            if r['region'] == region:
+                x, y = project(r['lat'], r['lng'])
+                items.append({'x': x, 'y': y, 'count': 1, 'id': r['id']})
+        above = {}
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            items = cluster_level(items, zoom, radius)
+            clusters = [item for item in items if item['count'] > 1]
+            set_expansion_zooms(clusters, zoom, above)
+            above = {frozenset(cluster['ids']): cluster for cluster in clusters}
+            levels[zoom].extend(
+                {key: value for key, value in item.items() if key != 'ids'} | {'region': region}
+                for item in items
+            )
+    return levels
@@ -0,0 +1,148 @@
+"""
+City profiles: everything the data scripts know about one city's list.
+
+A profile names the spreadsheet and sheet to read, the city centre (the
+reference for short Plus Codes) and the bounds extracted coordinates must
+fall in, and the city's regions: how the spreadsheet labels them, their
+key in the data, and the prefix of their masjid ids. Region polygons
+(region_boundaries.geojson in the data directory, see
+region_boundaries.py), where a city has them, decide which region a
+located masjid is in; the spreadsheet label then only cross-checks. It
+also places the city's outputs, so every city gets its own extracted
+rows, coordinate cache, dataset, pipeline state, generated modules,
+tiles and audio downloads, and cities can be processed in parallel (see
+pipeline.py --city).
+
+Riyadh keeps the original locations (scripts/, src/data/, public/data/).
+Other cities live under cities/<key>/ in each of those directories; add
+one with a City(...) using **city_dirs('<key>') and list it in CITIES.
+Audio files are named by masjid id, so id prefixes must be unique across
+cities. The region keys of a new city also need labels and colors in
+src/constants/map.ts before its modules type-check.
+"""
+
+import os
+from typing import NamedTuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.join(SCRIPT_DIR, '..')
+
+
+class Region(NamedTuple):
+    key: str  # region in the data and generated modules
+    sheet_label: str  # value of the spreadsheet's region column
+    prefix: str  # masjid id prefix ('n' -> 'n-001')
+    label: str  # heading in generated modules and reports
+
+
+class City(NamedTuple):
+    key: str
+    name: str
+    xlsx_path: str
+    sheet: str
+    center: tuple  # (lat, lng)
+    bounds: tuple  # (lat_min, lat_max, lng_min, lng_max)
+    regions: tuple  # Region, in output order
+    data_dir: str  # extracted rows, dataset and pipeline state
+    src_dir: str  # generated TypeScript modules
+    public_dir: str  # map tiles archive
+    public_url: str  # public_dir as served by the site
+    audio_dir: str  # downloaded audio and its manifest
+
+    def is_valid_coord(self, lat, lng):
+        lat_min, lat_max, lng_min, lng_max = self.bounds
+        return lat_min <= lat <= lat_max and lng_min <= lng <= lng_max
+
+    @property
+    def region_map(self):
+        return {region.sheet_label: region.key for region in self.regions}
+
+    @property
+    def region_order(self):
+        return [region.key for region in self.regions]
+
+    @property
+    def region_prefix(self):
+        return {region.key: region.prefix for region in self.regions}
+
+    @property
+    def region_labels(self):
+        return {region.key: region.label for region in self.regions}
+
+    @property
+    def extracted_path(self):
+        return os.path.join(self.data_dir, 'masjids_extracted.json')
+
+    @property
+    def coordinate_cache_path(self):
+        return os.path.join(self.data_dir, 'coordinates_cache.sqlite3')
+
+    @property
+    def dataset_path(self):
+        return os.path.join(self.data_dir, 'masjids.json')
+
+    @property
+    def boundaries_path(self):
+        return os.path.join(self.data_dir, 'region_boundaries.geojson')
+
+    @property
+    def region_index_path(self):
+        return os.path.join(self.data_dir, 'region_index.npz')
+
+    @property
+    def state_path(self):
+        return os.path.join(self.data_dir, 'pipeline_state.json')
+
+    @property
+    def ts_path(self):
+        return os.path.join(self.src_dir, 'masjids.ts')
+
+    @property
+    def tiles_path(self):
+        return os.path.join(self.public_dir, 'masjids.pmtiles')
+
+    @property
+    def tiles_url(self):
+        return f'{self.public_url}/masjids.pmtiles'
+
+    @property
+    def audio_manifest_path(self):
+        return os.path.join(self.audio_dir, 'manifest.json')
+
+
+def city_dirs(key):
+    """Output directories for a city other than Riyadh."""
+    return {
+        'data_dir': os.path.join(SCRIPT_DIR, 'cities', key),
+        'src_dir': os.path.join(PROJECT_ROOT, 'src', 'data', 'cities', key),
+        'public_dir': os.path.join(PROJECT_ROOT, 'public', 'data', 'cities', key),
+        'public_url': f'/data/cities/{key}',
+        'audio_dir': os.path.join(PROJECT_ROOT, 'downloads', 'cities', key, 'youtube-audio'),
+    }
+
+
+RIYADH = City(
+    key='riyadh',
+    name='Riyadh',
+    xlsx_path=os.path.join(PROJECT_ROOT, 'riyadh_list.xlsx'),
+    sheet='جميع القراء',
+    center=(24.7136, 46.6753),
+    bounds=(24.3, 25.2, 46.2, 47.2),
+    regions=(
+        Region('north', 'الشمال', 'n', 'North Region (الشمال)'),
+        Region('east', 'الشرق', 'e', 'East Region (الشرق)'),
+        Region('westSouth', 'الغرب والجنوب', 'ws', 'West & South Region (الغرب والجنوب)'),
+    ),
+    data_dir=SCRIPT_DIR,
+    src_dir=os.path.join(PROJECT_ROOT, 'src', 'data'),
+    public_dir=os.path.join(PROJECT_ROOT, 'public', 'data'),
+    public_url='/data',
+    audio_dir=os.path.join(PROJECT_ROOT, 'downloads', 'youtube-audio'),
+)
+
+CITIES = {city.key: city for city in (RIYADH,)}
+
+
+def add_city_argument(parser):
+    parser.add_argument('--city', choices=sorted(CITIES), default=RIYADH.key,
+                        help=f'city profile to process (default: {RIYADH.key})')
@@ -0,0 +1,175 @@
+"""
+SQLite-backed coordinate cache for extract_coordinates.py.
+
+Every write is its own transaction, so an interrupted run never leaves a
+truncated cache, and lookups read a single row instead of loading the
+whole file. Each entry records the extraction method, when it was stored
+and an optional expiry (TTL).
+
+It also keeps the outcome of every short URL resolution (redirect chain,
+final URL or failure reason). Successes are trusted until they are older
+than `revalidate_after`; failures are negatively cached with exponential
+backoff (honouring a server's Retry-After), so repeat runs over a mostly
+known list make next to no network calls.
+
+Each city has its own database in its data directory (see
+city_profiles.py); the default path is Riyadh's. A legacy
+coordinates_cache.json ({url: {lat, lng, method}}) found next to the
+database is imported on first open and renamed to *.migrated.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DB_PATH = os.path.join(SCRIPT_DIR, 'coordinates_cache.sqlite3')
+LEGACY_CACHE_PATH = os.path.join(SCRIPT_DIR, 'coordinates_cache.json')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS coordinates (
+    url TEXT PRIMARY KEY,
+    lat REAL NOT NULL,
+    lng REAL NOT NULL,
+    method TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL
+);
+CREATE TABLE IF NOT EXISTS resolutions (
+    url TEXT PRIMARY KEY,
+    chain TEXT NOT NULL,
+    final_url TEXT,
+    failure TEXT,
+    failures INTEGER NOT NULL,
+    resolved_at REAL NOT NULL,
+    retry_at REAL
+)
+'''
+
+DEFAULT_REVALIDATE_AFTER = 30 * 86400
+DEFAULT_NEGATIVE_TTL = 3600
+MAX_NEGATIVE_TTL = 7 * 86400
+
+
+class CoordinateCache:
+    """URL -> coordinates cache with per-entry method and TTL metadata."""
+
+    def __init__(self, path=CACHE_DB_PATH, legacy_path=LEGACY_CACHE_PATH, ttl=None,
+                 revalidate_after=DEFAULT_REVALIDATE_AFTER, negative_ttl=DEFAULT_NEGATIVE_TTL,
+                 max_negative_ttl=MAX_NEGATIVE_TTL):
+        self.ttl = ttl
+        self.revalidate_after = revalidate_after
+        self.negative_ttl = negative_ttl
+        self.max_negative_ttl = max_negative_ttl
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(SCHEMA)
+        if legacy_path and os.path.exists(legacy_path):
+            self.migrate_json(legacy_path)
+
+    def migrate_json(self, legacy_path):
+        """Import a legacy JSON cache, then rename it so it isn't imported twice."""
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            legacy = json.load(f)
+        now = time.time()
+        with self.db:
+            self.db.execute('BEGIN')
+            self.db.executemany(
+                'INSERT OR IGNORE INTO coordinates VALUES (?, ?, ?, ?, ?, NULL)',
+                [(url, item['lat'], item['lng'], item.get('method', 'cached'), now)
+                 for url, item in legacy.items()],
+            )
+        os.replace(legacy_path, f'{legacy_path}.migrated')
+        print(f"  Migrated {len(legacy)} entries from {legacy_path}")
+
+    def get(self, url):
+        """Return {'lat', 'lng', 'method'} for `url`, or None if missing or expired."""
+        row = self.db.execute(
+            'SELECT lat, lng, method, expires_at FROM coordinates WHERE url = ?', (url,)
+        ).fetchone()
+        if row is None or (row[3] is not None and row[3] < time.time()):
+            return None
+        return {'lat': row[0], 'lng': row[1], 'method': row[2]}
+
+    def put(self, url, lat, lng, method, ttl=None):
+        ttl = ttl if ttl is not None else self.ttl
+        now = time.time()
+        self.db.execute(
+            'INSERT OR REPLACE INTO coordinates VALUES (?, ?, ?, ?, ?, ?)',
+            (url, lat, lng, method, now, now + ttl if ttl else None),
+        )
+
+    def get_resolution(self, url):
+        """Return the stored resolution of `url` if it can be used without the network.
+
+        A dict with 'chain', 'final_url', 'failure', 'failures' and
+        'retry_at'; exactly one of final_url/failure is set. Returns None
+        when there is no entry, a success is older than revalidate_after,
+        or a failure's backoff has expired.
+        """
+        row = self.db.execute(
+            'SELECT chain, final_url, failure, failures, resolved_at, retry_at '
+            'FROM resolutions WHERE url = ?', (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        chain, final_url, failure, failures, resolved_at, retry_at = row
+        now = time.time()
+        if failure is None and now - resolved_at > self.revalidate_after:
+            return None
+        if failure is not None and now >= retry_at:
+            return None
+        return {'chain': json.loads(chain), 'final_url': final_url, 'failure': failure,
+                'failures': failures, 'retry_at': retry_at}
+
+    def needs_revalidation(self, url):
+        """True when `url` resolved successfully longer than revalidate_after ago.
+
+        Its cached coordinates came from that resolution, so they are due
+        for a fresh one too.
+        """
+        row = self.db.execute(
+            'SELECT resolved_at FROM resolutions WHERE url = ? AND failure IS NULL', (url,)
+        ).fetchone()
+        return row is not None and time.time() - row[0] > self.revalidate_after
+
+    def put_resolution(self, url, chain, final_url=None, failure=None, retry_after=None):
+        """Record a resolution; a failure backs off exponentially per consecutive failure.
+
+        `retry_after` (seconds, e.g. from a Retry-After header) extends the
+        backoff when it is longer.
+        """
+        now = time.time()
+        retry_at = None
+        failures = 0
+        if failure is not None:
+            row = self.db.execute('SELECT failures FROM resolutions WHERE url = ?', (url,)).fetchone()
+            failures = (row[0] if row else 0) + 1
+            backoff = min(self.max_negative_ttl, self.negative_ttl * 2 ** (failures - 1))
+            retry_at = now + max(backoff, retry_after or 0)
+        self.db.execute(
+            'INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (url, json.dumps(chain, ensure_ascii=False), final_url, failure, failures, now, retry_at),
+        )
+
+    def due_count(self, urls):
+        """How many of `urls` have a resolution get_resolution() would no longer serve.
+
+        Failures whose backoff has run out and successes older than
+        revalidate_after; the pipeline reruns extraction when there are any.
+        """
+        now = time.time()
+        rows = self.db.execute(
+            'SELECT url FROM resolutions '
+            'WHERE (failure IS NOT NULL AND retry_at <= ?) OR (failure IS NULL AND resolved_at < ?)',
+            (now, now - self.revalidate_after),
+        )
+        return sum(1 for (url,) in rows if url in urls)
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM coordinates').fetchone()[0]
+
+    def close(self):
+        self.db.close()
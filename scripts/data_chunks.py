@@ -0,0 +1,94 @@
+"""
+Region-split data chunks for lazy loading.
+
+Writes one module per region (src/data/regions/{region}.ts, each exporting
+that region's MASJIDS) and a small manifest (src/data/masjid-manifest.ts)
+mapping every masjid id to its region and every region to a dynamic
+import. Pages that need one masjid or one region load just that chunk
+instead of the whole dataset.
+
+Used by generate_masjids_ts.py, which passes in the already rendered
+record blocks and the directory of the city's modules (src/data for
+Riyadh, see city_profiles.py).
+"""
+
+import gzip
+import os
+
+from pipeline_state import write_if_changed
+
+
+def render_region_module(label, blocks):
+    lines = []
+    lines.append('/**')
+    lines.append(f' * Masjid Data: {label}')
+    lines.append(' *')
+    lines.append(' * Auto-generated by scripts/generate_masjids_ts.py. Loaded on demand')
+    lines.append(' * through REGION_CHUNKS in src/data/masjid-manifest.ts.')
+    lines.append(' */')
+    lines.append('')
+    lines.append("import type { Masjid } from '@/types'")
+    lines.append('')
+    lines.append('export const MASJIDS: Masjid[] = [')
+    for block in blocks:
+        lines.extend(block)
+    lines.append(']')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def render_manifest_module(by_region):
+    lines = []
+    lines.append('/**')
+    lines.append(' * Masjid Chunk Manifest')
+    lines.append(' *')
+    lines.append(' * Auto-generated by scripts/generate_masjids_ts.py. Maps each masjid id')
+    lines.append(' * to its region and each region to the chunk holding its records.')
+    lines.append(' */')
+    lines.append('')
+    lines.append("import type { Masjid, Region } from '@/types'")
+    lines.append('')
+    lines.append('export const MASJID_REGIONS: Record<string, Region> = {')
+    for region, records in by_region.items():
+        for record in records:
+            lines.append(f"  '{record['id']}': '{region}',")
+    lines.append('}')
+    lines.append('')
+    lines.append('export const REGION_CHUNKS: Record<Region, () => Promise<{ MASJIDS: Masjid[] }>> = {')
+    for region in by_region:
+        lines.append(f"  {region}: () => import('./regions/{region}'),")
+    lines.append('}')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def write_chunks(data_dir, by_region, labels, blocks_by_id):
+    """Write the region chunks and manifest; return [(path, bytes, gzip bytes, written)]."""
+    chunk_dir = os.path.join(data_dir, 'regions')
+    os.makedirs(chunk_dir, exist_ok=True)
+    outputs = [
+        (os.path.join(chunk_dir, f'{region}.ts'),
+         render_region_module(labels[region], [blocks_by_id[r['id']] for r in records]))
+        for region, records in by_region.items()
+    ]
+    outputs.append((os.path.join(data_dir, 'masjid-manifest.ts'), render_manifest_module(by_region)))
+
+    report = []
+    for path, content in outputs:
+        data = content.encode('utf-8')
+        written = write_if_changed(path, content)
+        report.append((path, len(data), len(gzip.compress(data, mtime=0)), written))
+    return report
+
+
+def print_size_report(data_dir, report, full_path=None):
+    """Print raw and gzipped size per chunk, against the monolithic file if given."""
+    print('  Chunk sizes (raw / gzip):')
+    for path, raw, gz, written in report:
+        marker = ' (written)' if written else ''
+        print(f"    {os.path.relpath(path, data_dir):<24} {raw / 1024:7.1f} KB / {gz / 1024:6.1f} KB{marker}")
+    if full_path and os.path.exists(full_path):
+        with open(full_path, 'rb') as f:
+            data = f.read()
+        print(f"    {os.path.basename(full_path):<24} {len(data) / 1024:7.1f} KB / "
+              f"{len(gzip.compress(data, mtime=0)) / 1024:6.1f} KB (all regions)")
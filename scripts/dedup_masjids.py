@@ -0,0 +1,281 @@
+"""
+Find records that refer to the same masjid.
+
+The same mosque can be listed twice, once per reader, or two rows can
+point at coordinates a few metres apart. Comparing every pair is O(n²),
+so records are bucketed in a spatial hash instead: a grid of
+--radius-metre cells over an equirectangular projection. A record is
+only compared with the records in its own cell and the 8 around it,
+which is close to linear for any realistic density.
+
+Inside the neighbourhood, two records are duplicates when they are
+within --radius metres with masjid names whose similarity is at least
+--threshold, or within --near metres with names at least
+--near-threshold similar (the same building, spelled differently).
+Records within --near metres whose names are less similar than that are
+a conflict, not a duplicate: usually one row carries the other's map
+link. Conflicts are reported for a human to fix and never merged.
+Names are compared after normalizing the Arabic spelling (diacritics,
+tatweel, alef/yaa/taa marbuta variants, the generic words مسجد and
+جامع), by the Dice coefficient of their character bigrams. Duplicate
+pairs are joined into groups.
+
+Writes a merge report (dedup_report.json in the city's data directory):
+every group with its records, distances and name similarities, and the
+conflicting pairs. --merged also writes masjids_merged.json, one record
+per group: the first record of the group, with the readers and ids of
+the others attached. Neither file changes the dataset; the pipeline runs
+this as its `dedup` stage.
+
+Usage:
+    python scripts/dedup_masjids.py [--city KEY] [--radius M] [--near M] [--threshold S]
+                                    [--near-threshold S] [--merged]
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+
+from city_profiles import CITIES, RIYADH, add_city_argument
+from masjid_dataset import load_dataset
+from pipeline_state import write_if_changed
+from spatial_index import haversine_m
+
+DEFAULT_RADIUS = 150
+DEFAULT_NEAR = 15
+DEFAULT_THRESHOLD = 0.75
+DEFAULT_NEAR_THRESHOLD = 0.4
+METRES_PER_DEGREE = 111320
+
+# Harakat, superscript alef and tatweel
+DIACRITICS = re.compile('[\u064b-\u065f\u0670\u0640]')
+LETTER_VARIANTS = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي', 'ئ': 'ي', 'ؤ': 'و', 'ة': 'ه',
+})
+GENERIC_WORDS = {'مسجد', 'جامع', 'المسجد', 'الجامع'}
+NON_WORD = re.compile(r'[^\w]+')
+
+
+def normalize_name(name):
+    """Masjid name reduced to the words that tell masjids apart."""
+    name = DIACRITICS.sub('', name).translate(LETTER_VARIANTS)
+    return ' '.join(word for word in NON_WORD.sub(' ', name).split() if word not in GENERIC_WORDS)
+
+
+def bigrams(text):
+    padded = f' {text} '
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+def dice(a, b):
+    """Dice coefficient of two bigram sets (1.0 for identical names)."""
+    if not a and not b:
+        return 1.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def grid_cells(records, cell_m):
+    """{(row, col): [record index]} on a grid of cell_m metre cells."""
+    mean_lat = sum(r['lat'] for r in records) / len(records)
+    metres_per_lng = METRES_PER_DEGREE * math.cos(math.radians(mean_lat))
+    cells = {}
+    for i, r in enumerate(records):
+        key = (math.floor(r['lat'] * METRES_PER_DEGREE / cell_m), math.floor(r['lng'] * metres_per_lng / cell_m))
+        cells.setdefault(key, []).append(i)
+    return cells
+
+
+# Each cell is compared with itself and these neighbours; the other four
+# neighbours compare with it from their side, so no pair is seen twice
+FORWARD_NEIGHBOURS = ((0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def candidate_pairs(records, cell_m):
+    """Yield every (i, j), i < j, of records in the same or adjacent grid cells."""
+    cells = grid_cells(records, cell_m)
+    for (row, col), members in cells.items():
+        for a, i in enumerate(members):
+            for j in members[a + 1:]:
+                yield min(i, j), max(i, j)
+        for d_row, d_col in FORWARD_NEIGHBOURS:
+            for i in members:
+                for j in cells.get((row + d_row, col + d_col), ()):
+                    yield min(i, j), max(i, j)
+
+
+def find_duplicates(records, radius=DEFAULT_RADIUS, near=DEFAULT_NEAR, threshold=DEFAULT_THRESHOLD,
+                    near_threshold=DEFAULT_NEAR_THRESHOLD):
+    """Return the duplicate and conflicting pairs among `records`.
+
+    Each pair is a dict (i, j, distance_m, similarity, reason), reason
+    being 'same_location' or 'similar_name' for duplicates and 'conflict'
+    for differently named records at the same location. Records without
+    coordinates are ignored.
+    """
+    located = [i for i, r in enumerate(records) if r.get('lat') is not None]
+    if not located:
+        return []
+    points = [records[i] for i in located]
+    names = [bigrams(normalize_name(r['masjidName'])) for r in points]
+
+    pairs = []
+    # Cells a little wider than the radius, so the projection's small
+    # distortion never puts two records within range two cells apart
+    for a, b in candidate_pairs(points, radius * 1.1):
+        p, q = points[a], points[b]
+        distance = haversine_m(p['lat'], p['lng'], q['lat'], q['lng'])
+        if distance > radius:
+            continue
+        similarity = dice(names[a], names[b])
+        if similarity >= threshold:
+            reason = 'similar_name'
+        elif distance <= near:
+            reason = 'same_location' if similarity >= near_threshold else 'conflict'
+        else:
+            continue
+        pairs.append({
+            'i': located[a], 'j': located[b],
+            'distance_m': round(distance, 1), 'similarity': round(similarity, 3), 'reason': reason,
+        })
+    return pairs
+
+
+def group_pairs(count, pairs):
+    """Join duplicate pairs into groups of record indices (union-find), in record order."""
+    parent = list(range(count))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for pair in pairs:
+        a, b = root(pair['i']), root(pair['j'])
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+    groups = {}
+    for pair in pairs:
+        groups.setdefault(root(pair['i']), set()).update((pair['i'], pair['j']))
+    return [sorted(members) for _, members in sorted(groups.items())]
+
+
+def pair_summary(records, pair):
+    return {
+        'ids': [records[pair['i']]['id'], records[pair['j']]['id']],
+        'distance_m': pair['distance_m'],
+        'similarity': pair['similarity'],
+        'reason': pair['reason'],
+    }
+
+
+def build_report(records, pairs):
+    """Duplicate groups; conflict pairs are left out (see conflict_report)."""
+    pairs = [pair for pair in pairs if pair['reason'] != 'conflict']
+    groups = group_pairs(len(records), pairs)
+    report = []
+    for members in groups:
+        member_set = set(members)
+        report.append({
+            'ids': [records[i]['id'] for i in members],
+            'records': [
+                {key: records[i][key] for key in ('id', 'masjidName', 'readerName', 'lat', 'lng')}
+                for i in members
+            ],
+            'pairs': [pair_summary(records, pair) for pair in pairs if pair['i'] in member_set],
+        })
+    return report
+
+
+def conflict_report(records, pairs):
+    """Differently named records at the same location, with both names."""
+    return [
+        {**pair_summary(records, pair), 'names': [records[pair['i']]['masjidName'], records[pair['j']]['masjidName']]}
+        for pair in pairs if pair['reason'] == 'conflict'
+    ]
+
+
+def merge_groups(records, report):
+    """One record per masjid: each group collapses into its first record."""
+    merged_away = {record_id for group in report for record_id in group['ids'][1:]}
+    groups = {group['ids'][0]: group for group in report}
+
+    merged = []
+    for record in records:
+        if record['id'] in merged_away:
+            continue
+        group = groups.get(record['id'])
+        if group:
+            record = dict(record)
+            others = group['records'][1:]
+            record['mergedIds'] = [other['id'] for other in others]
+            record['readerNames'] = list(dict.fromkeys(
+                [record['readerName']] + [other['readerName'] for other in others]
+            ))
+        merged.append(record)
+    return merged
+
+
+def dedup(records, city=RIYADH, radius=DEFAULT_RADIUS, near=DEFAULT_NEAR,
+          threshold=DEFAULT_THRESHOLD, near_threshold=DEFAULT_NEAR_THRESHOLD, merged=False):
+    """Write the city's merge report (and merged records); return the report."""
+    pairs = find_duplicates(records, radius, near, threshold, near_threshold)
+    report = build_report(records, pairs)
+    conflicts = conflict_report(records, pairs)
+    report_path = os.path.join(city.data_dir, 'dedup_report.json')
+    write_if_changed(report_path, json.dumps({
+        'radius_m': radius, 'near_m': near, 'threshold': threshold, 'near_threshold': near_threshold,
+        'groups': report, 'conflicts': conflicts,
+    }, ensure_ascii=False, indent=2) + '\n')
+
+    duplicates = sum(len(group['ids']) - 1 for group in report)
+    print(f"Duplicates: {len(report)} groups, {duplicates} records to merge "
+          f"({len(pairs) - len(conflicts)} pairs)")
+    for group in report:
+        reasons = sorted({pair['reason'] for pair in group['pairs']})
+        names = ' / '.join(r['masjidName'] for r in group['records'])
+        print(f"  {', '.join(group['ids'])} [{', '.join(reasons)}]: {names}")
+    print(f"Conflicts (same location, different names; not merged): {len(conflicts)}")
+    for conflict in conflicts:
+        print(f"  {', '.join(conflict['ids'])} ({conflict['distance_m']} m): {' / '.join(conflict['names'])}")
+    print(f"Merge report: {report_path}")
+
+    if merged:
+        merged_path = os.path.join(city.data_dir, 'masjids_merged.json')
+        merged_records = merge_groups(records, report)
+        write_if_changed(merged_path, json.dumps(merged_records, ensure_ascii=False, indent=2) + '\n')
+        print(f"Merged records ({len(merged_records)}): {merged_path}")
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Find duplicate masjid records.')
+    parser.add_argument('--radius', type=float, default=DEFAULT_RADIUS,
+                        help=f'max distance in metres for similarly named records (default: {DEFAULT_RADIUS})')
+    parser.add_argument('--near', type=float, default=DEFAULT_NEAR,
+                        help=f'max distance in metres for the same location (default: {DEFAULT_NEAR})')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'min name similarity, 0-1 (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--near-threshold', type=float, default=DEFAULT_NEAR_THRESHOLD,
+                        help='min name similarity for records at the same location; less similar '
+                             f'ones are reported as conflicts (default: {DEFAULT_NEAR_THRESHOLD})')
+    parser.add_argument('--merged', action='store_true',
+                        help='also write masjids_merged.json with one record per group')
+    add_city_argument(parser)
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    if args.near > args.radius:
+        raise SystemExit('--near must not exceed --radius')
+    city = CITIES[args.city]
+    dedup(load_dataset(city.dataset_path), city, args.radius, args.near, args.threshold,
+          args.near_threshold, args.merged)
+
+
+if __name__ == '__main__':
+    main()
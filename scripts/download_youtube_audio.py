@@ -2,72 +2,91 @@
 """
 Download YouTube audio files for all masjids with YouTube audioUrls.
 
-Parses masjids.ts, extracts YouTube URLs, downloads audio as mp3,
-and generates a manifest.json for mapping IDs to files.
+Reads the canonical dataset (scripts/masjids.json), downloads audio for
+every entry whose spreadsheet audio link is on YouTube, and generates a
+manifest.json for mapping IDs to files.
+
+Downloads run in parallel (--jobs) with a cap per source host
+(--per-host), are retried with exponential backoff, and resume partial
+files. Each finished download is added to manifest.json straight away, so
+an interrupted run keeps everything completed so far.
+
+--downloader swaps yt-dlp for any command that accepts the same
+arguments (--version, --format, --output TEMPLATE, ..., URL), e.g. a
+stand-in script for offline tests.
+
+Time spent in yt-dlp, waiting for a host slot and backing off can be
+traced or profiled with the telemetry.py options (--trace, --timings,
+--profile).
+
+--city downloads another city's audio into its own directory (see
+city_profiles.py; default Riyadh, into downloads/youtube-audio/).
 
 Usage:
-    python scripts/download_youtube_audio.py
+    python scripts/download_youtube_audio.py [--city KEY] [--jobs N] [--per-host N] [--retries N] [--downloader CMD]
+        [--trace PATH] [--timings]
 """
 
+import argparse
 import json
 import os
-import re
 import subprocess
 import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import telemetry
+from city_profiles import CITIES, add_city_argument
+from masjid_dataset import load_dataset
+
 # Paths
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SCRIPTS_DIR = Path(__file__).resolve().parent
-MASJIDS_TS = PROJECT_ROOT / "src" / "data" / "masjids.ts"
 OUTPUT_DIR = PROJECT_ROOT / "downloads" / "youtube-audio"
 
 # Resolve yt-dlp binary: prefer venv, fallback to system
 VENV_YT_DLP = SCRIPTS_DIR / ".venv" / "bin" / "yt-dlp"
 YT_DLP_BIN = str(VENV_YT_DLP) if VENV_YT_DLP.exists() else "yt-dlp"
 
-
-def parse_masjids_ts(filepath: Path) -> list[dict]:
-    """Parse masjids.ts and extract entries with YouTube audioUrls."""
-    content = filepath.read_text(encoding="utf-8")
-
-    # Match each masjid object block
-    pattern = re.compile(
-        r"\{\s*"
-        r"id:\s*'([^']+)'\s*,\s*"
-        r"readerName:\s*'([^']+)'\s*,\s*"
-        r"masjidName:\s*'([^']+)'\s*,\s*"
-        r"region:\s*'([^']+)'\s*,\s*"
-        r"coordinates:\s*\{[^}]+\}\s*,\s*"
-        r"googleMapsUrl:\s*'[^']*'\s*,\s*"
-        r"audioUrl:\s*'([^']+)'\s*,?"
-        r"[^}]*\}",
-        re.DOTALL,
-    )
-
-    entries = []
-    for match in pattern.finditer(content):
-        masjid_id, reader, masjid, region, audio_url = match.groups()
-        if "youtu" in audio_url:
-            entries.append(
-                {
-                    "id": masjid_id,
-                    "readerName": reader,
-                    "masjidName": masjid,
-                    "region": region,
-                    "audioUrl": audio_url,
-                }
-            )
-
-    return entries
-
-
-def check_yt_dlp():
-    """Check if yt-dlp is installed."""
+AUDIO_SUFFIXES = (".m4a", ".webm", ".opus", ".ogg", ".mp3", ".aac")
+DEFAULT_JOBS = 4
+DEFAULT_PER_HOST = 2
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 5.0
+# Hostnames that serve the same source, for the per-host concurrency cap
+HOST_ALIASES = {
+    "youtu.be": "youtube.com",
+    "www.youtube.com": "youtube.com",
+    "m.youtube.com": "youtube.com",
+    "music.youtube.com": "youtube.com",
+}
+
+
+def youtube_entries(records: list[dict]) -> list[dict]:
+    """Dataset records whose source audio is a YouTube link (published or not)."""
+    return [
+        {
+            "id": record["id"],
+            "readerName": record["readerName"],
+            "masjidName": record["masjidName"],
+            "region": record["region"],
+            "audioUrl": record["sourceAudioUrl"],
+        }
+        for record in records
+        if source_host(record["sourceAudioUrl"]) == "youtube.com"
+    ]
+
+
+def check_yt_dlp(downloader: str = YT_DLP_BIN):
+    """Check if yt-dlp (or the stand-in downloader) is installed."""
     try:
-        result = subprocess.run(
-            [YT_DLP_BIN, "--version"], capture_output=True, text=True, check=True
-        )
+        with telemetry.span("yt-dlp --version", cat="subprocess"):
+            result = subprocess.run(
+                [downloader, "--version"], capture_output=True, text=True, check=True
+            )
         print(f"yt-dlp version: {result.stdout.strip()}")
         return True
     except (FileNotFoundError, subprocess.CalledProcessError):
@@ -76,123 +95,237 @@ def check_yt_dlp():
         return False
 
 
-def download_audio(url: str, output_dir: Path, masjid_id: str) -> str | None:
+def download_audio(url: str, output_dir: Path, masjid_id: str,
+                   downloader: str = YT_DLP_BIN) -> str | None:
     """Download audio from a YouTube URL using yt-dlp.
 
     Returns the filename if successful, None if failed.
     Downloads best audio stream in native format (usually m4a/webm).
+    Partial (.part) files left by an earlier attempt are resumed.
     """
     try:
         # Use yt-dlp's output template to name by masjid_id
         output_template = str(output_dir / f"{masjid_id}.%(ext)s")
-        result = subprocess.run(
-            [
-                YT_DLP_BIN,
-                "--format", "bestaudio[ext=m4a]/bestaudio",
-                "--output", output_template,
-                "--no-playlist",
-                "--quiet",
-                "--no-warnings",
-                url,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+        with telemetry.span("yt-dlp", cat="subprocess", id=masjid_id):
+            result = subprocess.run(
+                [
+                    downloader,
+                    "--format", "bestaudio[ext=m4a]/bestaudio",
+                    "--output", output_template,
+                    "--continue",
+                    "--no-playlist",
+                    "--quiet",
+                    "--no-warnings",
+                    url,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
         if result.returncode != 0:
-            print(f"  yt-dlp error: {result.stderr.strip()}")
+            print(f"  {masjid_id}: yt-dlp error: {result.stderr.strip()}")
             return None
 
         # Find the downloaded file (extension varies)
         matches = list(output_dir.glob(f"{masjid_id}.*"))
-        audio_matches = [m for m in matches if m.suffix in ('.m4a', '.webm', '.opus', '.ogg', '.mp3', '.aac')]
+        audio_matches = [m for m in matches if m.suffix in AUDIO_SUFFIXES]
         if audio_matches:
             return audio_matches[0].name
         return None
     except subprocess.TimeoutExpired:
-        print("  Timeout after 120s")
+        print(f"  {masjid_id}: Timeout after 120s")
         return None
     except Exception as e:
-        print(f"  Exception: {e}")
+        print(f"  {masjid_id}: Exception: {e}")
+        return None
+
+
+def source_host(url: str) -> str:
+    """Host a download is rate limited under (aliases such as youtu.be folded together)."""
+    host = urllib.parse.urlparse(url).netloc.lower()
+    return HOST_ALIASES.get(host, host)
+
+
+class DownloadScheduler:
+    """Runs downloads with a per-source-host concurrency cap and retries with backoff."""
+
+    def __init__(self, output_dir: Path, per_host: int = DEFAULT_PER_HOST,
+                 retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_BACKOFF,
+                 downloader: str = YT_DLP_BIN):
+        self.output_dir = output_dir
+        self.per_host = per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.downloader = downloader
+        self.host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self.lock = threading.Lock()
+
+    def _slot(self, url: str) -> threading.BoundedSemaphore:
+        host = source_host(url)
+        with self.lock:
+            if host not in self.host_slots:
+                self.host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self.host_slots[host]
+
+    def download(self, entry: dict) -> str | None:
+        """Download one entry, retrying on failure. Returns the filename or None."""
+        url = entry["audioUrl"]
+        for attempt in range(self.retries + 1):
+            if attempt:
+                delay = self.backoff * 2 ** (attempt - 1)
+                print(f"  {entry['id']}: retry {attempt}/{self.retries} in {delay:.0f}s", flush=True)
+                telemetry.count("download.retry")
+                with telemetry.span("retry_backoff", cat="wait", id=entry["id"]):
+                    time.sleep(delay)
+            # Hold the host slot only while downloading, not while backing off
+            slot = self._slot(url)
+            with telemetry.span("host_slot", cat="wait", host=source_host(url)):
+                slot.acquire()
+            try:
+                filename = download_audio(url, self.output_dir, entry["id"], self.downloader)
+            finally:
+                slot.release()
+            if filename:
+                return filename
         return None
 
 
+def manifest_entry(entry: dict, filename: str) -> dict:
+    return {
+        "filename": filename,
+        "readerName": entry["readerName"],
+        "masjidName": entry["masjidName"],
+        "region": entry["region"],
+        "sourceUrl": entry["audioUrl"],
+    }
+
+
+def record_download(manifest: dict, entry: dict, filename: str) -> None:
+    """Record a downloaded file, keeping what later steps added to its manifest entry.
+
+    Renditions, hashes and R2 URLs (transcode_audio.py, make_audio_previews.py,
+    publish_audio.py) describe the downloaded file, so they are only dropped
+    when the source link or the file itself changed.
+    """
+    fields = manifest_entry(entry, filename)
+    current = manifest.get(entry["id"])
+    if current and current.get("sourceUrl") == fields["sourceUrl"] and current.get("filename") == filename:
+        current.update(fields)
+    else:
+        manifest[entry["id"]] = fields
+
+
+def write_json_atomic(path: Path, data) -> None:
+    """Write JSON via a temp file and rename, so a crash never truncates it."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Download YouTube audio for masjids.")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"concurrent downloads (default: {DEFAULT_JOBS})")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST,
+                        help=f"concurrent downloads per source host (default: {DEFAULT_PER_HOST})")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help=f"retries per download (default: {DEFAULT_RETRIES})")
+    parser.add_argument("--backoff", type=float, default=DEFAULT_BACKOFF,
+                        help=f"first retry delay in seconds, doubled each retry (default: {DEFAULT_BACKOFF})")
+    parser.add_argument("--downloader", default=YT_DLP_BIN,
+                        help="yt-dlp compatible command to run (default: yt-dlp)")
+    add_city_argument(parser)
+    telemetry.add_arguments(parser)
+    return parser.parse_args(argv)
+
+
 def main():
-    print(f"Using yt-dlp: {YT_DLP_BIN}")
+    args = parse_args()
+    city = CITIES[args.city]
+    with telemetry.session(args):
+        # Load masjids
+        print(f"Reading {city.dataset_path}...")
+        entries = youtube_entries(load_dataset(city.dataset_path))
+        print(f"Found {len(entries)} YouTube audio entries\n")
 
-    # Check yt-dlp
-    if not check_yt_dlp():
-        sys.exit(1)
+        if not entries:
+            print("No YouTube entries found. Exiting.")
+            sys.exit(1)
 
-    # Parse masjids
-    print(f"\nParsing {MASJIDS_TS}...")
-    entries = parse_masjids_ts(MASJIDS_TS)
-    print(f"Found {len(entries)} YouTube audio entries\n")
+        download_all(args, entries, Path(city.audio_dir))
 
-    if not entries:
-        print("No YouTube entries found. Exiting.")
+
+def download_all(args, entries: list[dict], output_dir: Path = OUTPUT_DIR) -> dict:
+    """Download every entry not downloaded yet and return the updated manifest."""
+    print(f"Using yt-dlp: {args.downloader}")
+
+    # Check yt-dlp
+    if not check_yt_dlp(args.downloader):
         sys.exit(1)
 
     # Create output directory
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Download
+    # Keep what earlier (possibly interrupted) runs already recorded
+    manifest_path = output_dir / "manifest.json"
     manifest = {}
+    if manifest_path.exists():
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
     success_count = 0
     skip_count = 0
     fail_count = 0
     failed_entries = []
+    queue = []
 
     for i, entry in enumerate(entries, 1):
         masjid_id = entry["id"]
-        audio_url = entry["audioUrl"]
 
         # Skip if already downloaded (check for any audio file with this ID)
-        existing = [f for f in OUTPUT_DIR.glob(f"{masjid_id}.*")
-                     if f.suffix in ('.m4a', '.webm', '.opus', '.ogg', '.mp3', '.aac')]
+        existing = [f for f in output_dir.glob(f"{masjid_id}.*") if f.suffix in AUDIO_SUFFIXES]
         if existing and existing[0].stat().st_size > 0:
             filename = existing[0].name
             print(f"[{i}/{len(entries)}] SKIP {masjid_id} (already exists: {filename})")
             skip_count += 1
-            manifest[masjid_id] = {
-                "filename": filename,
-                "readerName": entry["readerName"],
-                "masjidName": entry["masjidName"],
-                "region": entry["region"],
-                "sourceUrl": audio_url,
-            }
+            telemetry.count("download.skipped")
+            record_download(manifest, entry, filename)
             continue
+        queue.append(entry)
+
+    write_json_atomic(manifest_path, manifest)
 
-        print(f"[{i}/{len(entries)}] Downloading {masjid_id} from {audio_url}...", flush=True)
-
-        filename = download_audio(audio_url, OUTPUT_DIR, masjid_id)
-        if filename:
-            filepath = OUTPUT_DIR / filename
-            size_kb = filepath.stat().st_size / 1024
-            print(f"  OK ({size_kb:.0f} KB) -> {filename}", flush=True)
-            success_count += 1
-            manifest[masjid_id] = {
-                "filename": filename,
-                "readerName": entry["readerName"],
-                "masjidName": entry["masjidName"],
-                "region": entry["region"],
-                "sourceUrl": audio_url,
-            }
-        else:
-            print(f"  FAIL", flush=True)
-            fail_count += 1
-            failed_entries.append(entry)
-
-    # Write manifest
-    manifest_path = OUTPUT_DIR / "manifest.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
-
-    # Write failed entries for retry
+    # Download
+    print(f"\nDownloading {len(queue)} entries ({args.jobs} jobs, {args.per_host} per host)...", flush=True)
+    scheduler = DownloadScheduler(output_dir, per_host=args.per_host, retries=args.retries,
+                                  backoff=args.backoff, downloader=args.downloader)
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {executor.submit(scheduler.download, entry): entry for entry in queue}
+        for done, future in enumerate(as_completed(futures), 1):
+            entry = futures[future]
+            masjid_id = entry["id"]
+            filename = future.result()
+            if filename:
+                size_kb = (output_dir / filename).stat().st_size / 1024
+                print(f"[{done}/{len(queue)}] OK {masjid_id} ({size_kb:.0f} KB) -> {filename}", flush=True)
+                success_count += 1
+                telemetry.count("download.ok")
+                # Record each finished download immediately
+                record_download(manifest, entry, filename)
+                write_json_atomic(manifest_path, manifest)
+            else:
+                print(f"[{done}/{len(queue)}] FAIL {masjid_id}", flush=True)
+                fail_count += 1
+                telemetry.count("download.failed")
+                failed_entries.append(entry)
+
+    # Write failed entries for retry; a clean run clears the last list
+    failed_path = output_dir / "failed.json"
     if failed_entries:
-        failed_path = OUTPUT_DIR / "failed.json"
-        with open(failed_path, "w", encoding="utf-8") as f:
-            json.dump(failed_entries, f, ensure_ascii=False, indent=2)
+        write_json_atomic(failed_path, failed_entries)
+    elif failed_path.exists():
+        failed_path.unlink()
 
     # Summary
     print(f"\n{'='*50}")
@@ -202,11 +335,12 @@ def main():
     print(f"  Skipped:  {skip_count}")
     print(f"  Failed:   {fail_count}")
     print(f"  Total:    {len(entries)}")
-    print(f"\n  Output:   {OUTPUT_DIR}")
+    print(f"\n  Output:   {output_dir}")
     print(f"  Manifest: {manifest_path}")
     if failed_entries:
-        print(f"  Failed:   {OUTPUT_DIR / 'failed.json'}")
+        print(f"  Failed:   {failed_path}")
     print()
+    return manifest
 
 
 if __name__ == "__main__":
@@ -1,86 +1,95 @@
 """
-Extract coordinates from Google Maps URLs for 148 masjids.
+Extract coordinates from Google Maps URLs for a city's masjids.
 
 Three extraction methods:
 1. @lat,lng from URL (for full Google Maps URLs with coordinates)
 2. Plus Codes decoded with openlocationcode (from resolved short URLs)
 3. S2 Cell ID decoded with s2sphere (from ftid parameters)
 
+Spreadsheet rows are streamed in read-only mode, and short URLs are
+resolved in-process (see redirect_resolver.py) by a bounded worker pool as
+soon as their row is read, with a per-host token bucket instead of a fixed
+sleep between requests.
+
+The defaults trade speed for safety: every short link is on one host
+(maps.app.goo.gl), and going faster than the old one request per 2 s runs
+into Google's /sorry/ rate-limit pages. So by default resolution is
+capped at --rate 0.5 with --burst 1, and the worker pool only hides each
+request's latency inside the 2 s gap (about 2 s per uncached short URL,
+against 2 s plus latency before). Cached and stored resolutions, which
+are most rows on a repeat run, skip the limit. For more throughput, raise
+--rate and --burst (with --workers at about rate × request latency),
+and expect /sorry/ failures to come back with a Retry-After backoff.
+
+Stage timings, per-row latency, cache hits and network waits can be
+traced or profiled with the options from telemetry.py (--trace, --timings,
+--profile).
+
+Runs are incremental: each spreadsheet row is fingerprinted in
+pipeline_state.json, only changed rows are re-extracted, and the output
+file is left untouched when nothing changed. Pass --full to reprocess
+every row. A short URL whose stored resolution is older than
+--revalidate-days is resolved again even when its row is unchanged.
+
+The spreadsheet, the city centre and bounds used to decode and validate
+coordinates, and the region names come from a city profile
+(city_profiles.py, --city; default Riyadh).
+
 Usage:
-    scripts/.venv/bin/python scripts/extract_coordinates.py
+    scripts/.venv/bin/python scripts/extract_coordinates.py [--city KEY] [--workers N] [--rate R] [--burst B] [--full]
+        [--trace PATH] [--timings] [--profile cprofile|sample]
 """
 
+import argparse
 import json
 import os
-import re
-import subprocess
 import sys
+import threading
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 import openpyxl
 import s2sphere
 from openlocationcode import openlocationcode as olc
 
-sys.stdout.reconfigure(line_buffering=True)
-
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-XLSX_PATH = os.path.join(SCRIPT_DIR, '..', 'riyadh_list.xlsx')
-CACHE_PATH = os.path.join(SCRIPT_DIR, 'coordinates_cache.json')
-OUTPUT_PATH = os.path.join(SCRIPT_DIR, 'masjids_extracted.json')
-
-# Riyadh center for Plus Code recovery
-RIYADH_LAT = 24.7136
-RIYADH_LNG = 46.6753
-
-REGION_MAP = {
-    'الشمال': 'north',
-    'الشرق': 'east',
-    'الغرب والجنوب': 'westSouth',
-}
-
-# Riyadh coordinate bounds for validation
-LAT_MIN, LAT_MAX = 24.3, 25.2
-LNG_MIN, LNG_MAX = 46.2, 47.2
-
-AT_COORD_PATTERN = re.compile(r'@([-\d.]+),([-\d.]+)')
-DATA_3D_PATTERN = re.compile(r'!3d([-\d.]+)!4d([-\d.]+)')
-PLUS_CODE_PATTERN = re.compile(r'([2-9CFGHJMPQRVWX]{4,8})[+ ]([2-9CFGHJMPQRVWX]{2,3})\b')
-S2_CELL_PATTERN = re.compile(r'0x([0-9a-f]{16})')
-FTID_PATTERN = re.compile(r'(?:ftid=|!1s)(0x[0-9a-f]+:0x[0-9a-f]+)')
-
-
-def is_valid_riyadh_coord(lat, lng):
-    return LAT_MIN <= lat <= LAT_MAX and LNG_MIN <= lng <= LNG_MAX
+import telemetry
+from city_profiles import CITIES, RIYADH, add_city_argument
+from coordinate_cache import CoordinateCache
+from pipeline_state import fingerprint, load_state, save_state, write_if_changed
+from redirect_resolver import RedirectResolver
+from url_matcher import scan_url
 
+sys.stdout.reconfigure(line_buffering=True)
 
-def load_cache():
-    if os.path.exists(CACHE_PATH):
-        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+# Short URL resolution defaults (per host: requests/second and burst size).
+# One request every 2 s, as the old fixed sleep did; faster rates run into
+# Google's /sorry/ rate-limit pages, so raise --rate with care. At this
+# rate the workers only overlap latency with the wait (see the docstring).
+DEFAULT_WORKERS = 4
+DEFAULT_RATE = 0.5
+DEFAULT_BURST = 1
 
 
-def save_cache(cache):
-    with open(CACHE_PATH, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
+# Shared by all worker threads; connections are pooled per thread and host
+RESOLVER = RedirectResolver()
 
 
-def decode_plus_code(short_code):
-    """Decode a short Plus Code using Riyadh as reference."""
+def decode_plus_code(short_code, city=RIYADH):
+    """Decode a short Plus Code using the city centre as reference."""
     try:
-        full_code = olc.recoverNearest(short_code, RIYADH_LAT, RIYADH_LNG)
+        full_code = olc.recoverNearest(short_code, *city.center)
         decoded = olc.decode(full_code)
         lat = decoded.latitudeCenter
         lng = decoded.longitudeCenter
-        if is_valid_riyadh_coord(lat, lng):
+        if city.is_valid_coord(lat, lng):
             return lat, lng
     except Exception:
         pass
     return None
 
 
-def decode_s2_cell(hex_str):
+def decode_s2_cell(hex_str, city=RIYADH):
     """Decode an S2 Cell ID hex string to lat/lng."""
     try:
         cell_id_int = int(hex_str, 16)
@@ -89,183 +98,305 @@ def decode_s2_cell(hex_str):
             center = cell.to_lat_lng()
             lat = center.lat().degrees
             lng = center.lng().degrees
-            if is_valid_riyadh_coord(lat, lng):
+            if city.is_valid_coord(lat, lng):
                 return lat, lng
     except Exception:
         pass
     return None
 
 
-def extract_from_url(url):
-    """Extract coordinates from a URL using multiple methods."""
-    # Method 1: @lat,lng
-    match = AT_COORD_PATTERN.search(url)
-    if match:
-        lat, lng = float(match.group(1)), float(match.group(2))
-        if is_valid_riyadh_coord(lat, lng):
-            return lat, lng, '@coords'
-
-    # Method 2: !3d lat !4d lng
-    match = DATA_3D_PATTERN.search(url)
-    if match:
-        lat, lng = float(match.group(1)), float(match.group(2))
-        if is_valid_riyadh_coord(lat, lng):
-            return lat, lng, '!3d!4d'
-
-    # Method 3: S2 Cell ID from ftid or !1s
-    ftid_match = FTID_PATTERN.search(url)
-    if ftid_match:
-        ftid = ftid_match.group(1)
-        s2_hex = ftid.split(':')[0]
-        coords = decode_s2_cell(s2_hex)
+def coordinate_candidates(url, decode=True, city=RIYADH):
+    """Yield every (lat, lng, method, rank) in `url` inside the city, best rank first.
+
+    The URL is scanned once (see url_matcher.py); S2 cells and Plus Codes
+    are decoded lazily, so callers that stop at the first result only pay
+    for the candidates they look at.
+    """
+    for candidate in scan_url(url, decode=decode):
+        if candidate.method == 's2cell':
+            coords = decode_s2_cell(candidate.value, city)
+        elif candidate.method == 'plus_code':
+            coords = decode_plus_code(candidate.value, city)
+        elif city.is_valid_coord(*candidate.value):
+            coords = candidate.value
+        else:
+            coords = None
         if coords:
-            return coords[0], coords[1], 's2cell'
+            yield coords[0], coords[1], candidate.method, candidate.rank
+
 
+def best_candidate(url, decode=True, city=RIYADH):
+    for lat, lng, method, _ in coordinate_candidates(url, decode=decode, city=city):
+        return lat, lng, method
     return None
 
 
-def resolve_short_url(url):
-    """Resolve a short URL using curl, returning the effective URL."""
-    try:
-        result = subprocess.run(
-            ['curl', '-sL', '-o', '/dev/null', '-w', '%{url_effective}', url],
-            capture_output=True, text=True, timeout=15
-        )
-        resolved = result.stdout.strip()
+def extract_from_url(url, city=RIYADH):
+    """Extract coordinates from a URL as-is, without percent-decoding it."""
+    return best_candidate(url, decode=False, city=city)
 
-        # Handle Google's sorry/CAPTCHA page
-        if '/sorry/' in resolved:
-            parsed = urllib.parse.urlparse(resolved)
-            params = urllib.parse.parse_qs(parsed.query)
-            continue_url = params.get('continue', [''])[0]
-            if continue_url:
-                resolved = urllib.parse.unquote(continue_url)
 
-        return resolved
-    except Exception:
-        return url
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity`."""
 
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
 
-def extract_from_resolved(resolved_url):
-    """Extract coordinates from a resolved Google Maps URL."""
-    decoded = urllib.parse.unquote(urllib.parse.unquote(resolved_url))
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve the token up front so concurrent callers queue behind it
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            with telemetry.span('rate_limit', cat='wait'):
+                time.sleep(wait)
 
-    # Try direct coordinate extraction first
-    result = extract_from_url(decoded)
-    if result:
-        return result
 
-    # Try Plus Code from q parameter
-    parsed = urllib.parse.urlparse(decoded)
-    params = urllib.parse.parse_qs(parsed.query)
-    q = urllib.parse.unquote(params.get('q', [''])[0])
+class HostRateLimiter:
+    """One token bucket per URL host."""
 
-    plus_match = PLUS_CODE_PATTERN.search(q)
-    if plus_match:
-        code = plus_match.group(1) + '+' + plus_match.group(2)
-        coords = decode_plus_code(code)
-        if coords:
-            return coords[0], coords[1], 'plus_code'
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
 
-    # Try ftid from URL params
-    ftid = params.get('ftid', [''])[0]
-    if ftid:
-        s2_hex = ftid.split(':')[0]
-        coords = decode_s2_cell(s2_hex)
-        if coords:
-            return coords[0], coords[1], 's2cell'
+    def acquire(self, url):
+        host = urllib.parse.urlparse(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+        bucket.acquire()
 
-    return None
 
+def is_short_url(url):
+    return 'maps.app.goo.gl' in url or 'goo.gl' in url
 
-def read_excel():
-    wb = openpyxl.load_workbook(XLSX_PATH)
-    ws = wb['جميع القراء']
-    entries = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        entries.append({
-            'readerName': row[0],
-            'masjidName': row[1],
-            'region_ar': row[2],
-            'region': REGION_MAP.get(row[2], row[2]),
-            'googleMapsUrl': row[3],
-            'audioUrl': row[4],
-            'notes': row[5] if row[5] else None,
-        })
-    return entries
+
+def resolve_and_extract(url, limiter, resolver=None, city=RIYADH):
+    """Resolve a short URL (rate limited per host) and extract its coordinates.
+
+    Returns (result, resolution, failure): the extract_from_resolved result,
+    the redirect_resolver.Resolution (None on network errors) and a failure
+    reason (None on success).
+    """
+    limiter.acquire(url)
+    try:
+        with telemetry.span('resolve', cat='network', url=url):
+            resolution = (resolver or RESOLVER).follow(url)
+    except Exception as e:
+        telemetry.count('resolve.error')
+        return None, None, f'{type(e).__name__}: {e}'
+    result = extract_from_resolved(resolution.resolved, city)
+    if result:
+        return result, resolution, None
+    return None, resolution, f'no coords in resolved URL (HTTP {resolution.status})'
+
+
+def extract_from_resolved(resolved_url, city=RIYADH):
+    """Extract coordinates from a resolved (possibly percent-encoded) Google Maps URL."""
+    return best_candidate(resolved_url, city=city)
+
+
+def iter_excel(city=RIYADH):
+    """Stream entries from the city's sheet one row at a time.
+
+    Uses openpyxl's read-only, values-only mode so the workbook is parsed
+    lazily and never held in memory as a whole.
+    """
+    with telemetry.span('load_workbook', cat='io'):
+        wb = openpyxl.load_workbook(city.xlsx_path, read_only=True, data_only=True)
+    region_map = city.region_map
+    try:
+        ws = wb[city.sheet]
+        for row in ws.iter_rows(min_row=2, max_col=6, values_only=True):
+            # Read-only sheets may report trailing blank rows
+            if not any(row):
+                continue
+            row = tuple(row) + (None,) * (6 - len(row))
+            yield {
+                'readerName': row[0],
+                'masjidName': row[1],
+                'region_ar': row[2],
+                'region': region_map.get(row[2], row[2]),
+                'googleMapsUrl': row[3],
+                'audioUrl': row[4],
+                'notes': row[5] if row[5] else None,
+            }
+    finally:
+        wb.close()
+
+
+def row_fingerprint(entry):
+    """Fingerprint of the spreadsheet columns a row was read from."""
+    return fingerprint([entry[key] for key in (
+        'readerName', 'masjidName', 'region_ar', 'googleMapsUrl', 'audioUrl', 'notes',
+    )])
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Extract masjid coordinates from Google Maps URLs.')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'concurrent short URL resolvers; only faster than one at a time '
+                             f'when --rate allows it (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f'requests per second per host; the default is deliberately as slow as the '
+                             f'old 2 s sleep, higher values risk rate-limit pages (default: {DEFAULT_RATE})')
+    parser.add_argument('--burst', type=int, default=DEFAULT_BURST,
+                        help=f'token bucket size per host; requests sent back to back before --rate '
+                             f'applies (default: {DEFAULT_BURST})')
+    parser.add_argument('--cache-ttl-days', type=float, default=None,
+                        help='expire newly cached coordinates after this many days (default: never)')
+    parser.add_argument('--revalidate-days', type=float, default=30,
+                        help='re-resolve short URLs whose stored resolution is older than this (default: 30)')
+    parser.add_argument('--retry-failures', action='store_true',
+                        help='ignore negatively cached failures and retry them now')
+    parser.add_argument('--full', action='store_true',
+                        help='ignore row fingerprints and reprocess every row')
+    add_city_argument(parser)
+    telemetry.add_arguments(parser)
+    return parser.parse_args(argv)
 
 
 def main():
-    print("Reading Excel data...")
-    entries = read_excel()
-    print(f"Found {len(entries)} entries\n")
+    args = parse_args()
+    with telemetry.session(args):
+        extract(args, CITIES[args.city])
 
+
+def extract(args, city=RIYADH, rows=None, save=True):
+    """Extract coordinates for `rows` (default: the city's spreadsheet) and return the entries.
+
+    The entries are also written to the city's masjids_extracted.json
+    when `save` is set.
+    """
     print("Loading cache...")
-    cache = load_cache()
+    with telemetry.span('load_cache', cat='io'):
+        cache = CoordinateCache(
+            city.coordinate_cache_path,
+            legacy_path=os.path.join(city.data_dir, 'coordinates_cache.json'),
+            ttl=args.cache_ttl_days * 86400 if args.cache_ttl_days else None,
+            revalidate_after=args.revalidate_days * 86400,
+        )
     print(f"Cache has {len(cache)} entries\n")
 
-    print("Extracting coordinates...")
+    state = load_state(city.state_path)
+    known_rows = {} if args.full else state.get('extract', {}).get('rows', {})
+
+    print("Extracting coordinates (streaming Excel rows)..." if rows is None else "Extracting coordinates...")
+    entries = []
     methods_count = {}
+    unchanged = 0
+    stored_hits = 0  # short URLs answered from a stored resolution
+    pending = []  # (index, future) for short URLs being resolved
 
-    for i, entry in enumerate(entries):
+    def record(i, result, fail_reason):
+        entry = entries[i]
         url = entry['googleMapsUrl']
-
-        # Check cache first
-        if url in cache:
-            entry['lat'] = cache[url]['lat']
-            entry['lng'] = cache[url]['lng']
-            method = cache[url].get('method', 'cached')
-            methods_count[method] = methods_count.get(method, 0) + 1
-            continue
-
-        # Try extracting directly from original URL
-        result = extract_from_url(url)
         if result:
             entry['lat'], entry['lng'], method = result
-            cache[url] = {'lat': entry['lat'], 'lng': entry['lng'], 'method': method}
+            cache.put(url, entry['lat'], entry['lng'], method)
             methods_count[method] = methods_count.get(method, 0) + 1
-            print(f"  [{method}] {i+1}/148: {entry['readerName']} -> ({entry['lat']:.6f}, {entry['lng']:.6f})")
-            continue
-
-        # Need to resolve short URL
-        if 'maps.app.goo.gl' in url or 'goo.gl' in url:
-            time.sleep(2)  # Rate limiting
-            resolved = resolve_short_url(url)
-            result = extract_from_resolved(resolved)
-            if result:
-                entry['lat'], entry['lng'], method = result
-                cache[url] = {'lat': entry['lat'], 'lng': entry['lng'], 'method': method}
-                methods_count[method] = methods_count.get(method, 0) + 1
-                print(f"  [{method}] {i+1}/148: {entry['readerName']} -> ({entry['lat']:.6f}, {entry['lng']:.6f})")
-            else:
-                entry['lat'] = None
-                entry['lng'] = None
-                print(f"  [FAIL] {i+1}/148: {entry['readerName']} - no coords in resolved URL")
+            print(f"  [{method}] row {i+1}: {entry['readerName']} -> ({entry['lat']:.6f}, {entry['lng']:.6f})")
         else:
-            # Full URL but couldn't extract - try resolved version
-            result = extract_from_resolved(url)
-            if result:
-                entry['lat'], entry['lng'], method = result
-                cache[url] = {'lat': entry['lat'], 'lng': entry['lng'], 'method': method}
+            entry['lat'] = None
+            entry['lng'] = None
+            print(f"  [FAIL] row {i+1}: {entry['readerName']} - {fail_reason}")
+
+    limiter = HostRateLimiter(rate=args.rate, burst=args.burst)
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for i, entry in enumerate(iter_excel(city) if rows is None else rows):
+            entries.append(entry)
+            url = entry['googleMapsUrl']
+            entry['fingerprint'] = row_fingerprint(entry)
+
+            # A short URL's coordinates are as old as its stored resolution;
+            # once that is due for revalidation, neither the last run's row
+            # nor the coordinate cache may answer for it
+            revalidate = is_short_url(url) and cache.needs_revalidation(url)
+            if revalidate:
+                telemetry.count('resolution.revalidate')
+
+            # Skip rows whose content hasn't changed since the last run
+            known = None if revalidate else known_rows.get(entry['fingerprint'])
+            if known:
+                entry['lat'] = known['lat']
+                entry['lng'] = known['lng']
+                unchanged += 1
+                telemetry.count('rows.unchanged')
+                continue
+
+            # Check cache first
+            cached = None if revalidate else cache.get(url)
+            telemetry.count('cache.hit' if cached else 'cache.miss')
+            if cached:
+                entry['lat'] = cached['lat']
+                entry['lng'] = cached['lng']
+                method = cached['method']
                 methods_count[method] = methods_count.get(method, 0) + 1
-                print(f"  [{method}] {i+1}/148: {entry['readerName']} -> ({entry['lat']:.6f}, {entry['lng']:.6f})")
-            else:
-                entry['lat'] = None
-                entry['lng'] = None
-                print(f"  [FAIL] {i+1}/148: {entry['readerName']} - could not extract coords")
+                continue
 
-        # Save cache every 20 entries
-        if (i + 1) % 20 == 0:
-            save_cache(cache)
-            print(f"  ... cache saved ({i+1}/148)")
+            # Try extracting directly from original URL
+            result = extract_from_url(url, city)
+            if result:
+                record(i, result, None)
+                continue
+
+            # Need to resolve short URL: reuse a stored resolution (or a
+            # still backed-off failure) before going to the network
+            if is_short_url(url):
+                stored = cache.get_resolution(url)
+                if stored and stored['failure'] and args.retry_failures:
+                    stored = None
+                if stored:
+                    stored_hits += 1
+                    telemetry.count('resolution.stored')
+                    if stored['failure']:
+                        retry = time.strftime('%Y-%m-%d %H:%M', time.localtime(stored['retry_at']))
+                        record(i, None, f"{stored['failure']} (cached, retry after {retry})")
+                    else:
+                        record(i, extract_from_resolved(stored['final_url'], city), 'no coords in stored URL')
+                    continue
+                # Start it now, while later rows stream in
+                pending.append((i, executor.submit(resolve_and_extract, url, limiter, city=city)))
+            else:
+                # Full URL but couldn't extract - try resolved version
+                record(i, extract_from_resolved(url, city), 'could not extract coords')
+
+        print(f"Read {len(entries)} entries")
+        if pending:
+            print(f"\nWaiting on {len(pending)} short URLs ({args.workers} workers)...")
+
+        # Collect in row order so output matches a serial run; each result
+        # is committed to the cache as it is recorded
+        for i, future in pending:
+            with telemetry.span('wait_resolution', cat='wait'):
+                result, resolution, failure = future.result()
+            url = entries[i]['googleMapsUrl']
+            if resolution:
+                cache.put_resolution(url, resolution.chain, final_url=resolution.resolved if result else None,
+                                     failure=failure, retry_after=resolution.retry_after)
+            else:
+                cache.put_resolution(url, [url], failure=failure)
+            record(i, result, failure)
 
-    # Save final cache
-    save_cache(cache)
+    cache.close()
 
     # Report
     success = sum(1 for e in entries if e.get('lat') is not None)
     failed = sum(1 for e in entries if e.get('lat') is None)
     print(f"\nResults: {success} success, {failed} failed out of {len(entries)}")
+    print(f"Unchanged rows skipped: {unchanged}")
+    print(f"Short URLs from stored resolutions: {stored_hits}, resolved over the network: {len(pending)}")
     print(f"\nMethods used:")
     for method, count in sorted(methods_count.items()):
         print(f"  {method}: {count}")
@@ -296,10 +427,22 @@ def main():
             item['notes'] = e['notes']
         output.append(item)
 
-    with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
-
-    print(f"\nOutput saved to {OUTPUT_PATH}")
+    if save:
+        output_path = city.extracted_path
+        with telemetry.span('write_output', cat='io'):
+            written = write_if_changed(output_path, json.dumps(output, ensure_ascii=False, indent=2))
+        if written:
+            print(f"\nOutput saved to {output_path}")
+        else:
+            print(f"\nNo changes; {output_path} left untouched")
+
+    # Remember successful rows only, so failures are retried next run
+    state['extract'] = {'rows': {
+        e['fingerprint']: {'lat': e['lat'], 'lng': e['lng']}
+        for e in entries if e.get('lat') is not None
+    }}
+    save_state(state, city.state_path)
+    return output
 
 
 if __name__ == '__main__':
@@ -1,96 +1,174 @@
 """
-Generate src/data/masjids.ts from extracted JSON data.
-
-Reads scripts/masjids_extracted.json and generates a TypeScript file
-with properly typed Masjid[] data.
+Generate src/data/masjids.ts from the canonical dataset.
+
+Merges scripts/masjids_extracted.json into the canonical dataset
+(scripts/masjids.json, see masjid_dataset.py), assigns regions from the
+city's boundary polygons if it has any (see region_boundaries.py), then
+renders the dataset as a TypeScript file with properly typed Masjid[]
+data. Pass --no-merge to only re-render the dataset as it is.
+
+Alongside it, src/data/masjid-index.ts receives each masjid's nearest
+neighbours, found with a KD-tree (see spatial_index.py), so the client
+never scans the whole array for related masjids, src/data/masjid-kdtree.ts
+receives the tree itself for nearest-masjid queries from any point, and
+src/data/regions/ receives one lazily loadable module per region plus an
+id manifest (see data_chunks.py), with a size report per chunk. The map
+layer gets a PMTiles archive of vector tiles with the markers and
+precomputed clusters for each zoom (see vector_tiles.py).
+
+Each record is fingerprinted in pipeline_state.json: only changed records
+are re-rendered, and the file (including its date header) is left
+untouched when the rendered records are unchanged. Pass --full to
+re-render everything. Stages can be timed with the telemetry.py options
+(--trace, --timings, --profile).
+
+--city renders another city's dataset into that city's modules (see
+city_profiles.py; default Riyadh, whose modules are the ones above).
 
 Usage:
-    scripts/.venv/bin/python scripts/generate_masjids_ts.py
+    scripts/.venv/bin/python scripts/generate_masjids_ts.py [--city KEY] [--full] [--no-merge] [--trace PATH] [--timings]
 """
 
+import argparse
 import json
 import os
 from datetime import datetime
 
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-INPUT_PATH = os.path.join(SCRIPT_DIR, 'masjids_extracted.json')
-OUTPUT_PATH = os.path.join(SCRIPT_DIR, '..', 'src', 'data', 'masjids.ts')
-
-REGION_ORDER = ['north', 'east', 'westSouth']
-REGION_LABELS = {
-    'north': 'North Region (الشمال)',
-    'east': 'East Region (الشرق)',
-    'westSouth': 'West & South Region (الغرب والجنوب)',
-}
-REGION_PREFIX = {
-    'north': 'n',
-    'east': 'e',
-    'westSouth': 'ws',
-}
+import telemetry
+from city_profiles import CITIES, RIYADH, add_city_argument
+from data_chunks import print_size_report, write_chunks
+from masjid_dataset import load_dataset, merge_extracted, save_dataset
+from pipeline_state import diff_against, fingerprint, load_state, save_state, write_atomic
+from region_boundaries import assign_regions, print_mismatches
+from spatial_index import write_index_modules
+from vector_tiles import print_tiles_report, write_tiles
 
 
-def generate():
-    with open(INPUT_PATH, 'r', encoding='utf-8') as f:
-        entries = json.load(f)
+def render_entry(entry_id, region, entry):
+    """Render one Masjid object literal as a list of lines."""
+    lines = []
+    lines.append('  {')
+    lines.append(f"    id: '{entry_id}',")
+    lines.append(f"    readerName: '{escape_ts(entry['readerName'])}',")
+    lines.append(f"    masjidName: '{escape_ts(entry['masjidName'])}',")
+    lines.append(f"    region: '{region}',")
+    lines.append(f"    coordinates: {{ lat: {entry['lat']}, lng: {entry['lng']} }},")
+    lines.append(f"    googleMapsUrl: '{escape_ts(entry['googleMapsUrl'])}',")
+    lines.append(f"    audioUrl: '{escape_ts(entry['audioUrl'])}',")
+    if entry.get('notes'):
+        lines.append(f"    notes: '{escape_ts(entry['notes'])}',")
+    lines.append('  },')
+    return lines
+
+
+def generate(full=False, merge=True, city=RIYADH):
+    with telemetry.span('load_dataset', cat='io'):
+        records = load_dataset(city.dataset_path)
+    if merge:
+        with telemetry.span('merge_extracted'):
+            with open(city.extracted_path, 'r', encoding='utf-8') as f:
+                extracted = json.load(f)
+            records = merge_extracted(records, extracted, city)
+        with telemetry.span('assign_regions'):
+            print_mismatches(assign_regions(records, city))
+        updated = save_dataset(records, city.dataset_path)
+        if updated:
+            print("  Dataset updated from extracted data")
+    render(records, full=full, city=city)
+
+
+def render(records, full=False, dry_run=False, city=RIYADH):
+    """Render dataset records to the city's masjids.ts (skipped when nothing changed).
+
+    With dry_run, print a unified diff of what would change instead.
+    """
+    output_path = city.ts_path
+    index_path = os.path.join(city.src_dir, 'masjid-index.ts')
+    tree_path = os.path.join(city.src_dir, 'masjid-kdtree.ts')
+    labels = city.region_labels
+    state = load_state(city.state_path)
+    previous = state.get('generate', {})
+    known_blocks = {} if full else previous.get('entries', {})
 
     # Group by region
-    by_region = {r: [] for r in REGION_ORDER}
-    for entry in entries:
-        region = entry['region']
-        if region in by_region:
-            by_region[region].append(entry)
+    by_region = {r: [] for r in city.region_order}
+    for record in records:
+        by_region[record['region']].append(record)
+
+    # Render records, reusing blocks whose fingerprint is unchanged
+    blocks = {}
+    blocks_by_id = {}
+    body = []
+    body.append("import type { Masjid } from '@/types'")
+    body.append('')
+    body.append('export const MASJIDS: Masjid[] = [')
+
+    with telemetry.span('render_entries'):
+        for region in city.region_order:
+            label = labels[region]
+
+            body.append(f"  // {'─' * 3} {label} {'─' * 3}")
+
+            for record in by_region[region]:
+                fp = fingerprint(record)
+                blocks[fp] = known_blocks.get(fp) or render_entry(record['id'], region, record)
+                blocks_by_id[record['id']] = blocks[fp]
+                body.extend(blocks[fp])
+
+            body.append('')
+
+    body.append(']')
+    body.append('')
+
+    if not dry_run:
+        with telemetry.span('spatial_index'):
+            index_written = write_index_modules(index_path, tree_path, records)
+        for path in index_written:
+            print(f"  Spatial index written: {path}")
+        with telemetry.span('region_chunks'):
+            sizes = write_chunks(city.src_dir, by_region, labels, blocks_by_id)
+        print_size_report(city.src_dir, sizes, output_path)
+        with telemetry.span('vector_tiles'):
+            tiles = write_tiles(records, city)
+        print_tiles_report(*tiles)
+
+    changed = len(blocks.keys() - known_blocks.keys())
+    telemetry.count('entries.rendered', changed)
+    telemetry.count('entries.reused', len(records) - changed)
+    body_fp = fingerprint(body)
+    if not full and body_fp == previous.get('body') and os.path.exists(output_path):
+        print(f"  No changes; {output_path} left untouched")
+        return
 
-    # Generate TypeScript
     lines = []
     lines.append('/**')
     lines.append(' * Masjid Data')
     lines.append(' *')
-    lines.append(f' * {len(entries)} masjids across 3 regions in Riyadh.')
-    lines.append(f' * Auto-generated from riyadh_list.xlsx on {datetime.now().strftime("%Y-%m-%d")}.')
+    lines.append(f' * {len(records)} masjids across {len(city.regions)} regions in {city.name}.')
+    lines.append(f' * Auto-generated from {os.path.basename(city.xlsx_path)} on {datetime.now().strftime("%Y-%m-%d")}.')
     lines.append(' */')
     lines.append('')
-    lines.append("import type { Masjid } from '@/types'")
-    lines.append('')
-    lines.append('export const MASJIDS: Masjid[] = [')
-
-    for region in REGION_ORDER:
-        entries_in_region = by_region[region]
-        prefix = REGION_PREFIX[region]
-        label = REGION_LABELS[region]
-
-        lines.append(f"  // {'─' * 3} {label} {'─' * 3}")
-
-        for idx, entry in enumerate(entries_in_region, 1):
-            entry_id = f'{prefix}-{idx:03d}'
-            lines.append('  {')
-            lines.append(f"    id: '{entry_id}',")
-            lines.append(f"    readerName: '{escape_ts(entry['readerName'])}',")
-            lines.append(f"    masjidName: '{escape_ts(entry['masjidName'])}',")
-            lines.append(f"    region: '{region}',")
-            lines.append(f"    coordinates: {{ lat: {entry['lat']}, lng: {entry['lng']} }},")
-            lines.append(f"    googleMapsUrl: '{escape_ts(entry['googleMapsUrl'])}',")
-            lines.append(f"    audioUrl: '{escape_ts(entry['audioUrl'])}',")
-            if entry.get('notes'):
-                lines.append(f"    notes: '{escape_ts(entry['notes'])}',")
-            lines.append('  },')
-
-        lines.append('')
-
-    lines.append(']')
-    lines.append('')
+    lines.extend(body)
 
     output = '\n'.join(lines)
 
-    with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
-        f.write(output)
+    if dry_run:
+        print(diff_against(output_path, output), end='')
+        return
+
+    with telemetry.span('write_output', cat='io'):
+        write_atomic(output_path, output)
+
+    state['generate'] = {'entries': blocks, 'body': body_fp}
+    save_state(state, city.state_path)
 
     # Report
-    total = len(entries)
-    for region in REGION_ORDER:
+    total = len(records)
+    for region in city.region_order:
         count = len(by_region[region])
-        print(f"  {REGION_LABELS[region]}: {count} entries")
-    print(f"  Total: {total} entries")
-    print(f"\nGenerated: {OUTPUT_PATH}")
+        print(f"  {labels[region]}: {count} entries")
+    print(f"  Total: {total} entries ({changed} re-rendered)")
+    print(f"\nGenerated: {output_path}")
 
 
 def escape_ts(s):
@@ -98,5 +176,18 @@ def escape_ts(s):
     return s.replace('\\', '\\\\').replace("'", "\\'")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description='Generate src/data/masjids.ts from the canonical dataset.')
+    parser.add_argument('--full', action='store_true',
+                        help='re-render every record, ignoring stored fingerprints')
+    parser.add_argument('--no-merge', dest='merge', action='store_false',
+                        help='render the dataset as it is, without merging masjids_extracted.json')
+    add_city_argument(parser)
+    telemetry.add_arguments(parser)
+    return parser.parse_args()
+
+
 if __name__ == '__main__':
-    generate()
+    args = parse_args()
+    with telemetry.session(args):
+        generate(full=args.full, merge=args.merge, city=CITIES[args.city])
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Cut a short, loudness-normalized preview clip for each downloaded recitation.
+
+Runs after download_youtube_audio.py (and transcode_audio.py, if used).
+For every manifest entry a clip of --length seconds starting at --offset
+is cut from the original download on a process pool, faded in and out,
+normalized with ffmpeg's loudnorm filter (EBU R128) and encoded in the
+same speech profile as transcode_audio.py. If a recording is shorter
+than offset + length, the clip is taken from its end instead (the whole
+recording, if it is shorter than the clip).
+
+The clip is recorded as the "preview" rendition in manifest.json,
+merged into any existing entry so fields added by other steps (such as
+publish_audio.py's hash and url) survive. The public "previewUrl" and
+"fullUrl" are left to publish_audio.py, which points them at the
+content-hashed objects it uploads.
+
+--city cuts previews for another city's audio, in its own directory
+(see city_profiles.py; default Riyadh).
+
+Usage:
+    python scripts/make_audio_previews.py [--city KEY] [--offset S] [--length S] [--fade S] [--loudness LUFS] [--workers N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from city_profiles import CITIES, add_city_argument
+from download_youtube_audio import write_json_atomic
+from transcode_audio import (
+    DEFAULT_WORKERS,
+    RENDITIONS_DIRNAME,
+    SPEECH_BITRATE,
+    SPEECH_SAMPLE_RATE,
+    probe,
+)
+
+PREVIEW_PROFILE = "preview"
+DEFAULT_OFFSET = 30.0
+DEFAULT_LENGTH = 20.0
+DEFAULT_FADE = 1.5
+DEFAULT_LOUDNESS = -16.0  # integrated loudness target, LUFS
+TRUE_PEAK = -1.5
+
+
+def preview_path(audio_dir: Path, masjid_id: str) -> Path:
+    return audio_dir / RENDITIONS_DIRNAME / f"{masjid_id}.{PREVIEW_PROFILE}.m4a"
+
+
+def clip_start(duration: float | None, offset: float, length: float) -> float:
+    """Start of the clip, pulled back so it fits inside a short recording."""
+    if duration is None or offset + length <= duration:
+        return offset
+    return max(0.0, duration - length)
+
+
+def audio_filter(length: float, fade: float, loudness: float) -> str:
+    fade = min(fade, length / 2)
+    return ",".join([
+        f"afade=t=in:st=0:d={fade}",
+        f"afade=t=out:st={length - fade}:d={fade}",
+        f"loudnorm=I={loudness}:TP={TRUE_PEAK}:LRA=11",
+    ])
+
+
+def cut_preview(source: Path, target: Path, start: float, length: float, fade: float,
+                loudness: float, ffmpeg: str = "ffmpeg") -> None:
+    """Cut, fade and normalize a preview clip of `source` into `target` (written atomically)."""
+    tmp_target = target.with_name(target.stem + ".tmp.m4a")
+    subprocess.run(
+        [
+            ffmpeg, "-y", "-v", "error",
+            "-ss", f"{start:.3f}",
+            "-t", f"{length:.3f}",
+            "-i", str(source),
+            "-vn",
+            "-af", audio_filter(length, fade, loudness),
+            "-ac", "1",
+            "-ar", SPEECH_SAMPLE_RATE,
+            "-c:a", "aac",
+            "-b:a", SPEECH_BITRATE,
+            "-movflags", "+faststart",
+            str(tmp_target),
+        ],
+        capture_output=True, text=True, check=True, timeout=600,
+    )
+    os.replace(tmp_target, target)
+
+
+def process_entry(masjid_id: str, info: dict, audio_dir: Path, settings: dict, ffmpeg: str,
+                  ffprobe: str) -> tuple[str, dict | None, str | None]:
+    """Worker: cut one entry's preview (if stale or the settings changed) and probe it.
+
+    Returns (masjid_id, preview rendition, error).
+    """
+    source = audio_dir / info["filename"]
+    target = preview_path(audio_dir, masjid_id)
+    previous = info.get("renditions", {}).get(PREVIEW_PROFILE, {})
+    try:
+        stale = (
+            not target.exists()
+            or target.stat().st_mtime < source.stat().st_mtime
+            or previous.get("settings") != settings
+        )
+        if stale:
+            duration = info.get("renditions", {}).get("original", {}).get("duration")
+            if duration is None:
+                duration = probe(source, ffprobe)["duration"]
+            length = min(settings["length"], duration or settings["length"])
+            start = clip_start(duration, settings["offset"], length)
+            cut_preview(source, target, start, length, settings["fade"], settings["loudness"], ffmpeg)
+        rendition = {
+            "filename": f"{RENDITIONS_DIRNAME}/{target.name}",
+            **probe(target, ffprobe),
+            "settings": settings,
+        }
+        return masjid_id, rendition, None
+    except subprocess.CalledProcessError as e:
+        return masjid_id, None, (e.stderr or "").strip() or str(e)
+    except Exception as e:
+        return masjid_id, None, str(e)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cut loudness-normalized preview clips.")
+    parser.add_argument("--offset", type=float, default=DEFAULT_OFFSET,
+                        help=f"clip start in seconds (default: {DEFAULT_OFFSET})")
+    parser.add_argument("--length", type=float, default=DEFAULT_LENGTH,
+                        help=f"clip length in seconds (default: {DEFAULT_LENGTH})")
+    parser.add_argument("--fade", type=float, default=DEFAULT_FADE,
+                        help=f"fade in/out duration in seconds (default: {DEFAULT_FADE})")
+    parser.add_argument("--loudness", type=float, default=DEFAULT_LOUDNESS,
+                        help=f"integrated loudness target in LUFS (default: {DEFAULT_LOUDNESS})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"parallel ffmpeg processes (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="ffmpeg command (default: ffmpeg)")
+    parser.add_argument("--ffprobe", default="ffprobe", help="ffprobe command (default: ffprobe)")
+    add_city_argument(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.length <= 0 or args.offset < 0 or args.fade < 0:
+        print("ERROR: --length must be positive, --offset and --fade non-negative")
+        sys.exit(1)
+
+    city = CITIES[args.city]
+    audio_dir = Path(city.audio_dir)
+    manifest_path = Path(city.audio_manifest_path)
+    if not manifest_path.exists():
+        print(f"ERROR: {manifest_path} not found. Run download_youtube_audio.py first.")
+        sys.exit(1)
+
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    print(f"Loaded manifest with {len(manifest)} entries")
+
+    (audio_dir / RENDITIONS_DIRNAME).mkdir(parents=True, exist_ok=True)
+    settings = {"offset": args.offset, "length": args.length, "fade": args.fade, "loudness": args.loudness}
+
+    fail_count = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(process_entry, masjid_id, info, audio_dir, settings, args.ffmpeg, args.ffprobe)
+            for masjid_id, info in manifest.items()
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            masjid_id, rendition, error = future.result()
+            if error:
+                print(f"[{done}/{len(futures)}] FAIL {masjid_id}: {error}", flush=True)
+                fail_count += 1
+                continue
+            renditions = manifest[masjid_id].setdefault("renditions", {})
+            renditions.setdefault(PREVIEW_PROFILE, {}).update(rendition)
+            print(f"[{done}/{len(futures)}] OK {masjid_id}: {rendition['bytes'] / 1024:.0f} KB preview", flush=True)
+            write_json_atomic(manifest_path, manifest)
+
+    print(f"\nPreviews for {len(manifest) - fail_count}/{len(manifest)} entries")
+    print(f"  Manifest: {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Canonical masjid dataset shared by the data scripts.
+
+scripts/masjids.json is the single machine-readable source of truth:
+one record per masjid, keyed by its stable id. src/data/masjids.ts is
+rendered from it (generate_masjids_ts.py) and is never parsed back.
+
+Each record holds the Masjid fields (with flat lat/lng) plus
+`sourceAudioUrl`, the audio link as given in the spreadsheet. `audioUrl`
+is what the site plays: the same link, or the R2 URL it was replaced
+with by update_audio_urls.py. Keeping both lets re-extraction from the
+spreadsheet preserve published audio URLs, as long as the source link is
+unchanged.
+
+Each city has its own dataset (see city_profiles.py); the defaults here
+are Riyadh's.
+"""
+
+import json
+import os
+
+from city_profiles import RIYADH
+from pipeline_state import write_if_changed
+
+DATASET_PATH = RIYADH.dataset_path
+
+
+def load_dataset(path=DATASET_PATH):
+    """Return the dataset records, in output order ([] for a city not extracted yet)."""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_dataset(records, path=DATASET_PATH):
+    """Write the dataset unless unchanged. Returns True if written."""
+    content = json.dumps(records, ensure_ascii=False, indent=2) + '\n'
+    return write_if_changed(path, content)
+
+
+def index_by_id(records):
+    return {record['id']: record for record in records}
+
+
+def make_record(entry_id, entry, audio_url=None):
+    """Dataset record for an extracted spreadsheet entry."""
+    record = {
+        'id': entry_id,
+        'readerName': entry['readerName'],
+        'masjidName': entry['masjidName'],
+        'region': entry['region'],
+        'lat': entry['lat'],
+        'lng': entry['lng'],
+        'googleMapsUrl': entry['googleMapsUrl'],
+        'audioUrl': audio_url or entry['audioUrl'],
+    }
+    if entry.get('notes'):
+        record['notes'] = entry['notes']
+    record['sourceAudioUrl'] = entry['audioUrl']
+    return record
+
+
+def assign_ids(entries, city=RIYADH):
+    """Return [(id, entry)] in output order, ids per region in spreadsheet order ('n-001', ...).
+
+    Entries outside the city's regions are dropped. Ids only depend on
+    the spreadsheet rows, not on their extracted coordinates.
+    """
+    by_region = {region: [] for region in city.region_order}
+    for entry in entries:
+        if entry['region'] in by_region:
+            by_region[entry['region']].append(entry)
+    prefix = city.region_prefix
+    return [
+        (f'{prefix[region]}-{idx:03d}', entry)
+        for region in city.region_order
+        for idx, entry in enumerate(by_region[region], 1)
+    ]
+
+
+def merge_extracted(records, extracted, city=RIYADH):
+    """Rebuild the dataset from extracted entries, keeping published audio URLs.
+
+    Ids are assigned by assign_ids. A record keeps its current audioUrl
+    when its sourceAudioUrl still matches the spreadsheet; otherwise the
+    new source link is used.
+    """
+    known = index_by_id(records)
+    merged = []
+    for entry_id, entry in assign_ids(extracted, city):
+        old = known.get(entry_id)
+        keep_audio = old is not None and old.get('sourceAudioUrl') == entry['audioUrl']
+        merged.append(make_record(entry_id, entry, old['audioUrl'] if keep_audio else None))
+    return merged
@@ -0,0 +1,364 @@
+"""
+Run the data pipeline as one dependency graph of stages.
+
+    sheet ──► coordinates ──► dataset ──┬──────────────────► dedup
+      │                                 ├──► publish ──► render
+      └─────► audio ────────────────────┘
+
+    sheet        read the city's spreadsheet
+    coordinates  extract coordinates for every row (extract_coordinates.py)
+    audio        download YouTube audio (download_youtube_audio.py); masjid
+                 ids only depend on the spreadsheet rows, so this runs
+                 alongside coordinate extraction
+    dataset      merge the extracted rows into the canonical dataset and,
+                 for a city with region boundaries, assign regions from
+                 them, reporting contradicted labels (region_boundaries.py)
+    dedup        report records that are the same masjid, and differently
+                 named records at the same location (dedup_masjids.py;
+                 --merged also writes the merged records)
+    publish      point audioUrl at the R2 copies (update_audio_urls.py)
+    render       save the dataset and render masjids.ts and its artifacts
+                 once (generate_masjids_ts.py)
+
+Stages run as soon as their dependencies finish, independent branches in
+parallel, and hand their results to the next stage in memory:
+masjids_extracted.json is not written and masjids.ts is rendered once,
+instead of each script rereading what the previous one wrote.
+
+A stage is skipped when the content hash of its inputs (its dependencies'
+outputs plus the files it reads) matches the last run; its output is then
+taken from .pipeline_cache/ in the city's data directory. --force reruns
+a stage regardless, --skip reuses a stage's last output without checking
+its inputs (e.g. to run without yt-dlp installed). Files are hashed as a
+successful run leaves them, so a rerun with nothing changed skips every
+stage, even though render rewrites the dataset the dataset stage reads.
+Failures are not cached for good, though: coordinates reruns when a
+short URL's failure backoff has run out or a stored resolution is due
+for revalidation (coordinate_cache.py), and audio reruns while the last
+run left downloads in failed.json.
+
+Every city profile (city_profiles.py) is an independent shard with its
+own inputs and outputs. With several cities (all by default, or --city
+repeated), each runs its graph in a process of its own, --jobs at a
+time, so a run takes about as long as its slowest city rather than the
+sum of all of them. Their spans and counters are merged into the trace
+(--trace, --timings), with each city's threads prefixed by its key;
+--profile only sees the parent process, so profile one --city at a time.
+
+Usage:
+    python scripts/pipeline.py [--city KEY ...] [--jobs N] [--full] [--merged]
+        [--force STAGE ...] [--skip STAGE ...]
+        [--trace PATH] [--timings] [--profile cprofile|sample]
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import download_youtube_audio
+import extract_coordinates
+import telemetry
+from city_profiles import CITIES, RIYADH
+from coordinate_cache import CoordinateCache
+from dedup_masjids import dedup
+from generate_masjids_ts import render
+from masjid_dataset import assign_ids, load_dataset, merge_extracted, save_dataset
+from pipeline_state import file_fingerprint, fingerprint, write_atomic
+from region_boundaries import assign_regions, print_mismatches
+from update_audio_urls import update_dataset
+
+# Last output of each stage, inside the city's data directory
+CACHE_DIRNAME = '.pipeline_cache'
+DEFAULT_JOBS = min(len(CITIES), os.cpu_count() or 2)
+
+
+class Stage(NamedTuple):
+    name: str
+    deps: tuple
+    run: Callable  # ({dep name: dep output}) -> JSON-serializable output
+    files: tuple = ()  # files the stage reads, hashed into its key
+    retry: Callable = None  # ({dep name: dep output}) -> True to rerun with unchanged inputs
+
+
+# ── Stages ──
+# Each takes its settings, then {dependency name: output}; build_stages
+# binds the settings with functools.partial.
+
+def read_sheet(city, inputs):
+    return list(extract_coordinates.iter_excel(city))
+
+
+def extract(args, city, inputs):
+    # extract() annotates the rows it is given, so hand it copies
+    rows = [dict(row) for row in inputs['sheet']]
+    return extract_coordinates.extract(args, city, rows=rows, save=False)
+
+
+def coordinates_due(args, city, inputs):
+    """True when a sheet URL's failed resolution may be retried or a stored one revalidated."""
+    if not os.path.exists(city.coordinate_cache_path):
+        return False
+    cache = CoordinateCache(city.coordinate_cache_path, legacy_path=None,
+                            revalidate_after=args.revalidate_days * 86400)
+    try:
+        return cache.due_count({row['googleMapsUrl'] for row in inputs['sheet']}) > 0
+    finally:
+        cache.close()
+
+
+def download(args, city, inputs):
+    entries = download_youtube_audio.youtube_entries([
+        {
+            'id': entry_id,
+            'readerName': row['readerName'],
+            'masjidName': row['masjidName'],
+            'region': row['region'],
+            'sourceAudioUrl': row['audioUrl'],
+        }
+        for entry_id, row in assign_ids(inputs['sheet'], city)
+    ])
+    print(f"Found {len(entries)} YouTube audio entries")
+    if not entries:
+        return {}
+    return download_youtube_audio.download_all(args, entries, Path(city.audio_dir))
+
+
+def downloads_failed(city, inputs):
+    return os.path.exists(os.path.join(city.audio_dir, 'failed.json'))
+
+
+def merge_dataset(city, inputs):
+    records = merge_extracted(load_dataset(city.dataset_path), inputs['coordinates'], city)
+    print_mismatches(assign_regions(records, city))
+    return records
+
+
+def find_duplicates(merged, city, inputs):
+    return dedup(inputs['dataset'], city, merged=merged)
+
+
+def publish_audio(inputs):
+    records = copy.deepcopy(inputs['dataset'])
+    changed, unmatched = update_dataset(records, inputs['audio'])
+    print(f"Pointed {changed} audioUrl entries at R2")
+    for masjid_id, reason in sorted(unmatched.items()):
+        print(f"  Not applied: {masjid_id}: {reason}")
+    return records
+
+
+def render_outputs(full, city, inputs):
+    records = inputs['publish']
+    if save_dataset(records, city.dataset_path):
+        print(f"Dataset written: {city.dataset_path}")
+    render(records, full=full, city=city)
+
+
+def build_stages(args, city):
+    extract_args = extract_coordinates.parse_args(['--full'] if args.full else [])
+    download_args = download_youtube_audio.parse_args([])
+    return [
+        Stage('sheet', (), partial(read_sheet, city), (city.xlsx_path,)),
+        Stage('coordinates', ('sheet',), partial(extract, extract_args, city),
+              retry=partial(coordinates_due, extract_args, city)),
+        Stage('audio', ('sheet',), partial(download, download_args, city), (city.audio_manifest_path,),
+              retry=partial(downloads_failed, city)),
+        Stage('dataset', ('coordinates',), partial(merge_dataset, city),
+              (city.dataset_path, city.boundaries_path)),
+        # The merged records file is hashed only when asked for, so
+        # adding --merged reruns the stage
+        Stage('dedup', ('dataset',), partial(find_duplicates, args.merged, city),
+              (os.path.join(city.data_dir, 'masjids_merged.json'),) if args.merged else ()),
+        Stage('publish', ('dataset', 'audio'), publish_audio),
+        Stage('render', ('publish',), partial(render_outputs, args.full, city), (city.dataset_path, city.ts_path)),
+    ]
+
+
+# ── Runner ──
+
+def log(label, message):
+    # One write per line, so lines from stages running in parallel don't interleave
+    sys.stdout.write(f'[pipeline] {label}: {message}\n')
+    sys.stdout.flush()
+
+
+def cache_path(city, name):
+    return os.path.join(city.data_dir, CACHE_DIRNAME, f'{name}.json')
+
+
+def load_cached(city, name):
+    path = cache_path(city, name)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def stage_key(stage, dep_hashes):
+    return fingerprint({
+        'deps': {dep: dep_hashes[dep] for dep in stage.deps},
+        'files': {path: file_fingerprint(path) for path in stage.files},
+    })
+
+
+def execute(stage, inputs, dep_hashes, city, force, skip):
+    """Run `stage` unless its inputs are unchanged; return (output, output hash, ran)."""
+    label = f'{city.key}/{stage.name}'
+    cached = load_cached(city, stage.name)
+    if skip:
+        if cached is None:
+            raise RuntimeError(f"--skip {stage.name}: no earlier output to reuse")
+        log(label, "skipped, reusing last output")
+        return cached['output'], cached['hash'], False
+    if not force and cached is not None and cached['key'] == stage_key(stage, dep_hashes):
+        if stage.retry is None or not stage.retry(inputs):
+            log(label, "inputs unchanged, skipped")
+            return cached['output'], cached['hash'], False
+        log(label, "inputs unchanged, retrying failures")
+
+    log(label, "running")
+    start = time.perf_counter()
+    with telemetry.span(stage.name):
+        output = stage.run(inputs)
+    # Keyed on the inputs as they are now, so files a stage rewrites
+    # itself (the download manifest) don't trigger a rerun; see rekey()
+    # for files rewritten by later stages
+    result = {'key': stage_key(stage, dep_hashes), 'hash': fingerprint(output), 'output': output}
+    write_atomic(cache_path(city, stage.name), json.dumps(result, ensure_ascii=False))
+    log(label, f"done in {time.perf_counter() - start:.1f}s")
+    return output, result['hash'], True
+
+
+def run_pipeline(stages, city, force=(), skip=()):
+    """Run a city's `stages` in dependency order, independent ones concurrently.
+
+    Returns {stage name: output}. Stops scheduling new stages after a
+    failure, waits for the running ones and re-raises it.
+    """
+    names = {stage.name for stage in stages}
+    for stage in stages:
+        missing = [dep for dep in stage.deps if dep not in names]
+        if missing:
+            raise ValueError(f"stage {stage.name} depends on unknown stages: {', '.join(missing)}")
+
+    outputs, hashes = {}, {}
+    pending = list(stages)
+    running = {}
+    failure = None
+    with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+        while pending or running:
+            if failure is None:
+                for stage in [s for s in pending if all(dep in outputs for dep in s.deps)]:
+                    pending.remove(stage)
+                    inputs = {dep: outputs[dep] for dep in stage.deps}
+                    future = executor.submit(execute, stage, inputs, hashes, city,
+                                             stage.name in force, stage.name in skip)
+                    running[future] = stage
+            if not running:
+                if pending and failure is None:
+                    raise ValueError(f"dependency cycle between: {', '.join(s.name for s in pending)}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    outputs[stage.name], hashes[stage.name], ran = future.result()
+                except BaseException as e:
+                    log(f'{city.key}/{stage.name}', f"failed ({type(e).__name__}: {e})")
+                    failure = failure or e
+                    continue
+                telemetry.count('stages.ran' if ran else 'stages.skipped')
+    if failure is not None:
+        raise failure
+    rekey(stages, city, hashes, skip)
+    return outputs
+
+
+def rekey(stages, city, hashes, skip=()):
+    """Key each stage's cached output on its input files as the run left them.
+
+    Later stages rewrite files earlier ones read (render saves the dataset
+    that the dataset stage merges into), which would otherwise make the
+    next run see changed inputs and redo everything downstream.
+    """
+    for stage in stages:
+        if stage.name in skip or not stage.files:
+            continue
+        cached = load_cached(city, stage.name)
+        key = stage_key(stage, hashes)
+        if cached is not None and cached['key'] != key:
+            cached['key'] = key
+            write_atomic(cache_path(city, stage.name), json.dumps(cached, ensure_ascii=False))
+
+
+def run_city(args, key):
+    """Run one city's pipeline; return True if every stage succeeded."""
+    city = CITIES[key]
+    stages = build_stages(args, city)
+    force = {stage.name for stage in stages} if 'all' in args.force or args.full else set(args.force)
+    try:
+        run_pipeline(stages, city, force=force, skip=set(args.skip))
+    except (Exception, SystemExit):
+        return False
+    return True
+
+
+def run_city_worker(args, key):
+    """run_city in a worker process; returns (ok, its telemetry recording or None)."""
+    with telemetry.worker_session(args) as recorder:
+        ok = run_city(args, key)
+    return ok, recorder.export() if recorder else None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run the masjid data pipeline.')
+    parser.add_argument('--city', action='append', choices=sorted(CITIES), metavar='KEY',
+                        help=f"city to process; repeat for several (default: all of {', '.join(sorted(CITIES))})")
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS,
+                        help=f'cities processed at once, one process each (default: {DEFAULT_JOBS})')
+    parser.add_argument('--full', action='store_true',
+                        help='reprocess every spreadsheet row and re-render every record')
+    parser.add_argument('--merged', action='store_true',
+                        help='have the dedup stage also write masjids_merged.json')
+    parser.add_argument('--force', action='append', default=[], metavar='STAGE',
+                        help="rerun a stage even if its inputs are unchanged ('all' for every stage)")
+    parser.add_argument('--skip', action='append', default=[], metavar='STAGE',
+                        help='reuse the last output of a stage without running it')
+    telemetry.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    names = [stage.name for stage in build_stages(args, RIYADH)]
+    for name in args.force + args.skip:
+        if name not in names and name != 'all':
+            sys.exit(f"Unknown stage {name!r} (stages: {', '.join(names)})")
+    cities = list(dict.fromkeys(args.city or CITIES))
+
+    with telemetry.session(args):
+        if len(cities) == 1:
+            # In-process, so a profiler sees every stage too
+            results = [run_city(args, cities[0])]
+        else:
+            # Cities share no inputs or outputs, so each is a shard of its own
+            with ProcessPoolExecutor(max_workers=min(args.jobs, len(cities))) as executor:
+                results = []
+                for key, (ok, recording) in zip(cities, executor.map(run_city_worker, repeat(args), cities)):
+                    telemetry.merge(recording, key)
+                    results.append(ok)
+
+    failed = [key for key, ok in zip(cities, results) if not ok]
+    if failed:
+        sys.exit(f"Pipeline failed for: {', '.join(failed)}")
+
+
+if __name__ == '__main__':
+    main()
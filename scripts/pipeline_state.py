@@ -0,0 +1,83 @@
+"""
+Pipeline state shared by the data scripts.
+
+Stores a content fingerprint per spreadsheet row (and per generated
+record) in scripts/pipeline_state.json, so reruns only reprocess the rows
+that changed and leave output files untouched when nothing did.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_PATH = os.path.join(SCRIPT_DIR, 'pipeline_state.json')
+
+
+def fingerprint(value):
+    """Stable SHA-256 of a JSON-serializable value."""
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_fingerprint(path):
+    """SHA-256 of a file's bytes, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_state(path=STATE_PATH):
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state, path=STATE_PATH):
+    write_atomic(path, json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True))
+
+
+def write_atomic(path, content):
+    """Write via a temp file and rename, so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    if isinstance(content, bytes):
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_if_changed(path, content):
+    """Write `content` (str or bytes) to `path` unless it already matches. Returns True if written."""
+    if os.path.exists(path):
+        if isinstance(content, bytes):
+            with open(path, 'rb') as f:
+                if f.read() == content:
+                    return False
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                if f.read() == content:
+                    return False
+    write_atomic(path, content)
+    return True
+
+
+def diff_against(path, content):
+    """Unified diff from the current contents of `path` to `content` ('' if equal)."""
+    old = ''
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            old = f.read()
+    return ''.join(difflib.unified_diff(
+        old.splitlines(keepends=True), content.splitlines(keepends=True),
+        fromfile=f'a/{os.path.basename(path)}', tofile=f'b/{os.path.basename(path)}',
+    ))
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Publish downloaded audio to R2 under content-addressed (hashed) names.
+
+Every file referenced by manifest.json (the original download and any
+renditions from transcode_audio.py / make_audio_previews.py) is stored as
+youtube-audio/{sha256 prefix}{ext}. A replaced recording therefore gets a
+new URL, so objects are uploaded with an immutable Cache-Control header,
+and identical recordings shared by several masjids are stored once.
+
+The bucket is listed once per run and only objects it does not already
+hold are uploaded. File hashes are cached in hashes.json by size and
+mtime, so unchanged files are not re-read either.
+
+The manifest gains a "hash" and "url" per rendition, plus top-level
+"hash", "fullUrl" and "previewUrl" pointing at the hashed objects, which
+update_audio_urls.py then writes into masjids.ts.
+
+--bucket-dir publishes into a local directory standing in for the bucket
+(no credentials needed, e.g. for tests). Without it, the R2 bucket is
+reached through its S3-compatible API (requires boto3) using R2_ENDPOINT,
+R2_BUCKET, AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY from the
+environment.
+
+--city publishes another city's audio (see city_profiles.py; default
+Riyadh). Object names are content hashes, so recordings shared between
+cities are stored once.
+
+Usage:
+    python scripts/publish_audio.py [--city KEY] [--bucket-dir DIR] [--dry-run]
+"""
+
+import argparse
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from city_profiles import CITIES, add_city_argument
+from download_youtube_audio import write_json_atomic
+from update_audio_urls import R2_BASE_URL
+
+HASH_CACHE_NAME = "hashes.json"  # inside the city's audio directory
+KEY_PREFIX = "youtube-audio/"
+HASH_LENGTH = 16  # hex chars of SHA-256 kept in the object name
+FULL_PROFILES = ("speech", "original")  # preferred rendition for fullUrl, in order
+PREVIEW_PROFILE = "preview"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+CHUNK_SIZE = 1 << 20
+
+
+class LocalBucket:
+    """A local directory standing in for the R2 bucket."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def keys(self, prefix: str) -> set[str]:
+        base = self.root / prefix
+        if not base.exists():
+            return set()
+        return {f"{prefix}{p.name}" for p in base.iterdir() if p.is_file() and not p.name.endswith(".tmp")}
+
+    def put(self, key: str, path: Path, content_type: str, cache_control: str) -> None:
+        target = self.root / key
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_target = target.with_name(target.name + ".tmp")
+        shutil.copyfile(path, tmp_target)
+        os.replace(tmp_target, target)
+
+
+class S3Bucket:
+    """R2 (or any S3-compatible) bucket via boto3."""
+
+    def __init__(self, bucket: str, endpoint_url: str):
+        try:
+            import boto3
+        except ImportError:
+            print("ERROR: boto3 is not installed.")
+            print("Install with: pip install boto3  (or use --bucket-dir)")
+            sys.exit(1)
+        self.bucket = bucket
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+
+    def keys(self, prefix: str) -> set[str]:
+        keys = set()
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            keys.update(obj["Key"] for obj in page.get("Contents", []))
+        return keys
+
+    def put(self, key: str, path: Path, content_type: str, cache_control: str) -> None:
+        self.client.upload_file(
+            str(path), self.bucket, key,
+            ExtraArgs={"ContentType": content_type, "CacheControl": cache_control},
+        )
+
+
+def file_hash(path: Path, audio_dir: Path, cache: dict) -> str:
+    """SHA-256 of `path`, reusing the cached digest while size and mtime are unchanged."""
+    stat = path.stat()
+    name = str(path.relative_to(audio_dir))
+    cached = cache.get(name)
+    if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+        return cached["sha256"]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    cache[name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+    return cache[name]["sha256"]
+
+
+def object_name(sha256: str, path: Path) -> str:
+    return f"{sha256[:HASH_LENGTH]}{path.suffix}"
+
+
+def content_type(path: Path) -> str:
+    if path.suffix == ".m4a":
+        return "audio/mp4"
+    return mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+
+def entry_renditions(info: dict) -> dict:
+    """Profile -> manifest rendition dict, with the plain download as "original"."""
+    renditions = info.setdefault("renditions", {})
+    renditions.setdefault("original", {"filename": info["filename"]})
+    return renditions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Publish audio to R2 under content-hash names.")
+    parser.add_argument("--bucket-dir", type=Path,
+                        help="publish into this local directory instead of R2")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="report what would be uploaded without uploading or touching the manifest")
+    add_city_argument(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    city = CITIES[args.city]
+    audio_dir = Path(city.audio_dir)
+    manifest_path = Path(city.audio_manifest_path)
+    hash_cache_path = audio_dir / HASH_CACHE_NAME
+
+    if not manifest_path.exists():
+        print(f"ERROR: {manifest_path} not found. Run download_youtube_audio.py first.")
+        sys.exit(1)
+
+    if args.bucket_dir:
+        bucket = LocalBucket(args.bucket_dir)
+        print(f"Bucket: local directory {args.bucket_dir}")
+    else:
+        missing = [name for name in ("R2_ENDPOINT", "R2_BUCKET") if not os.environ.get(name)]
+        if missing:
+            print(f"ERROR: {', '.join(missing)} not set (or pass --bucket-dir)")
+            sys.exit(1)
+        bucket = S3Bucket(os.environ["R2_BUCKET"], os.environ["R2_ENDPOINT"])
+        print(f"Bucket: {os.environ['R2_BUCKET']}")
+
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    hash_cache = {}
+    if hash_cache_path.exists():
+        with open(hash_cache_path, encoding="utf-8") as f:
+            hash_cache = json.load(f)
+
+    existing = bucket.keys(KEY_PREFIX)
+    print(f"Loaded manifest with {len(manifest)} entries; bucket holds {len(existing)} objects")
+
+    # key -> local file, so each distinct recording is uploaded at most once
+    pending: dict[str, Path] = {}
+    file_count = 0
+    missing_files = 0
+    for masjid_id, info in manifest.items():
+        for profile, rendition in entry_renditions(info).items():
+            path = audio_dir / rendition["filename"]
+            if not path.exists():
+                print(f"  WARNING: {masjid_id} {profile}: {path} not found")
+                missing_files += 1
+                continue
+            file_count += 1
+            sha256 = file_hash(path, audio_dir, hash_cache)
+            key = KEY_PREFIX + object_name(sha256, path)
+            rendition["hash"] = sha256
+            rendition["url"] = f"{R2_BASE_URL}/{object_name(sha256, path)}"
+            if key not in existing:
+                pending.setdefault(key, path)
+
+        full = next((info["renditions"][p] for p in FULL_PROFILES
+                     if "url" in info["renditions"].get(p, {})), None)
+        if full:
+            info["hash"] = full["hash"]
+            info["fullUrl"] = full["url"]
+        if "url" in info["renditions"].get(PREVIEW_PROFILE, {}):
+            info["previewUrl"] = info["renditions"][PREVIEW_PROFILE]["url"]
+
+    distinct = len({r["hash"] for info in manifest.values() for r in info["renditions"].values() if "hash" in r})
+    print(f"  Files: {file_count} ({distinct} distinct, {file_count - distinct} duplicates)")
+    print(f"  Already in bucket: {distinct - len(pending)}")
+    print(f"  To upload: {len(pending)} "
+          f"({sum(p.stat().st_size for p in pending.values()) / 1048576:.1f} MB)")
+
+    if args.dry_run:
+        for key, path in sorted(pending.items()):
+            print(f"  would upload {path.relative_to(audio_dir)} -> {key}")
+        return
+
+    uploaded = 0
+    for i, (key, path) in enumerate(sorted(pending.items()), 1):
+        try:
+            bucket.put(key, path, content_type(path), CACHE_CONTROL)
+        except Exception as e:
+            print(f"[{i}/{len(pending)}] FAIL {key}: {e}", flush=True)
+            continue
+        print(f"[{i}/{len(pending)}] PUT {path.relative_to(audio_dir)} -> {key}", flush=True)
+        uploaded += 1
+
+    write_json_atomic(hash_cache_path, hash_cache)
+    # URLs only go into the manifest once every object behind them is in the bucket
+    if uploaded == len(pending):
+        write_json_atomic(manifest_path, manifest)
+        print(f"\nUploaded {uploaded} objects; manifest updated")
+    else:
+        print(f"\nUploaded {uploaded}/{len(pending)} objects; manifest left unchanged, rerun to retry")
+        sys.exit(1)
+    if missing_files:
+        print(f"  Missing local files: {missing_files}")
+    print(f"  Manifest: {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+In-process HTTP redirect resolver for Google Maps short URLs.
+
+Follows 30x chains with HEAD requests over keep-alive connections (one
+pool per thread, keyed by scheme and host), so no response body is ever
+downloaded and repeated lookups skip the TLS handshake and DNS lookup.
+A chain that revisits a URL or runs past max_redirects raises
+RedirectError instead of returning a half-resolved URL.
+
+The network layer is a pluggable transport: anything with a
+`request(method, url, headers) -> (status, headers)` method. Tests can
+point the default HTTPTransport at a local stand-in server, or pass an
+object that serves canned redirect chains.
+"""
+
+import email.utils
+import http.client
+import threading
+import time
+import urllib.parse
+from typing import NamedTuple
+
+DEFAULT_TIMEOUT = 15
+MAX_REDIRECTS = 10
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Google serves plain 30x redirects to curl-like clients
+DEFAULT_HEADERS = {'User-Agent': 'curl/8.4.0', 'Accept': '*/*'}
+
+
+class Resolution(NamedTuple):
+    chain: list  # URLs visited, starting with the requested one
+    resolved: str  # effective URL after /sorry/ unwrapping
+    status: int  # status of the last response
+    retry_after: float | None  # seconds, from a Retry-After header
+
+
+class RedirectError(Exception):
+    """A redirect chain looped or was longer than max_redirects."""
+
+
+class HTTPTransport:
+    """HTTP(S) transport that reuses one keep-alive connection per host per thread."""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def _connections(self):
+        if not hasattr(self.local, 'connections'):
+            self.local.connections = {}
+        return self.local.connections
+
+    def _connect(self, scheme, netloc):
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def request(self, method, url, headers=None):
+        """Send one request and return (status, headers) without reading a body."""
+        parsed = urllib.parse.urlsplit(url)
+        key = (parsed.scheme, parsed.netloc)
+        target = parsed.path or '/'
+        if parsed.query:
+            target += '?' + parsed.query
+
+        connections = self._connections()
+        # A pooled connection may have been closed by the server; retry once fresh
+        for attempt in range(2):
+            conn = connections.get(key)
+            if conn is None:
+                conn = connections[key] = self._connect(parsed.scheme, parsed.netloc)
+            try:
+                conn.request(method, target, headers=headers or {})
+                response = conn.getresponse()
+                if method == 'HEAD':
+                    response.read()  # no body; marks the connection reusable
+                else:
+                    conn.close()
+                    del connections[key]
+                return response.status, response.headers
+            except (http.client.HTTPException, ConnectionError):
+                conn.close()
+                connections.pop(key, None)
+                if attempt:
+                    raise
+
+    def close(self):
+        for conn in self._connections().values():
+            conn.close()
+        self._connections().clear()
+
+
+class RedirectResolver:
+    """Follow redirect chains and unwrap Google's /sorry/ interstitial."""
+
+    def __init__(self, transport=None, max_redirects=MAX_REDIRECTS, headers=None):
+        self.transport = transport or HTTPTransport()
+        self.max_redirects = max_redirects
+        self.headers = headers or DEFAULT_HEADERS
+
+    def follow(self, url):
+        """Follow redirects from `url` and return a Resolution.
+
+        Raises RedirectError on a loop or after more than max_redirects hops.
+        """
+        chain = [url]
+        # One request per hop, plus the one that ends the chain
+        for _ in range(self.max_redirects + 1):
+            status, headers = self.transport.request('HEAD', chain[-1], self.headers)
+            if status in (405, 501):
+                # Server refuses HEAD; fall back to GET (body is never read)
+                status, headers = self.transport.request('GET', chain[-1], self.headers)
+            location = headers.get('Location') if status in REDIRECT_STATUSES else None
+            if not location:
+                return Resolution(chain, unwrap_sorry(chain[-1]), status,
+                                  parse_retry_after(headers.get('Retry-After')))
+            next_url = urllib.parse.urljoin(chain[-1], location)
+            if next_url in chain:
+                raise RedirectError(f'redirect loop back to {next_url}')
+            chain.append(next_url)
+        raise RedirectError(f'more than {self.max_redirects} redirects from {url}')
+
+    def resolve(self, url):
+        """Return the effective URL after redirects and /sorry/ unwrapping."""
+        return self.follow(url).resolved
+
+
+def parse_retry_after(value):
+    """Retry-After as seconds from now (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def unwrap_sorry(resolved):
+    """Replace Google's sorry/CAPTCHA page with the URL it would continue to."""
+    if '/sorry/' in resolved:
+        parsed = urllib.parse.urlparse(resolved)
+        params = urllib.parse.parse_qs(parsed.query)
+        continue_url = params.get('continue', [''])[0]
+        if continue_url:
+            return urllib.parse.unquote(continue_url)
+    return resolved
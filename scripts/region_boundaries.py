@@ -0,0 +1,245 @@
+"""
+Assign masjid regions from region boundary polygons.
+
+The spreadsheet's region column is free text typed per row, so a
+mislabelled row would be rendered, colored and filtered under the wrong
+region. When a city has a boundary file (region_boundaries.geojson in its
+data directory), each located record's region is the polygon containing
+it, and the spreadsheet label is only a cross-check: every disagreement
+is reported. Records without coordinates, or outside every polygon, keep
+their label. Masjid ids still come from the label (see
+masjid_dataset.assign_ids), so they stay stable when a region changes.
+
+The boundary file is a GeoJSON FeatureCollection of Polygon or
+MultiPolygon features with a `region` property (the region key), and
+must come from surveyed boundaries. Without one the feature is off and
+the spreadsheet regions are used as they are; no city ships one yet.
+
+Classification is vectorized with NumPy against a grid index built once
+per boundary file and saved next to it (region_index.npz, rebuilt when
+the boundaries change). Cells that no polygon edge passes through lie
+wholly in one region (or none) and classify their points with a single
+lookup; only points in cells crossed by an edge get an exact even-odd
+point-in-polygon test, run for all of them at once per ring.
+
+Usage:
+    python scripts/region_boundaries.py [--city KEY] [--build]
+"""
+
+import argparse
+import io
+import json
+import os
+
+import numpy as np
+
+from city_profiles import CITIES, RIYADH, add_city_argument
+from masjid_dataset import load_dataset
+from pipeline_state import file_fingerprint, write_atomic
+
+GRID_SIZE = 256
+OUTSIDE = -1
+BOUNDARY = -2
+
+
+def load_boundaries(path):
+    """Return [(region, [ring as an (n, 2) lng/lat array])] from a GeoJSON file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        collection = json.load(f)
+    boundaries = []
+    for feature in collection['features']:
+        geometry = feature['geometry']
+        polygons = [geometry['coordinates']] if geometry['type'] == 'Polygon' else geometry['coordinates']
+        rings = [np.asarray(ring, dtype=np.float64)[:, :2] for polygon in polygons for ring in polygon]
+        boundaries.append((feature['properties']['region'], rings))
+    return boundaries
+
+
+def points_in_rings(x, y, rings):
+    """Even-odd test of points (x, y) against a region's rings (holes included)."""
+    inside = np.zeros(len(x), dtype=bool)
+    for ring in rings:
+        x1, y1 = ring[:-1, 0], ring[:-1, 1]
+        x2, y2 = ring[1:, 0], ring[1:, 1]
+        for ax, ay, bx, by in zip(x1, y1, x2, y2):
+            if ay == by:
+                continue
+            crosses = (ay > y) != (by > y)
+            inside ^= crosses & (x < (bx - ax) * (y - ay) / (by - ay) + ax)
+    return inside
+
+
+class RegionIndex:
+    """Grid index over region polygons; classify() labels many points in one pass."""
+
+    def __init__(self, regions, rings, cells, grid):
+        self.regions = regions  # region key per polygon group
+        self.rings = rings  # per region, its rings as (n, 2) lng/lat arrays
+        self.cells = cells  # (size, size) region index, OUTSIDE or BOUNDARY
+        self.x0, self.y0, self.cell_w, self.cell_h = grid
+        self.size = len(cells)
+
+    @classmethod
+    def build(cls, boundaries, grid_size=GRID_SIZE):
+        regions = [region for region, _ in boundaries]
+        rings = [rings for _, rings in boundaries]
+        points = np.concatenate([ring for region_rings in rings for ring in region_rings])
+        x0, y0 = points.min(axis=0)
+        x1, y1 = points.max(axis=0)
+        grid = (x0, y0, (x1 - x0) / grid_size or 1.0, (y1 - y0) / grid_size or 1.0)
+        index = cls(regions, rings, np.zeros((grid_size, grid_size), dtype=np.int64), grid)
+
+        # Cells touched by an edge's bounding box need the exact test
+        boundary = np.zeros((grid_size, grid_size), dtype=bool)
+        for region_rings in rings:
+            for ring in region_rings:
+                for (ax, ay), (bx, by) in zip(ring[:-1], ring[1:]):
+                    c0, c1 = sorted(index._cols(np.array([ax, bx])))
+                    r0, r1 = sorted(index._rows(np.array([ay, by])))
+                    boundary[r0:r1 + 1, c0:c1 + 1] = True
+
+        # Every other cell lies wholly in the region containing its centre
+        rows, cols = np.mgrid[0:grid_size, 0:grid_size]
+        cx = x0 + (cols.ravel() + 0.5) * index.cell_w
+        cy = y0 + (rows.ravel() + 0.5) * index.cell_h
+        index.cells = index._exact(cx, cy).reshape(grid_size, grid_size)
+        index.cells[boundary] = BOUNDARY
+        return index
+
+    def to_bytes(self, source):
+        """The index as .npz bytes, tagged with the fingerprint of its boundary file."""
+        flat = [(owner, ring) for owner, region_rings in enumerate(self.rings) for ring in region_rings]
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            source=np.array(source),
+            regions=np.array(self.regions),
+            cells=self.cells,
+            grid=np.array([self.x0, self.y0, self.cell_w, self.cell_h]),
+            ring_owner=np.array([owner for owner, _ in flat], dtype=np.int64),
+            ring_sizes=np.array([len(ring) for _, ring in flat], dtype=np.int64),
+            ring_points=np.concatenate([ring for _, ring in flat]),
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_file(cls, path, source):
+        """Load a saved index; None if it was built from other boundaries."""
+        with np.load(path, allow_pickle=False) as saved:
+            if str(saved['source']) != source:
+                return None
+            regions = [str(region) for region in saved['regions']]
+            rings = [[] for _ in regions]
+            splits = np.cumsum(saved['ring_sizes'])[:-1]
+            for owner, ring in zip(saved['ring_owner'], np.split(saved['ring_points'], splits)):
+                rings[owner].append(ring)
+            return cls(regions, rings, saved['cells'], tuple(saved['grid']))
+
+    def _cols(self, x):
+        return np.clip(((x - self.x0) / self.cell_w).astype(np.int64), 0, self.size - 1)
+
+    def _rows(self, y):
+        return np.clip(((y - self.y0) / self.cell_h).astype(np.int64), 0, self.size - 1)
+
+    def _exact(self, x, y):
+        result = np.full(len(x), OUTSIDE, dtype=np.int64)
+        for index, rings in enumerate(self.rings):
+            open_points = result == OUTSIDE
+            if not open_points.any():
+                break
+            hits = points_in_rings(x[open_points], y[open_points], rings)
+            result[np.flatnonzero(open_points)[hits]] = index
+        return result
+
+    def classify(self, lat, lng):
+        """Region key for each point, or None outside every polygon."""
+        x = np.asarray(lng, dtype=np.float64)
+        y = np.asarray(lat, dtype=np.float64)
+        result = self.cells[self._rows(y), self._cols(x)]
+        # Points beyond the grid clip into an edge cell, so check them exactly too
+        beyond = (x < self.x0) | (x > self.x0 + self.size * self.cell_w) \
+            | (y < self.y0) | (y > self.y0 + self.size * self.cell_h)
+        result[beyond] = BOUNDARY
+        exact = result == BOUNDARY
+        if exact.any():
+            result[exact] = self._exact(x[exact], y[exact])
+        return [self.regions[i] if i != OUTSIDE else None for i in result]
+
+
+_indexes = {}
+
+
+def load_index(city=RIYADH):
+    """The city's region index, or None when it has no boundary file.
+
+    Loaded from region_index.npz when that was built from the current
+    boundaries, built and saved otherwise, and kept for the process.
+    """
+    source = file_fingerprint(city.boundaries_path)
+    if source is None:
+        return None
+    key = (city.boundaries_path, source)
+    if key not in _indexes:
+        index = None
+        if os.path.exists(city.region_index_path):
+            index = RegionIndex.from_file(city.region_index_path, source)
+        if index is None:
+            index = RegionIndex.build(load_boundaries(city.boundaries_path))
+            write_atomic(city.region_index_path, index.to_bytes(source))
+        _indexes[key] = index
+    return _indexes[key]
+
+
+def assign_regions(records, city=RIYADH):
+    """Set each located record's region from the city's boundaries.
+
+    Returns the records whose spreadsheet label disagreed, as dicts (id,
+    masjidName, label, region), with region None for points outside every
+    polygon (those keep their label). Returns None, leaving the records as
+    they are, when the city has no boundary file.
+    """
+    index = load_index(city)
+    if index is None:
+        return None
+    located = [r for r in records if r.get('lat') is not None]
+    regions = index.classify([r['lat'] for r in located], [r['lng'] for r in located]) if located else []
+
+    mismatches = []
+    for record, region in zip(located, regions):
+        if region != record['region']:
+            mismatches.append({
+                'id': record['id'], 'masjidName': record['masjidName'],
+                'label': record['region'], 'region': region,
+            })
+        if region is not None:
+            record['region'] = region
+    return mismatches
+
+
+def print_mismatches(mismatches):
+    if mismatches is None:
+        print("No region boundaries; keeping spreadsheet regions")
+        return
+    print(f"Region labels contradicted by boundaries: {len(mismatches)}")
+    for m in mismatches:
+        found = m['region'] or 'outside every region'
+        print(f"  {m['id']}: labelled {m['label']}, located in {found} ({m['masjidName']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the dataset's region labels against the boundaries.")
+    parser.add_argument('--build', action='store_true',
+                        help='only (re)build the saved region index')
+    add_city_argument(parser)
+    args = parser.parse_args()
+    city = CITIES[args.city]
+    if args.build:
+        index = load_index(city)
+        print(f"Region index: {city.region_index_path}" if index else f"No region boundaries for {city.name}")
+        return
+    records = load_dataset(city.dataset_path)
+    print_mismatches(assign_regions(records, city))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""
+Static spatial index and k-nearest-neighbour precomputation.
+
+Points are stored as 3-D unit vectors, so straight-line (chord) distance
+orders points exactly like great-circle distance, anywhere on the globe.
+The KD-tree is laid out kdbush-style in flat arrays: for every index
+range [lo, hi] the element at (lo + hi) // 2 is the node, split on axis
+depth % 3. Each masjid's nearest neighbours are found here once, so the
+client only looks them up, and the tree itself is exported for queries
+from any point, such as the user's location: the client walks the same
+arrays (src/lib/spatial-index.ts) instead of building a tree on every
+page load.
+
+Used by generate_masjids_ts.py to emit src/data/masjid-index.ts (the
+neighbours) and src/data/masjid-kdtree.ts (the tree, loaded on demand).
+"""
+
+import heapq
+import json
+import math
+
+from pipeline_state import write_if_changed
+
+EARTH_RADIUS_M = 6371008.8
+NEIGHBOR_COUNT = 8
+COORD_DECIMALS = 7
+
+
+def unit_vector(lat, lng):
+    lat, lng = math.radians(lat), math.radians(lng)
+    return (math.cos(lat) * math.cos(lng), math.cos(lat) * math.sin(lng), math.sin(lat))
+
+
+def chord_to_metres(chord2):
+    """Great-circle distance for a squared chord length between unit vectors."""
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(chord2) / 2))
+
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+class KDTree:
+    """Static 3-D KD-tree over (lat, lng) points, in flat kdbush-style order."""
+
+    def __init__(self, points):
+        # order[i] is the index into `points` of the i-th tree slot
+        self.order = list(range(len(points)))
+        self.coords = [unit_vector(lat, lng) for lat, lng in points]
+        self._build(0, len(self.order) - 1, 0)
+
+    def _build(self, lo, hi, axis):
+        if lo >= hi:
+            return
+        # Sorting the range puts the median at the middle slot
+        self.order[lo:hi + 1] = sorted(self.order[lo:hi + 1], key=lambda i: self.coords[i][axis])
+        mid = (lo + hi) // 2
+        self._build(lo, mid - 1, (axis + 1) % 3)
+        self._build(mid + 1, hi, (axis + 1) % 3)
+
+    def nearest(self, lat, lng, k, exclude=None):
+        """Return [(distance_m, point index)] of the k points nearest to (lat, lng)."""
+        target = unit_vector(lat, lng)
+        heap = []  # max-heap of (-chord2, index), size <= k
+
+        def search(lo, hi, axis):
+            if lo > hi:
+                return
+            mid = (lo + hi) // 2
+            idx = self.order[mid]
+            point = self.coords[idx]
+            if idx != exclude:
+                d2 = sum((a - b) ** 2 for a, b in zip(point, target))
+                if len(heap) < k:
+                    heapq.heappush(heap, (-d2, idx))
+                elif d2 < -heap[0][0]:
+                    heapq.heapreplace(heap, (-d2, idx))
+            delta = target[axis] - point[axis]
+            near, far = ((lo, mid - 1), (mid + 1, hi)) if delta < 0 else ((mid + 1, hi), (lo, mid - 1))
+            search(*near, (axis + 1) % 3)
+            if len(heap) < k or delta * delta < -heap[0][0]:
+                search(*far, (axis + 1) % 3)
+
+        search(0, len(self.order) - 1, 0)
+        return sorted((chord_to_metres(-d2), idx) for d2, idx in heap)
+
+
+def nearest_neighbors(records, k=NEIGHBOR_COUNT):
+    """Map each record id to its k nearest [id, metres] pairs, nearest first.
+
+    Also returns the KDTree, for render_tree_module().
+    """
+    tree = KDTree([(r['lat'], r['lng']) for r in records])
+    return {
+        record['id']: [[records[j]['id'], round(d)] for d, j in tree.nearest(record['lat'], record['lng'], k, exclude=i)]
+        for i, record in enumerate(records)
+    }, tree
+
+
+def js(value):
+    # Ids are plain 'n-001'-style strings, so swapping quotes is safe
+    return json.dumps(value, ensure_ascii=False, separators=(', ', ': ')).replace('"', "'")
+
+
+def render_index_module(records, neighbors, k=NEIGHBOR_COUNT):
+    """TypeScript module with each masjid's precomputed neighbours."""
+    lines = [
+        '/**',
+        ' * Masjid Spatial Index',
+        ' *',
+        ' * Auto-generated by scripts/generate_masjids_ts.py from the masjid dataset.',
+        ' * Each masjid\'s nearest neighbours with great-circle distances.',
+        ' */',
+        '',
+        f'export const NEIGHBOR_COUNT = {k}',
+        '',
+        '/** Masjid id -> nearest masjids as [id, distance in metres], nearest first */',
+        'export const NEAREST_MASJIDS: Record<string, [string, number][]> = {',
+    ]
+    for record in records:
+        lines.append(f"  '{record['id']}': {js(neighbors[record['id']])},")
+    lines.extend([
+        '}',
+        '',
+    ])
+    return '\n'.join(lines)
+
+
+def render_tree_module(records, tree):
+    """TypeScript module with the KD-tree arrays."""
+    ids = [records[i]['id'] for i in tree.order]
+    coords = [round(c, COORD_DECIMALS) for i in tree.order for c in tree.coords[i]]
+    return '\n'.join([
+        '/**',
+        ' * Masjid KD-Tree',
+        ' *',
+        ' * Auto-generated by scripts/generate_masjids_ts.py from the masjid dataset.',
+        ' * Static KD-tree over unit vectors, queried by src/lib/spatial-index.ts.',
+        ' * Loaded on demand by src/lib/masjid-chunks.ts when a search needs it.',
+        ' */',
+        '',
+        '/** KD-tree node order (kdbush layout: the median of each range is its node) */',
+        f'export const KD_IDS: string[] = {js(ids)}',
+        '',
+        '/** Unit vectors of KD_IDS, flattened as x, y, z */',
+        f'export const KD_COORDS: number[] = {js(coords)}',
+        '',
+    ])
+
+
+def write_index_modules(index_path, tree_path, records, k=NEIGHBOR_COUNT):
+    """Write the neighbour and KD-tree modules unless unchanged. Returns the paths written."""
+    neighbors, tree = nearest_neighbors(records, k)
+    modules = {
+        index_path: render_index_module(records, neighbors, k),
+        tree_path: render_tree_module(records, tree),
+    }
+    return [path for path, content in modules.items() if write_if_changed(path, content)]
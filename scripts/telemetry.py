@@ -0,0 +1,347 @@
+"""
+Instrumentation shared by the pipeline scripts.
+
+Scripts wrap their stages in spans, and count events such as cache hits
+and misses:
+
+    with telemetry.span('load_cache'):
+        ...
+    with telemetry.span('resolve', cat='network', url=url):
+        ...
+    telemetry.count('cache.hit')
+
+Every span is also a latency sample for its name, so per-item spans
+(one per row or download) give a histogram. Its category adds to a
+running total: 'network' for time spent waiting on remote hosts,
+'subprocess' for child processes such as yt-dlp, 'wait' for rate limits,
+backoff and queueing, 'io' for file reads and writes. A span inside
+another span of the same category on the same thread (a script's stages
+inside a pipeline stage) is already part of that span's time, so only
+the outermost one adds to the total.
+
+Nothing is recorded unless a session is active. Scripts add the options
+with add_arguments(parser) and run their work inside session(args):
+
+    --trace PATH            write the trace as JSON (spans plus summary)
+    --trace-format chrome   write Chrome trace-event JSON instead, for
+                            chrome://tracing or https://ui.perfetto.dev
+    --timings               print the summary without writing a trace
+    --profile cprofile      profile the main thread with cProfile (pstats file)
+    --profile sample        sample every thread's stack every few ms and
+                            write collapsed stacks (flamegraph.pl, speedscope)
+    --profile-out PATH      where to write the profile
+
+Work done in worker processes records inside worker_session(args) and
+hands Recorder.export() back to the parent, which adds it to its own
+session with merge(); the worker's threads are named after it in the
+trace. Profiles are not merged: --profile only covers the process that
+opened the session.
+"""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+CATEGORIES = ('stage', 'network', 'subprocess', 'wait', 'io')
+# The span around a whole session, left out of the category totals
+SESSION_CATEGORY = 'session'
+SAMPLE_INTERVAL = 0.005
+SUMMARY_TOP = 15
+
+_recorder = None
+
+
+class Recorder:
+    """Thread-safe store of finished spans and counters."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.wall_origin = time.time()  # lines up recordings from other processes
+        self.spans = []
+        self.counters = {}
+        self.threads = {}
+        self.lock = threading.Lock()
+
+    def add_span(self, name, cat, start, end, args):
+        thread = threading.current_thread()
+        with self.lock:
+            self.threads[thread.ident] = thread.name
+            self.spans.append((name, cat, start - self.origin, end - start, thread.ident, args))
+
+    def add_count(self, name, n):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def export(self):
+        """Everything recorded so far, as a picklable dict for merge()."""
+        with self.lock:
+            return {'wall_origin': self.wall_origin, 'spans': list(self.spans),
+                    'counters': dict(self.counters), 'threads': dict(self.threads)}
+
+    def merge(self, recording, label):
+        """Add another process's export(), its threads renamed '<label>/<thread>'."""
+        shift = recording['wall_origin'] - self.wall_origin
+        with self.lock:
+            # Thread ids are only unique within a process, so give the
+            # worker's threads fresh ones
+            next_tid = max(self.threads, default=0) + 1
+            tids = {}
+            for tid, thread_name in recording['threads'].items():
+                tids[tid] = next_tid
+                self.threads[next_tid] = f'{label}/{thread_name}'
+                next_tid += 1
+            for name, cat, start, duration, tid, args in recording['spans']:
+                self.spans.append((name, cat, start + shift, duration, tids[tid], args))
+            for name, n in recording['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + n
+
+
+@contextmanager
+def _span(recorder, name, cat, args):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add_span(name, cat, start, time.perf_counter(), args)
+
+
+def span(name, cat='stage', **args):
+    """Context manager timing one stage or item; a no-op outside a session."""
+    recorder = _recorder
+    if recorder is None:
+        return nullcontext()
+    return _span(recorder, name, cat, args)
+
+
+def count(name, n=1):
+    recorder = _recorder
+    if recorder is not None:
+        recorder.add_count(name, n)
+
+
+def merge(recording, label):
+    """Add a worker process's Recorder.export() to the active session, if any."""
+    recorder = _recorder
+    if recorder is not None and recording is not None:
+        recorder.merge(recording, label)
+
+
+# ── Summary and export ──
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def outermost(spans):
+    """Spans not nested in another span of the same category on the same thread."""
+    open_until = {}  # (thread, category) -> end of the enclosing span
+    result = []
+    # Parents first: by start, the longer of two spans starting together first
+    for span in sorted(spans, key=lambda s: (s[2], -s[3])):
+        _, cat, start, duration, tid, _ = span
+        if start < open_until.get((tid, cat), float('-inf')):
+            continue
+        open_until[(tid, cat)] = start + duration
+        result.append(span)
+    return result
+
+
+def summarize(recorder):
+    durations = {}
+    for name, _, _, duration, _, _ in recorder.spans:
+        durations.setdefault(name, []).append(duration)
+    categories = {cat: 0.0 for cat in CATEGORIES}
+    for _, cat, _, duration, _, _ in outermost(recorder.spans):
+        if cat != SESSION_CATEGORY:
+            categories[cat] = categories.get(cat, 0.0) + duration
+
+    histograms = {}
+    for name, samples in durations.items():
+        ordered = sorted(samples)
+        histograms[name] = {
+            'count': len(ordered),
+            'total_s': round(sum(ordered), 6),
+            'min_s': round(ordered[0], 6),
+            'p50_s': round(percentile(ordered, 0.5), 6),
+            'p90_s': round(percentile(ordered, 0.9), 6),
+            'p99_s': round(percentile(ordered, 0.99), 6),
+            'max_s': round(ordered[-1], 6),
+        }
+    return {
+        'wall_s': round(time.perf_counter() - recorder.origin, 6),
+        'categories_s': {cat: round(total, 6) for cat, total in categories.items()},
+        'histograms': histograms,
+        'counters': dict(sorted(recorder.counters.items())),
+    }
+
+
+def json_trace(recorder, summary):
+    return {
+        'spans': [
+            {
+                'name': name, 'cat': cat, 'start_s': round(start, 6), 'duration_s': round(duration, 6),
+                'thread': recorder.threads.get(tid, str(tid)), 'args': args,
+            }
+            for name, cat, start, duration, tid, args in recorder.spans
+        ],
+        'summary': summary,
+    }
+
+
+def chrome_trace(recorder, summary):
+    pid = os.getpid()
+    events = [
+        {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}}
+        for tid, thread_name in recorder.threads.items()
+    ]
+    for name, cat, start, duration, tid, args in recorder.spans:
+        events.append({
+            'name': name, 'cat': cat, 'ph': 'X', 'pid': pid, 'tid': tid,
+            'ts': round(start * 1e6, 3), 'dur': round(duration * 1e6, 3),
+            'args': {key: str(value) for key, value in args.items()},
+        })
+    end = round(summary['wall_s'] * 1e6, 3)
+    for name, value in summary['counters'].items():
+        events.append({'name': name, 'ph': 'C', 'pid': pid, 'ts': end, 'args': {'count': value}})
+    return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': summary}
+
+
+def print_summary(summary):
+    print(f"\nTimings ({summary['wall_s']:.2f} s wall):")
+    categories = [f"{cat} {total:.2f} s" for cat, total in summary['categories_s'].items() if total]
+    if categories:
+        print(f"  By category: {', '.join(categories)}")
+    ranked = sorted(summary['histograms'].items(), key=lambda item: -item[1]['total_s'])
+    for name, h in ranked[:SUMMARY_TOP]:
+        print(f"  {name:<24} {h['total_s']:9.3f} s  x{h['count']:<6} "
+              f"p50 {h['p50_s'] * 1000:8.1f} ms  p90 {h['p90_s'] * 1000:8.1f} ms  max {h['max_s'] * 1000:8.1f} ms")
+    for name, value in summary['counters'].items():
+        print(f"  {name:<24} {value}")
+
+
+# ── Profilers ──
+
+class SamplingProfiler:
+    """Samples every thread's Python stack on a timer and counts collapsed stacks."""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = {}
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='telemetry-sampler', daemon=True)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self.stopped.wait(self.interval):
+            for tid, frame in sys._current_frames().items():
+                if tid == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+                    frame = frame.f_back
+                key = ';'.join(reversed(stack))
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self, path):
+        self.stopped.set()
+        self.thread.join()
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, samples in sorted(self.stacks.items(), key=lambda item: -item[1]):
+                f.write(f'{stack} {samples}\n')
+
+
+class CProfiler:
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self, path):
+        self.profile.disable()
+        self.profile.dump_stats(path)
+
+
+PROFILERS = {'cprofile': (CProfiler, '.prof'), 'sample': (SamplingProfiler, '.folded')}
+
+
+# ── Command line ──
+
+def add_arguments(parser):
+    group = parser.add_argument_group('telemetry')
+    group.add_argument('--trace', metavar='PATH',
+                       help='write per-stage spans, histograms and counters to PATH')
+    group.add_argument('--trace-format', choices=('json', 'chrome'), default='json',
+                       help='trace file format (default: json)')
+    group.add_argument('--timings', action='store_true',
+                       help='print a timing summary at the end of the run')
+    group.add_argument('--profile', choices=sorted(PROFILERS),
+                       help='profile the run with cProfile or a sampling profiler')
+    group.add_argument('--profile-out', metavar='PATH',
+                       help='profile output (default: <script>.prof or <script>.folded)')
+
+
+@contextmanager
+def worker_session(args):
+    """Record in a worker process of a session started with the same args.
+
+    Yields the Recorder (None when the session records no spans), whose
+    export() the worker returns to the parent.
+    """
+    global _recorder
+    if not (getattr(args, 'trace', None) or getattr(args, 'timings', False)):
+        yield None
+        return
+    recorder = _recorder = Recorder()
+    try:
+        yield recorder
+    finally:
+        _recorder = None
+
+
+@contextmanager
+def session(args):
+    """Record spans and run the requested profiler for the duration of the block."""
+    global _recorder
+    trace = getattr(args, 'trace', None)
+    timings = getattr(args, 'timings', False)
+    profile = getattr(args, 'profile', None)
+    if not (trace or timings or profile):
+        yield
+        return
+
+    script = os.path.splitext(os.path.basename(sys.argv[0]))[0] or 'pipeline'
+    profiler = profile_path = None
+    if profile:
+        profiler_class, suffix = PROFILERS[profile]
+        profiler = profiler_class()
+        profile_path = getattr(args, 'profile_out', None) or f'{script}{suffix}'
+
+    recorder = _recorder = Recorder()
+    if profiler:
+        profiler.start()
+    try:
+        with span(script, cat=SESSION_CATEGORY):
+            yield
+    finally:
+        if profiler:
+            profiler.stop(profile_path)
+            print(f"\nProfile written to {profile_path}")
+        _recorder = None
+        summary = summarize(recorder)
+        if trace:
+            export = chrome_trace if args.trace_format == 'chrome' else json_trace
+            with open(trace, 'w', encoding='utf-8') as f:
+                json.dump(export(recorder, summary), f, ensure_ascii=False)
+            print(f"Trace written to {trace}")
+        if trace or timings:
+            print_summary(summary)
@@ -0,0 +1,24 @@
+import math
+
+from batch_decode import decode_plus_codes
+from extract_coordinates import decode_plus_code
+
+
+def test_plus_codes_match_scalar_decoder():
+    codes = ['MJ8G+QX', 'MJ8G+QXG', 'mj8g+qx', 'MJ8G+Q', '8GGFMJ8G+QX', 'XXXX+XX']
+    lat, lng, valid = decode_plus_codes(codes)
+    for i, code in enumerate(codes):
+        expected = decode_plus_code(code)
+        if expected is None:
+            assert not valid[i] and math.isnan(lat[i]) and math.isnan(lng[i])
+        else:
+            assert valid[i] and (lat[i], lng[i]) == expected
+
+
+def test_non_ascii_code_is_invalid_without_failing_the_batch():
+    codes = ['MJ8G+QX', 'مسجد+١٢', 'MJ8G+QXG']
+    lat, lng, valid = decode_plus_codes(codes)
+    assert decode_plus_code(codes[1]) is None
+    assert valid.tolist() == [True, False, True]
+    assert math.isnan(lat[1]) and math.isnan(lng[1])
+    assert (lat[0], lng[0]) == decode_plus_code(codes[0])
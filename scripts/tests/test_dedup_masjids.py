@@ -0,0 +1,30 @@
+from dedup_masjids import build_report, conflict_report, find_duplicates, merge_groups
+
+METRE = 1 / 111320  # degrees of latitude
+
+
+def record(record_id, name, lat, lng=46.7):
+    return {'id': record_id, 'masjidName': name, 'readerName': f'Reader {record_id}', 'lat': lat, 'lng': lng}
+
+
+def test_same_location_with_different_names_is_a_conflict():
+    records = [
+        record('a', 'القيروان، جامع نورة الجميح', 24.7),
+        record('b', 'الرحمانية، جامع الأميرة لطيفة', 24.7),
+        record('c', 'جامع الراجحي', 24.8),
+        record('d', 'مسجد الراجحى', 24.8 + 5 * METRE),  # same building, spelled differently
+    ]
+    pairs = find_duplicates(records)
+    assert [(p['i'], p['j'], p['reason']) for p in pairs] == [(0, 1, 'conflict'), (2, 3, 'similar_name')]
+
+    report = build_report(records, pairs)
+    assert [group['ids'] for group in report] == [['c', 'd']]
+    assert [c['ids'] for c in conflict_report(records, pairs)] == [['a', 'b']]
+    assert [r['id'] for r in merge_groups(records, report)] == ['a', 'b', 'c']
+
+
+def test_nearby_variant_spelling_needs_only_the_lower_threshold():
+    records = [record('a', 'جامع الملك فهد', 24.7), record('b', 'جامع الملك فهد بن عبدالعزيز', 24.7 + 5 * METRE)]
+    pairs = find_duplicates(records)
+    assert [p['reason'] for p in pairs] == ['same_location']
+    assert find_duplicates(records, near_threshold=0.9)[0]['reason'] == 'conflict'
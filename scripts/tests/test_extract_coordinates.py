@@ -0,0 +1,43 @@
+import time
+from types import SimpleNamespace
+
+import extract_coordinates
+from city_profiles import RIYADH
+from coordinate_cache import CoordinateCache
+
+URL = 'https://maps.app.goo.gl/abc'
+RESOLVED = 'https://www.google.com/maps/place/x/@24.7500000,46.7000000,17z'
+ROW = {
+    'readerName': 'Reader', 'masjidName': 'Masjid', 'region': 'north', 'region_ar': 'الشمال',
+    'googleMapsUrl': URL, 'audioUrl': '', 'notes': '',
+}
+
+
+def run_extract(city, monkeypatch, *argv):
+    resolved = []
+
+    def resolve(url, limiter, resolver=None, city=RIYADH):
+        resolved.append(url)
+        resolution = SimpleNamespace(chain=[url, RESOLVED], resolved=RESOLVED, retry_after=None, status=200)
+        return extract_coordinates.extract_from_resolved(RESOLVED, city), resolution, None
+
+    monkeypatch.setattr(extract_coordinates, 'resolve_and_extract', resolve)
+    output = extract_coordinates.extract(extract_coordinates.parse_args(list(argv)), city,
+                                         rows=[dict(ROW)], save=False)
+    return output, resolved
+
+
+def test_stale_resolution_is_revalidated_despite_cached_coordinates(tmp_path, monkeypatch):
+    city = RIYADH._replace(key='test', data_dir=str(tmp_path))
+    output, resolved = run_extract(city, monkeypatch)
+    assert resolved == [URL]
+    assert (output[0]['lat'], output[0]['lng']) == (24.75, 46.7)
+
+    # Unchanged row, fresh resolution: answered without the network
+    assert run_extract(city, monkeypatch)[1] == []
+
+    cache = CoordinateCache(city.coordinate_cache_path, legacy_path=None)
+    cache.db.execute('UPDATE resolutions SET resolved_at = ?', (time.time() - 2 * 86400,))
+    cache.close()
+    assert run_extract(city, monkeypatch, '--revalidate-days', '3')[1] == []
+    assert run_extract(city, monkeypatch, '--revalidate-days', '1')[1] == [URL]
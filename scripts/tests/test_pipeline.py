@@ -0,0 +1,99 @@
+import os
+from types import SimpleNamespace
+
+import pipeline
+from city_profiles import RIYADH
+from coordinate_cache import CoordinateCache
+
+ROWS = [
+    {
+        'readerName': f'Reader {i}',
+        'masjidName': f'Masjid {i}',
+        'region': region,
+        'lat': 24.7 + i / 100,
+        'lng': 46.6 + i / 100,
+        'googleMapsUrl': f'https://maps.app.goo.gl/{i}',
+        'audioUrl': f'https://youtu.be/{i}',
+    }
+    for i, region in enumerate(['north', 'north', 'east', 'westSouth'])
+]
+
+
+def make_city(tmp_path):
+    return RIYADH._replace(
+        key='test',
+        data_dir=str(tmp_path / 'data'),
+        src_dir=str(tmp_path / 'src'),
+        public_dir=str(tmp_path / 'public'),
+        public_url='/data/test',
+        audio_dir=str(tmp_path / 'audio'),
+    )
+
+
+def make_stages(city):
+    # Replace the stages that read the spreadsheet, the network and
+    # yt-dlp; dataset, dedup, publish and render run for real
+    fixed = {'sheet': ROWS, 'coordinates': ROWS, 'audio': {}}
+    args = SimpleNamespace(full=False, merged=False)
+    return [
+        stage._replace(run=lambda inputs, output=fixed[stage.name]: output) if stage.name in fixed else stage
+        for stage in pipeline.build_stages(args, city)
+    ]
+
+
+def test_second_run_is_fully_cached(tmp_path, capsys):
+    city = make_city(tmp_path)
+    pipeline.run_pipeline(make_stages(city), city)
+    first = capsys.readouterr().out
+    assert first.count(': running') == 7
+
+    pipeline.run_pipeline(make_stages(city), city)
+    second = capsys.readouterr().out
+    assert ': running' not in second
+    assert second.count('inputs unchanged, skipped') == 7
+
+
+def test_edited_dataset_reruns_from_the_dataset_stage(tmp_path, capsys):
+    city = make_city(tmp_path)
+    pipeline.run_pipeline(make_stages(city), city)
+    with open(city.dataset_path, 'a', encoding='utf-8') as f:
+        f.write('\n')
+    capsys.readouterr()
+
+    pipeline.run_pipeline(make_stages(city), city)
+    out = capsys.readouterr().out
+    assert 'test/dataset: running' in out
+    assert 'test/coordinates: inputs unchanged, skipped' in out
+
+
+def test_failed_downloads_are_retried(tmp_path, capsys):
+    city = make_city(tmp_path)
+    pipeline.run_pipeline(make_stages(city), city)
+    os.makedirs(city.audio_dir)
+    with open(os.path.join(city.audio_dir, 'failed.json'), 'w', encoding='utf-8') as f:
+        f.write('[]')
+    capsys.readouterr()
+
+    pipeline.run_pipeline(make_stages(city), city)
+    out = capsys.readouterr().out
+    assert 'test/audio: inputs unchanged, retrying failures' in out
+    assert 'test/coordinates: inputs unchanged, skipped' in out
+
+
+def test_failed_resolution_is_retried_once_its_backoff_runs_out(tmp_path, capsys):
+    city = make_city(tmp_path)
+    pipeline.run_pipeline(make_stages(city), city)
+    url = ROWS[0]['googleMapsUrl']
+    cache = CoordinateCache(city.coordinate_cache_path, legacy_path=None)
+    cache.put_resolution(url, [url], failure='HTTP 429')
+    cache.close()
+    capsys.readouterr()
+
+    pipeline.run_pipeline(make_stages(city), city)
+    assert 'test/coordinates: inputs unchanged, skipped' in capsys.readouterr().out
+
+    cache = CoordinateCache(city.coordinate_cache_path, legacy_path=None, negative_ttl=0)
+    cache.put_resolution(url, [url], failure='HTTP 429')
+    cache.close()
+    pipeline.run_pipeline(make_stages(city), city)
+    assert 'test/coordinates: inputs unchanged, retrying failures' in capsys.readouterr().out
@@ -0,0 +1,140 @@
+import email.utils
+import http.server
+import threading
+import time
+
+import pytest
+
+from redirect_resolver import HTTPTransport, RedirectError, RedirectResolver, parse_retry_after, unwrap_sorry
+
+SHORT = 'https://maps.app.goo.gl/abc'
+PLACE = 'https://www.google.com/maps/place/x/@24.75,46.7,17z'
+
+
+class CannedTransport:
+    """Serves {url: (status, headers)} and records every request."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def request(self, method, url, headers=None):
+        self.requests.append((method, url))
+        response = self.responses[url]
+        if callable(response):
+            return response(method)
+        return response
+
+
+def redirect(location, status=302):
+    return status, {'Location': location}
+
+
+def test_redirect_chain_is_followed_with_head_requests():
+    transport = CannedTransport({
+        SHORT: redirect('https://goo.gl/maps/abc', 301),
+        'https://goo.gl/maps/abc': redirect('/maps/place/x/@24.75,46.7,17z'),
+        'https://goo.gl/maps/place/x/@24.75,46.7,17z': redirect(PLACE, 307),
+        PLACE: (200, {}),
+    })
+    resolution = RedirectResolver(transport).follow(SHORT)
+    assert resolution.chain == [
+        SHORT, 'https://goo.gl/maps/abc', 'https://goo.gl/maps/place/x/@24.75,46.7,17z', PLACE,
+    ]
+    assert resolution.resolved == PLACE
+    assert resolution.status == 200
+    assert resolution.retry_after is None
+    assert {method for method, _ in transport.requests} == {'HEAD'}
+
+
+@pytest.mark.parametrize('refused', [405, 501])
+def test_head_refused_falls_back_to_get(refused):
+    transport = CannedTransport({
+        SHORT: lambda method: (refused, {}) if method == 'HEAD' else redirect(PLACE),
+        PLACE: (200, {}),
+    })
+    assert RedirectResolver(transport).resolve(SHORT) == PLACE
+    assert transport.requests == [('HEAD', SHORT), ('GET', SHORT), ('HEAD', PLACE)]
+
+
+def test_sorry_page_is_unwrapped_and_its_retry_after_kept():
+    sorry = 'https://www.google.com/sorry/index?continue=' + PLACE.replace(':', '%3A').replace('/', '%2F')
+    transport = CannedTransport({
+        SHORT: redirect(sorry),
+        sorry: (429, {'Retry-After': '120'}),
+    })
+    resolution = RedirectResolver(transport).follow(SHORT)
+    assert resolution.chain == [SHORT, sorry]
+    assert resolution.resolved == PLACE
+    assert (resolution.status, resolution.retry_after) == (429, 120.0)
+
+
+def test_unwrap_sorry():
+    assert unwrap_sorry('https://www.google.com/sorry/index?continue=https%3A%2F%2Fmaps.google.com%2F%3Fq%3D1') \
+        == 'https://maps.google.com/?q=1'
+    assert unwrap_sorry('https://www.google.com/sorry/index?q=abc') == 'https://www.google.com/sorry/index?q=abc'
+    assert unwrap_sorry(PLACE) == PLACE
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('30') == 30.0
+    assert parse_retry_after(' 5 ') == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+    later = parse_retry_after(email.utils.formatdate(time.time() + 60, usegmt=True))
+    assert 55 <= later <= 60
+    assert parse_retry_after(email.utils.formatdate(time.time() - 60, usegmt=True)) == 0.0
+
+
+def test_redirect_loop_raises():
+    transport = CannedTransport({
+        SHORT: redirect('https://goo.gl/a'),
+        'https://goo.gl/a': redirect('https://goo.gl/b'),
+        'https://goo.gl/b': redirect('https://goo.gl/a'),
+    })
+    with pytest.raises(RedirectError, match='loop'):
+        RedirectResolver(transport).follow(SHORT)
+    assert len(transport.requests) == 3
+
+
+def test_too_many_redirects_raises():
+    hops = {f'https://goo.gl/{i}': redirect(f'https://goo.gl/{i + 1}') for i in range(3)}
+    transport = CannedTransport({**hops, 'https://goo.gl/3': (200, {})})
+    assert RedirectResolver(transport, max_redirects=3).resolve('https://goo.gl/0') == 'https://goo.gl/3'
+    with pytest.raises(RedirectError, match='more than 2 redirects'):
+        RedirectResolver(transport, max_redirects=2).follow('https://goo.gl/0')
+
+
+class StandIn(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_HEAD(self):
+        if self.path == '/short':
+            self.send_response(302)
+            self.send_header('Location', '/maps/place/x/@24.75,46.7,17z')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        self.server.connections.add(self.client_address)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_http_transport_against_a_local_server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StandIn)
+    server.connections = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    transport = HTTPTransport(timeout=5)
+    try:
+        resolver = RedirectResolver(transport)
+        for _ in range(2):
+            assert resolver.resolve(f'{base}/short') == f'{base}/maps/place/x/@24.75,46.7,17z'
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+    # All four requests went over one keep-alive connection
+    assert len(server.connections) == 1
@@ -0,0 +1,90 @@
+import json
+
+import numpy as np
+
+import region_boundaries
+from city_profiles import RIYADH
+from region_boundaries import RegionIndex, assign_regions, load_boundaries, load_index, points_in_rings
+
+# west: 46.0-46.5 with a hole at 46.2-46.3; east: 46.5-47.0, both 24.0-25.0
+BOUNDARIES = {
+    'type': 'FeatureCollection',
+    'features': [
+        {
+            'type': 'Feature',
+            'properties': {'region': 'westSouth'},
+            'geometry': {'type': 'Polygon', 'coordinates': [
+                [[46.0, 24.0], [46.5, 24.0], [46.5, 25.0], [46.0, 25.0], [46.0, 24.0]],
+                [[46.2, 24.4], [46.3, 24.4], [46.3, 24.6], [46.2, 24.6], [46.2, 24.4]],
+            ]},
+        },
+        {
+            'type': 'Feature',
+            'properties': {'region': 'east'},
+            'geometry': {'type': 'MultiPolygon', 'coordinates': [
+                [[[46.5, 24.0], [47.0, 24.0], [47.0, 25.0], [46.5, 25.0], [46.5, 24.0]]],
+            ]},
+        },
+    ],
+}
+
+
+def make_city(tmp_path, boundaries=BOUNDARIES):
+    city = RIYADH._replace(key='test', data_dir=str(tmp_path))
+    if boundaries:
+        with open(city.boundaries_path, 'w', encoding='utf-8') as f:
+            json.dump(boundaries, f)
+    return city
+
+
+def record(record_id, region, lat, lng):
+    return {'id': record_id, 'masjidName': record_id, 'region': region, 'lat': lat, 'lng': lng}
+
+
+def test_regions_come_from_polygons_and_labels_are_cross_checked(tmp_path):
+    records = [
+        record('a', 'westSouth', 24.2, 46.1),
+        record('b', 'north', 24.2, 46.8),  # mislabelled
+        record('c', 'westSouth', 24.5, 46.25),  # in the hole
+        record('d', 'north', None, None),
+    ]
+    mismatches = assign_regions(records, make_city(tmp_path))
+    assert [r['region'] for r in records] == ['westSouth', 'east', 'westSouth', 'north']
+    assert mismatches == [
+        {'id': 'b', 'masjidName': 'b', 'label': 'north', 'region': 'east'},
+        {'id': 'c', 'masjidName': 'c', 'label': 'westSouth', 'region': None},
+    ]
+
+
+def test_without_boundaries_records_are_unchanged(tmp_path):
+    records = [record('a', 'north', 24.2, 46.8)]
+    assert assign_regions(records, make_city(tmp_path, boundaries=None)) is None
+    assert records[0]['region'] == 'north'
+
+
+def test_grid_index_matches_exact_test(tmp_path):
+    boundaries = load_boundaries(make_city(tmp_path).boundaries_path)
+    index = RegionIndex.build(boundaries, grid_size=32)
+    rng = np.random.default_rng(0)
+    lat, lng = rng.uniform(23.9, 25.1, 20000), rng.uniform(45.9, 47.1, 20000)
+
+    expected = [None] * len(lat)
+    for region, rings in reversed(boundaries):
+        for i in np.flatnonzero(points_in_rings(lng, lat, rings)):
+            expected[i] = region
+    assert index.classify(lat, lng) == expected
+
+
+def test_index_is_saved_and_rebuilt_when_boundaries_change(tmp_path, monkeypatch):
+    city = make_city(tmp_path)
+    monkeypatch.setattr(region_boundaries, '_indexes', {})
+    built = load_index(city)
+    saved = RegionIndex.from_file(city.region_index_path, region_boundaries.file_fingerprint(city.boundaries_path))
+    assert saved is not None
+    assert np.array_equal(saved.cells, built.cells)
+    assert saved.classify([24.2, 24.2], [46.1, 46.8]) == ['westSouth', 'east']
+
+    moved = json.loads(json.dumps(BOUNDARIES))
+    moved['features'][0]['properties']['region'] = 'north'
+    make_city(tmp_path, moved)
+    assert load_index(city).classify([24.2], [46.1]) == ['north']
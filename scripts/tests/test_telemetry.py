@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+import telemetry
+
+
+def test_nested_spans_of_a_category_are_counted_once():
+    recorder = telemetry.Recorder()
+    recorder.spans = [
+        # name, cat, start, duration, thread, args
+        ('render', 'stage', 0.0, 1.0, 1, {}),
+        ('render_entries', 'stage', 0.1, 0.3, 1, {}),
+        ('write_output', 'io', 0.5, 0.2, 1, {}),
+        ('vector_tiles', 'stage', 0.6, 0.4, 1, {}),
+        # Same times on another thread: a separate stage, counted too
+        ('audio', 'stage', 0.1, 0.5, 2, {}),
+        ('dedup', 'stage', 1.0, 0.5, 1, {}),
+    ]
+    summary = telemetry.summarize(recorder)
+    assert summary['categories_s']['stage'] == 2.0
+    assert summary['categories_s']['io'] == 0.2
+    assert summary['histograms']['render_entries']['count'] == 1
+
+
+def test_worker_recording_is_merged_into_the_session():
+    args = SimpleNamespace(trace=None, timings=True, profile=None)
+    with telemetry.worker_session(args) as worker:
+        with telemetry.span('extract'):
+            telemetry.count('cache.hit', 2)
+
+    parent = telemetry.Recorder()
+    # Started 10 s after the parent's session
+    recording = {**worker.export(), 'wall_origin': parent.wall_origin + 10}
+    parent.add_count('cache.hit', 1)
+    parent.merge(recording, 'jeddah')
+    parent.merge(recording, 'riyadh')
+
+    assert parent.counters == {'cache.hit': 5}
+    assert sorted(parent.threads.values()) == ['jeddah/MainThread', 'riyadh/MainThread']
+    first, second = parent.spans
+    assert first[0] == 'extract' and first[4] != second[4]
+    assert abs(first[2] - (recording['spans'][0][2] + 10)) < 1e-6
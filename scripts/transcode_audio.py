@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Transcode downloaded audio into a small, streamable speech rendition.
+
+Runs after download_youtube_audio.py. Each file listed in manifest.json
+is transcoded with ffmpeg on a process pool into a fixed low-bitrate
+speech profile (mono AAC-LC in an .m4a container) with the moov atom
+moved to the front (faststart), so playback starts before the download
+completes. The duration, bitrate and byte size of both the original and
+the speech rendition are recorded under "renditions" in manifest.json,
+updating only those two entries so the preview rendition and the hashes
+and URLs written by publish_audio.py are kept.
+
+Renditions newer than their source are not transcoded again.
+
+--city transcodes another city's audio, in its own directory (see
+city_profiles.py; default Riyadh).
+
+Usage:
+    python scripts/transcode_audio.py [--city KEY] [--workers N] [--ffmpeg CMD] [--ffprobe CMD]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from city_profiles import CITIES, add_city_argument
+from download_youtube_audio import write_json_atomic
+
+RENDITIONS_DIRNAME = "renditions"  # inside the city's audio directory
+
+# Speech profile: mono, 48 kbps AAC-LC at 44.1 kHz
+SPEECH_PROFILE = "speech"
+SPEECH_BITRATE = "48k"
+SPEECH_SAMPLE_RATE = "44100"
+DEFAULT_WORKERS = os.cpu_count() or 2
+
+
+def rendition_path(audio_dir: Path, masjid_id: str) -> Path:
+    return audio_dir / RENDITIONS_DIRNAME / f"{masjid_id}.{SPEECH_PROFILE}.m4a"
+
+
+def probe(path: Path, ffprobe: str = "ffprobe") -> dict:
+    """Return {"duration", "bitrate", "bytes"} for an audio file via ffprobe."""
+    result = subprocess.run(
+        [
+            ffprobe, "-v", "error",
+            "-show_entries", "format=duration,bit_rate",
+            "-of", "json",
+            str(path),
+        ],
+        capture_output=True, text=True, check=True, timeout=60,
+    )
+    fmt = json.loads(result.stdout).get("format", {})
+    return {
+        "duration": round(float(fmt["duration"]), 3) if fmt.get("duration") else None,
+        "bitrate": int(fmt["bit_rate"]) if fmt.get("bit_rate") else None,
+        "bytes": path.stat().st_size,
+    }
+
+
+def transcode(source: Path, target: Path, ffmpeg: str = "ffmpeg") -> None:
+    """Transcode `source` into the speech profile at `target` (written atomically)."""
+    tmp_target = target.with_name(target.stem + ".tmp.m4a")
+    subprocess.run(
+        [
+            ffmpeg, "-y", "-v", "error",
+            "-i", str(source),
+            "-vn",
+            "-ac", "1",
+            "-ar", SPEECH_SAMPLE_RATE,
+            "-c:a", "aac",
+            "-b:a", SPEECH_BITRATE,
+            "-movflags", "+faststart",
+            str(tmp_target),
+        ],
+        capture_output=True, text=True, check=True, timeout=600,
+    )
+    os.replace(tmp_target, target)
+
+
+def process_entry(masjid_id: str, filename: str, audio_dir: Path, ffmpeg: str,
+                  ffprobe: str) -> tuple[str, dict | None, str | None]:
+    """Worker: transcode one manifest entry (if stale) and probe both renditions.
+
+    Returns (masjid_id, renditions, error).
+    """
+    source = audio_dir / filename
+    target = rendition_path(audio_dir, masjid_id)
+    try:
+        if not target.exists() or target.stat().st_mtime < source.stat().st_mtime:
+            transcode(source, target, ffmpeg)
+        renditions = {
+            "original": {"filename": filename, **probe(source, ffprobe)},
+            SPEECH_PROFILE: {"filename": f"{RENDITIONS_DIRNAME}/{target.name}", **probe(target, ffprobe)},
+        }
+        return masjid_id, renditions, None
+    except subprocess.CalledProcessError as e:
+        return masjid_id, None, (e.stderr or "").strip() or str(e)
+    except Exception as e:
+        return masjid_id, None, str(e)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Transcode downloaded audio into a speech rendition.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"parallel ffmpeg processes (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="ffmpeg command (default: ffmpeg)")
+    parser.add_argument("--ffprobe", default="ffprobe", help="ffprobe command (default: ffprobe)")
+    add_city_argument(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    city = CITIES[args.city]
+    audio_dir = Path(city.audio_dir)
+    manifest_path = Path(city.audio_manifest_path)
+
+    if not manifest_path.exists():
+        print(f"ERROR: {manifest_path} not found. Run download_youtube_audio.py first.")
+        sys.exit(1)
+
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    print(f"Loaded manifest with {len(manifest)} entries")
+
+    (audio_dir / RENDITIONS_DIRNAME).mkdir(parents=True, exist_ok=True)
+
+    fail_count = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(process_entry, masjid_id, info["filename"], audio_dir, args.ffmpeg, args.ffprobe)
+            for masjid_id, info in manifest.items()
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            masjid_id, renditions, error = future.result()
+            if error:
+                print(f"[{done}/{len(futures)}] FAIL {masjid_id}: {error}", flush=True)
+                fail_count += 1
+                continue
+            original, speech = renditions["original"], renditions[SPEECH_PROFILE]
+            print(f"[{done}/{len(futures)}] OK {masjid_id}: "
+                  f"{original['bytes'] / 1024:.0f} KB -> {speech['bytes'] / 1024:.0f} KB", flush=True)
+            existing = manifest[masjid_id].setdefault("renditions", {})
+            for profile, rendition in renditions.items():
+                existing.setdefault(profile, {}).update(rendition)
+            write_json_atomic(manifest_path, manifest)
+
+    transcoded = [i["renditions"] for i in manifest.values() if SPEECH_PROFILE in i.get("renditions", {})]
+    total_before = sum(r["original"]["bytes"] for r in transcoded)
+    total_after = sum(r[SPEECH_PROFILE]["bytes"] for r in transcoded)
+    print(f"\nTranscoded {len(manifest) - fail_count}/{len(manifest)} entries")
+    if total_before:
+        print(f"  Total size: {total_before / 1048576:.1f} MB -> {total_after / 1048576:.1f} MB")
+    print(f"  Manifest: {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
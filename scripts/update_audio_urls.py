@@ -1,67 +1,179 @@
 #!/usr/bin/env python3
 """
-Update audioUrl entries in masjids.ts to point to R2-hosted files.
-
-Reads the manifest.json from the download step and replaces YouTube URLs
-in masjids.ts with the corresponding R2 URLs.
+Update audioUrl entries to point to R2-hosted files.
+
+Reads the manifest.json from the download step and compiles it once
+into a mapping per masjid id (and per source URL). Each masjid's
+audioUrl in the canonical dataset (scripts/masjids.json) is then set
+with a single lookup, and masjids.ts is re-rendered once. Entries
+published by publish_audio.py link their content-addressed "fullUrl";
+otherwise the speech rendition from transcode_audio.py is linked when
+one exists, falling back to the original download.
+
+A manifest entry is only applied while the dataset's source link still
+matches the one it was downloaded from. Entries that could not be
+applied are reported at the end.
+
+--file rewrites the audioUrl literals of any other file (e.g. a
+hand-maintained masjids.ts) in one streaming pass, looking each URL up
+in the source URL -> R2 URL mapping. --dry-run prints a unified diff
+instead of writing anything. Stages can be timed with the telemetry.py
+options (--trace, --timings, --profile). --city updates another city's
+dataset from its own manifest (see city_profiles.py; default Riyadh).
 
 Usage:
-    python scripts/update_audio_urls.py
+    python scripts/update_audio_urls.py [--city KEY] [--dry-run] [--file PATH] [--trace PATH] [--timings]
 """
 
+import argparse
 import json
+import os
 import re
+import tempfile
 from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-MASJIDS_TS = PROJECT_ROOT / "src" / "data" / "masjids.ts"
-MANIFEST = PROJECT_ROOT / "downloads" / "youtube-audio" / "manifest.json"
+import telemetry
+from city_profiles import CITIES, add_city_argument
+from generate_masjids_ts import render
+from masjid_dataset import index_by_id, load_dataset, save_dataset
+from pipeline_state import diff_against
 
 R2_BASE_URL = "https://masjid.nawaf-alsheddi.com/youtube-audio"
 
+# An audioUrl property with a single-quoted TS string literal
+AUDIO_URL_PATTERN = re.compile(r"(audioUrl:\s*')((?:[^'\\]|\\.)*)(')")
 
-def main():
-    # Load manifest
-    with open(MANIFEST, encoding="utf-8") as f:
-        manifest = json.load(f)
 
-    print(f"Loaded manifest with {len(manifest)} entries")
+def r2_url(info: dict) -> str:
+    filename = info.get("renditions", {}).get("speech", {}).get("filename", info["filename"])
+    return info.get("fullUrl") or f"{R2_BASE_URL}/{filename}"
+
 
-    # Read masjids.ts
-    content = MASJIDS_TS.read_text(encoding="utf-8")
-    original = content
+def update_dataset(records: list[dict], manifest: dict) -> tuple[int, dict[str, str]]:
+    """Point each manifest entry's record at its R2 URL.
 
-    # Replace each YouTube audioUrl with R2 URL
-    replaced = 0
+    Returns (records changed, {masjid_id: reason} for entries not applied).
+    """
+    by_id = index_by_id(records)
+    changed = 0
+    unmatched = {}
     for masjid_id, info in manifest.items():
-        source_url = info["sourceUrl"]
-        filename = info["filename"]
-        r2_url = f"{R2_BASE_URL}/{filename}"
-
-        # Escape the source URL for regex (special chars like ?, &, etc.)
-        escaped = re.escape(source_url)
-        pattern = f"audioUrl: '{escaped}'"
-        replacement = f"audioUrl: '{r2_url}'"
-
-        new_content = re.sub(pattern, replacement, content)
-        if new_content != content:
-            replaced += 1
-            content = new_content
+        record = by_id.get(masjid_id)
+        if record is None:
+            unmatched[masjid_id] = "not in the dataset"
+            continue
+        if record["sourceAudioUrl"] != info["sourceUrl"]:
+            unmatched[masjid_id] = f"source audio changed since download: {record['sourceAudioUrl']}"
+            continue
+        url = r2_url(info)
+        if record["audioUrl"] != url:
+            record["audioUrl"] = url
+            changed += 1
+    return changed, unmatched
+
+
+def rewrite_lines(lines, url_map: dict[str, str], matched: set[str]):
+    """Yield `lines` with every mapped audioUrl literal replaced, recording matched sources."""
+    def replace(match):
+        url = match.group(2).replace("\\'", "'").replace("\\\\", "\\")
+        target = url_map.get(url)
+        if target is None:
+            return match.group(0)
+        matched.add(url)
+        return match.group(1) + target.replace("\\", "\\\\").replace("'", "\\'") + match.group(3)
+
+    for line in lines:
+        yield AUDIO_URL_PATTERN.sub(replace, line) if "audioUrl" in line else line
+
+
+def rewrite_file(path: Path, manifest: dict, dry_run: bool = False) -> tuple[int, dict[str, str]]:
+    """Rewrite audioUrl literals in `path` in one streaming pass.
+
+    Returns (URLs replaced, {masjid_id: reason} for entries not found).
+    """
+    url_map = {info["sourceUrl"]: r2_url(info) for info in manifest.values()}
+    matched: set[str] = set()
+
+    with open(path, encoding="utf-8") as src:
+        if dry_run:
+            content = "".join(rewrite_lines(src, url_map, matched))
+            print(diff_against(str(path), content), end="")
         else:
-            print(f"  WARNING: Could not find audioUrl for {masjid_id}: {source_url}")
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as dst:
+                dst.writelines(rewrite_lines(src, url_map, matched))
+    if not dry_run:
+        if matched:
+            os.replace(tmp_path, path)
+        else:
+            os.remove(tmp_path)
+
+    unmatched = {
+        masjid_id: f"audioUrl not found: {info['sourceUrl']}"
+        for masjid_id, info in manifest.items()
+        if info["sourceUrl"] not in matched
+    }
+    return len(matched), unmatched
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Point audioUrl entries at R2-hosted files.")
+    parser.add_argument("--dry-run", action="store_true", help="print a diff instead of writing")
+    parser.add_argument("--file", type=Path,
+                        help="rewrite audioUrl literals in this file instead of updating the dataset")
+    add_city_argument(parser)
+    telemetry.add_arguments(parser)
+    return parser.parse_args()
+
 
-    # Write back
+def main():
+    args = parse_args()
+    with telemetry.session(args):
+        update(args)
+
+
+def update(args):
+    city = CITIES[args.city]
+    # Load manifest
+    with telemetry.span("load_manifest", cat="io"), open(city.audio_manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    print(f"Loaded manifest with {len(manifest)} entries")
+
+    if args.file:
+        with telemetry.span("rewrite_file", cat="io"):
+            replaced, unmatched = rewrite_file(args.file, manifest, dry_run=args.dry_run)
+        target = args.file
+    else:
+        with telemetry.span("load_dataset", cat="io"):
+            records = load_dataset(city.dataset_path)
+        with telemetry.span("update_dataset"):
+            replaced, unmatched = update_dataset(records, manifest)
+        target = "the dataset"
+        if replaced > 0:
+            if not args.dry_run:
+                with telemetry.span("save_dataset", cat="io"):
+                    save_dataset(records, city.dataset_path)
+            render(records, dry_run=args.dry_run, city=city)
+    telemetry.count("audio_url.updated", replaced)
+    telemetry.count("audio_url.unmatched", len(unmatched))
+
+    # Report
+    action = "Would update" if args.dry_run else "Updated"
     if replaced > 0:
-        MASJIDS_TS.write_text(content, encoding="utf-8")
-        print(f"\nUpdated {replaced} audioUrl entries in masjids.ts")
+        print(f"\n{action} {replaced} audioUrl entries in {target}")
     else:
         print("\nNo changes made")
-
-    # Verify
-    youtube_remaining = len(re.findall(r"audioUrl:.*youtu", content))
-    r2_count = len(re.findall(r"audioUrl:.*masjid\.nawaf-alsheddi\.com", content))
-    print(f"  YouTube URLs remaining: {youtube_remaining}")
-    print(f"  R2 URLs: {r2_count}")
+    if unmatched:
+        print(f"  Not applied: {len(unmatched)}")
+        for masjid_id, reason in sorted(unmatched.items()):
+            print(f"    {masjid_id}: {reason}")
+
+    if not args.file:
+        youtube_remaining = sum("youtu" in r["sourceAudioUrl"] and r["audioUrl"] == r["sourceAudioUrl"] for r in records)
+        r2_count = sum(r["audioUrl"].startswith(R2_BASE_URL) for r in records)
+        print(f"  YouTube URLs remaining: {youtube_remaining}")
+        print(f"  R2 URLs: {r2_count}")
 
 
 if __name__ == "__main__":
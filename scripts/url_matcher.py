@@ -0,0 +1,90 @@
+"""
+Single-pass scanner for coordinate sources in Google Maps URLs.
+
+One compiled alternation finds every source in one scan of the URL:
+@lat,lng, !3d..!4d.., ftid / !1s S2 cell IDs and the q= parameter (which
+may hold a Plus Code). Percent-encoded separators are decoded in place
+instead of unquoting the whole URL, and the q= value is searched for a
+Plus Code without being decoded at all.
+
+Candidates are ranked by confidence (lower is better), matching the
+order extract_coordinates.py has always tried them in.
+"""
+
+import re
+import urllib.parse
+from typing import NamedTuple
+
+RANKS = {
+    '@coords': 0,
+    '!3d!4d': 1,
+    's2cell': 2,
+    'plus_code': 3,
+}
+
+# Every branch starts with one of a few marker characters, so the regex
+# engine skips ahead with a single character-set test per position
+COORD_SOURCE_PATTERN = re.compile(
+    r'[@!f?&]'
+    r'(?:(?<=@)(?P<at_lat>[-\d.]+),(?P<at_lng>[-\d.]+)'
+    r'|(?<=!)3d(?P<d3_lat>[-\d.]+)!4d(?P<d4_lng>[-\d.]+)'
+    r'|(?:(?<=!)1s|(?<=f)tid=)(?P<s2>0x[0-9a-f]+):0x[0-9a-f]+'
+    # Captured inside a lookahead so sources within the q= value are still scanned
+    r'|(?<=[?&])q=(?=(?P<q>[^&#]*)))'
+)
+# Percent-encoded forms of the separators above; decoding just these is far
+# cheaper than unquoting the whole (often Arabic, fully encoded) URL
+ENCODED_SEPARATOR_PATTERN = re.compile(r'%(?:40|21|2[Cc]|3[AaDdFf]|26)')
+ENCODED_SEPARATORS = {
+    '%40': '@', '%21': '!', '%2C': ',', '%2c': ',', '%3A': ':', '%3a': ':',
+    '%3D': '=', '%3d': '=', '%3F': '?', '%3f': '?', '%26': '&',
+}
+# Plus Code inside a still-encoded q= value: the separator may be '+', ' ',
+# %2B or %20, and a match may not start inside a %XX escape
+PLUS_CODE_PATTERN = re.compile(
+    r'(?<!%)(?<!%[0-9A-Fa-f])'
+    r'([2-9CFGHJMPQRVWX]{4,8})(?:[+ ]|%2[Bb0])([2-9CFGHJMPQRVWX]{2,3})\b'
+)
+
+
+class Candidate(NamedTuple):
+    rank: int
+    method: str
+    # (lat, lng) floats for '@coords' / '!3d!4d', the S2 cell hex string for
+    # 's2cell', the short Plus Code for 'plus_code'
+    value: object
+
+
+def scan_url(url, decode=True):
+    """Return every coordinate candidate in `url`, best rank first.
+
+    Ties keep their order of appearance in the URL.
+    """
+    if decode and '%' in url:
+        # Only a double-encoded URL (%25xx) needs a full decoding pass first
+        if '%25' in url:
+            url = urllib.parse.unquote(url)
+        url = ENCODED_SEPARATOR_PATTERN.sub(lambda m: ENCODED_SEPARATORS[m.group()], url)
+
+    candidates = []
+    for match in COORD_SOURCE_PATTERN.finditer(url):
+        kind = match.lastgroup
+        try:
+            if kind == 'at_lng':
+                candidates.append(Candidate(RANKS['@coords'], '@coords',
+                                            (float(match['at_lat']), float(match['at_lng']))))
+            elif kind == 'd4_lng':
+                candidates.append(Candidate(RANKS['!3d!4d'], '!3d!4d',
+                                            (float(match['d3_lat']), float(match['d4_lng']))))
+        except ValueError:
+            continue  # e.g. "@-." or "1.2.3"
+        if kind == 's2':
+            candidates.append(Candidate(RANKS['s2cell'], 's2cell', match['s2']))
+        elif kind == 'q':
+            plus_match = PLUS_CODE_PATTERN.search(match['q'])
+            if plus_match:
+                code = plus_match.group(1) + '+' + plus_match.group(2)
+                candidates.append(Candidate(RANKS['plus_code'], 'plus_code', code))
+
+    candidates.sort(key=lambda c: c.rank)
+    return candidates
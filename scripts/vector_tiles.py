@@ -0,0 +1,340 @@
+"""
+Offline vector tiles for the map's masjid markers.
+
+Cuts the dataset into Mapbox Vector Tiles (MVT) for every zoom in
+--min-zoom..--max-zoom and packs them into a single PMTiles v3 archive,
+public/data/masjids.pmtiles. Tiles below the maximum zoom carry the
+clusters precomputed for that zoom (see build_clusters.py); tiles at the
+maximum zoom carry every masjid and are overzoomed by the map beyond it.
+Each feature has a `region`, a `count`, and either the masjid `id` or
+the cluster's `expansionZoom`.
+
+The map fetches the archive's header and root directory once, then only
+the byte ranges of the tiles in view (see src/lib/pmtiles.ts), so the
+first load stays the same size as the dataset grows. When the tile
+entries outgrow the root directory's 16 KB, they are paged into leaf
+directories that the map fetches as it needs them. Tiles are encoded on a
+process pool; identical tiles are stored once. Tile data and directories
+are left uncompressed, so the client needs no decompression step.
+
+src/data/masjid-tiles.ts exports the archive URL with a content hash
+query, the source layer name and the zoom range. Other cities get their
+own archive and module (see city_profiles.py).
+
+Run by generate_masjids_ts.py; can also be run on its own.
+
+Usage:
+    python scripts/vector_tiles.py [--city KEY] [--min-zoom Z] [--max-zoom Z] [--workers N]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from build_clusters import MAX_CLUSTER_ZOOM, MIN_ZOOM, RADIUS, build_levels, project
+from city_profiles import CITIES, RIYADH, add_city_argument
+from masjid_dataset import load_dataset
+from pipeline_state import write_if_changed
+
+LAYER_NAME = 'masjids'
+MAX_ZOOM = MAX_CLUSTER_ZOOM + 1
+EXTENT = 4096
+# Features within this many tile units of an edge are repeated in the
+# neighbouring tile, so large cluster circles are not clipped.
+BUFFER = 256
+DEFAULT_WORKERS = os.cpu_count() or 2
+
+# PMTiles v3
+HEADER_SIZE = 127
+ROOT_DIRECTORY_LIMIT = 16384 - HEADER_SIZE
+LEAF_SIZE = 4096  # entries per leaf directory, doubled until the root fits
+COMPRESSION_NONE = 1
+TILE_TYPE_MVT = 1
+
+# MVT geometry
+GEOM_POINT = 1
+CMD_MOVE_TO = 1
+
+
+# ── Protocol buffers ──
+
+def varint(n):
+    out = bytearray()
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def zigzag(n):
+    return (n << 1) ^ (n >> 63)
+
+
+def field_varint(number, value):
+    return varint(number << 3) + varint(value)
+
+
+def field_bytes(number, data):
+    return varint(number << 3 | 2) + varint(len(data)) + data
+
+
+def packed(number, values):
+    return field_bytes(number, b''.join(varint(v) for v in values))
+
+
+def encode_value(value):
+    if isinstance(value, str):
+        return field_bytes(1, value.encode('utf-8'))
+    return field_varint(5, value)  # uint_value
+
+
+def encode_tile(job):
+    """Encode one tile; `job` is (z, x, y, [(tile_x, tile_y, properties)])."""
+    z, x, y, features = job
+    keys, values = {}, {}
+    encoded = []
+    for tile_x, tile_y, properties in features:
+        tags = []
+        for key, value in properties.items():
+            tags.append(keys.setdefault(key, len(keys)))
+            tags.append(values.setdefault(value, len(values)))
+        geometry = [CMD_MOVE_TO | (1 << 3), zigzag(tile_x), zigzag(tile_y)]
+        encoded.append(field_bytes(2, packed(2, tags) + field_varint(3, GEOM_POINT) + packed(4, geometry)))
+
+    layer = (
+        field_varint(15, 2)
+        + field_bytes(1, LAYER_NAME.encode('utf-8'))
+        + b''.join(encoded)
+        + b''.join(field_bytes(3, key.encode('utf-8')) for key in keys)
+        + b''.join(field_bytes(4, encode_value(value)) for value in values)
+        + field_varint(5, EXTENT)
+    )
+    return z, x, y, field_bytes(3, layer)
+
+
+# ── Tiling ──
+
+def tile_features(items, zoom):
+    """Group `items` (with x, y in [0, 1]) into {(x, y): [(tile_x, tile_y, properties)]}."""
+    scale = 2 ** zoom
+    last = scale - 1
+    tiles = {}
+    for item in items:
+        px, py = item['x'] * scale * EXTENT, item['y'] * scale * EXTENT
+        properties = {'region': item['region'], 'count': item['count']}
+        if item['count'] == 1:
+            properties['id'] = item['id']
+        else:
+            properties['expansionZoom'] = item['expansionZoom']
+        for tx in range(max(0, int((px - BUFFER) // EXTENT)), min(last, int((px + BUFFER) // EXTENT)) + 1):
+            for ty in range(max(0, int((py - BUFFER) // EXTENT)), min(last, int((py + BUFFER) // EXTENT)) + 1):
+                local = (round(px - tx * EXTENT), round(py - ty * EXTENT), properties)
+                tiles.setdefault((tx, ty), []).append(local)
+    return tiles
+
+
+def tile_jobs(records, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM, radius=RADIUS):
+    """One (z, x, y, features) job per non-empty tile."""
+    levels = build_levels(records, radius, min_zoom, max_zoom - 1) if max_zoom > min_zoom else {}
+    levels[max_zoom] = []
+    for r in records:
+        x, y = project(r['lat'], r['lng'])
+        levels[max_zoom].append({'x': x, 'y': y, 'count': 1, 'id': r['id'], 'region': r['region']})
+
+    jobs = []
+    for zoom in sorted(levels):
+        for (x, y), features in sorted(tile_features(levels[zoom], zoom).items()):
+            jobs.append((zoom, x, y, features))
+    return jobs
+
+
+# ── PMTiles ──
+
+def rotate(n, x, y, rx, ry):
+    if ry == 0:
+        if rx == 1:
+            x = n - 1 - x
+            y = n - 1 - y
+        x, y = y, x
+    return x, y
+
+
+def zxy_to_tile_id(z, x, y):
+    """Position on the PMTiles Hilbert curve across all zooms."""
+    tile_id = ((1 << (2 * z)) - 1) // 3  # tiles in zooms < z
+    n = 1 << z
+    s = n >> 1
+    while s > 0:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        tile_id += s * s * ((3 * rx) ^ ry)
+        x, y = rotate(n, x, y, rx, ry)
+        s >>= 1
+    return tile_id
+
+
+def serialize_directory(entries):
+    """Entries are [tile_id, offset, length, run_length], sorted by tile id."""
+    out = bytearray(varint(len(entries)))
+    previous_id = 0
+    for tile_id, _, _, _ in entries:
+        out += varint(tile_id - previous_id)
+        previous_id = tile_id
+    for entry in entries:
+        out += varint(entry[3])
+    for entry in entries:
+        out += varint(entry[2])
+    for i, (_, offset, _, _) in enumerate(entries):
+        previous = entries[i - 1] if i else None
+        out += varint(0 if previous and offset == previous[1] + previous[2] else offset + 1)
+    return bytes(out)
+
+
+def build_directories(entries, leaf_size=LEAF_SIZE):
+    """Return (root, leaves): the serialized root directory and leaf directories.
+
+    Entries are paged into leaves of `leaf_size` entries when they do not
+    fit the root; a root entry with run length 0 points at a leaf, its
+    offset relative to the start of the leaves.
+    """
+    root = serialize_directory(entries)
+    if len(root) <= ROOT_DIRECTORY_LIMIT:
+        return root, b''
+    while True:
+        root_entries = []
+        leaves = bytearray()
+        for start in range(0, len(entries), leaf_size):
+            leaf = serialize_directory(entries[start:start + leaf_size])
+            root_entries.append([entries[start][0], len(leaves), len(leaf), 0])
+            leaves += leaf
+        root = serialize_directory(root_entries)
+        if len(root) <= ROOT_DIRECTORY_LIMIT:
+            return root, bytes(leaves)
+        leaf_size *= 2
+
+
+def e7(degrees):
+    return int(round(degrees * 10_000_000))
+
+
+def build_archive(tiles, bounds, min_zoom, max_zoom):
+    """Pack {(z, x, y): tile bytes} into a PMTiles v3 archive."""
+    entries = []
+    data = bytearray()
+    offsets = {}
+    for tile_id, tile in sorted((zxy_to_tile_id(*key), tile) for key, tile in tiles.items()):
+        if tile not in offsets:
+            offsets[tile] = len(data)
+            data += tile
+        offset = offsets[tile]
+        last = entries[-1] if entries else None
+        if last and last[1] == offset and last[0] + last[3] == tile_id:
+            last[3] += 1
+        else:
+            entries.append([tile_id, offset, len(tile), 1])
+
+    root, leaves = build_directories(entries)
+
+    metadata = json.dumps({
+        'name': LAYER_NAME,
+        'format': 'pbf',
+        'vector_layers': [{
+            'id': LAYER_NAME,
+            'minzoom': min_zoom,
+            'maxzoom': max_zoom,
+            'fields': {'region': 'String', 'count': 'Number', 'id': 'String', 'expansionZoom': 'Number'},
+        }],
+    }, separators=(',', ':')).encode('utf-8')
+
+    min_lat, min_lng, max_lat, max_lng = bounds
+    root_offset = HEADER_SIZE
+    metadata_offset = root_offset + len(root)
+    leaves_offset = metadata_offset + len(metadata)
+    data_offset = leaves_offset + len(leaves)
+    header = b''.join([
+        b'PMTiles', bytes([3]),
+        *(n.to_bytes(8, 'little') for n in (
+            root_offset, len(root),
+            metadata_offset, len(metadata),
+            leaves_offset, len(leaves),
+            data_offset, len(data),
+            len(tiles), len(entries), len(offsets),
+        )),
+        bytes([1, COMPRESSION_NONE, COMPRESSION_NONE, TILE_TYPE_MVT, min_zoom, max_zoom]),
+        *(e7(v).to_bytes(4, 'little', signed=True) for v in (min_lng, min_lat, max_lng, max_lat)),
+        bytes([min_zoom]),
+        e7((min_lng + max_lng) / 2).to_bytes(4, 'little', signed=True),
+        e7((min_lat + max_lat) / 2).to_bytes(4, 'little', signed=True),
+    ])
+    assert len(header) == HEADER_SIZE
+    return header + root + metadata + leaves + bytes(data)
+
+
+def render_tiles_module(archive, url, min_zoom, max_zoom):
+    version = hashlib.sha256(archive).hexdigest()[:12]
+    lines = []
+    lines.append('/**')
+    lines.append(' * Masjid Map Tiles')
+    lines.append(' *')
+    lines.append(' * Auto-generated by scripts/vector_tiles.py. URL of the PMTiles archive of')
+    lines.append(' * masjid markers, its source layer and the zoom range it covers.')
+    lines.append(' */')
+    lines.append('')
+    lines.append(f"export const MASJID_TILES_URL = '{url}?v={version}'")
+    lines.append(f"export const MASJID_TILES_LAYER = '{LAYER_NAME}'")
+    lines.append(f'export const TILES_MIN_ZOOM = {min_zoom}')
+    lines.append(f'export const TILES_MAX_ZOOM = {max_zoom}')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def write_tiles(records, city=RIYADH, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM, workers=DEFAULT_WORKERS):
+    """Write the city's archive and its module; return ({zoom: tile count}, bytes, path, written)."""
+    jobs = tile_jobs(records, min_zoom, max_zoom)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, math.ceil(len(jobs) / (workers * 4)))
+        tiles = {(z, x, y): tile for z, x, y, tile in executor.map(encode_tile, jobs, chunksize=chunksize)}
+
+    bounds = (
+        min(r['lat'] for r in records), min(r['lng'] for r in records),
+        max(r['lat'] for r in records), max(r['lng'] for r in records),
+    )
+    archive = build_archive(tiles, bounds, min_zoom, max_zoom)
+    written = write_if_changed(city.tiles_path, archive)
+    module = render_tiles_module(archive, city.tiles_url, min_zoom, max_zoom)
+    written = write_if_changed(os.path.join(city.src_dir, 'masjid-tiles.ts'), module) or written
+
+    per_zoom = {}
+    for z, _, _ in tiles:
+        per_zoom[z] = per_zoom.get(z, 0) + 1
+    return per_zoom, len(archive), city.tiles_path, written
+
+
+def print_tiles_report(per_zoom, size, path, written):
+    tiles = ', '.join(f'z{zoom}: {per_zoom[zoom]}' for zoom in sorted(per_zoom))
+    print(f"  Map tiles: {size / 1024:.1f} KB{' (written)' if written else ''}: {path}")
+    print(f"    Tiles per zoom: {tiles}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the PMTiles archive of masjid map markers.')
+    parser.add_argument('--min-zoom', type=int, default=MIN_ZOOM,
+                        help=f'lowest tiled zoom (default: {MIN_ZOOM})')
+    parser.add_argument('--max-zoom', type=int, default=MAX_ZOOM,
+                        help=f'highest tiled zoom, holding unclustered points (default: {MAX_ZOOM})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'encoding processes (default: {DEFAULT_WORKERS})')
+    add_city_argument(parser)
+    args = parser.parse_args()
+    if not 0 <= args.min_zoom <= args.max_zoom:
+        parser.error('--min-zoom must be between 0 and --max-zoom')
+    city = CITIES[args.city]
+    print_tiles_report(*write_tiles(load_dataset(city.dataset_path), city, args.min_zoom, args.max_zoom, args.workers))
+
+
+if __name__ == '__main__':
+    main()
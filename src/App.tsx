@@ -1,8 +1,9 @@
 import { BrowserRouter, Routes, Route } from 'react-router-dom'
 import { lazy, Suspense } from 'react'
-import HomePage from '@/pages/HomePage'
 
-// Lazy load pages for code splitting
+// Lazy load pages for code splitting. The home page (map) is lazy too, so
+// deep links to a masjid or region never download the full dataset.
+const HomePage = lazy(() => import('./pages/HomePage'))
 const MasjidDetailPage = lazy(() => import('./pages/MasjidDetailPage'))
 const RegionListingPage = lazy(() => import('./pages/RegionListingPage'))
 const NotFoundPage = lazy(() => import('./pages/NotFoundPage'))
@@ -5,88 +5,152 @@
  */
 
 import { useRef, useEffect, useCallback } from 'react'
-import maplibregl from 'maplibre-gl'
+import type maplibregl from 'maplibre-gl'
+import type {
+  ExpressionSpecification,
+  FilterSpecification,
+  GeoJSONSource,
+  MapLayerMouseEvent,
+} from 'maplibre-gl'
 import 'maplibre-gl/dist/maplibre-gl.css'
 import { cn } from '@/lib/utils'
 import { MAP_CONFIG, MARKER_CONFIG } from '@/constants/map'
+import { PMTILES_PROTOCOL } from '@/lib/pmtiles'
+import {
+  MASJID_TILES_LAYER,
+  MASJID_TILES_URL,
+  TILES_MAX_ZOOM,
+  TILES_MIN_ZOOM,
+} from '@/data/masjid-tiles'
 import { Loader2, AlertCircle } from '@/design-tokens'
 import { useMapLibre } from './useMapLibre'
 import type { Masjid, Region, Coordinates } from '@/types'
 
 interface MasjidMapProps {
-  /** Array of masjids to display as markers */
-  masjids: Masjid[]
+  /** URL of the PMTiles archive of masjid markers */
+  tilesUrl?: string
   /** Currently selected masjid */
   selectedMasjid?: Masjid | null
   /** Active region filters (empty = show all) */
   activeRegions?: Region[]
-  /** Callback when a masjid marker is clicked */
-  onMasjidSelect?: (masjid: Masjid) => void
+  /** Callback with the masjid id when a marker is clicked */
+  onMasjidSelect?: (id: string) => void
   /** Callback when map view changes */
   onMapMove?: (center: Coordinates, zoom: number) => void
   /** Additional CSS classes */
   className?: string
 }
 
-// Store markers for cleanup
-const markersMap = new Map<string, maplibregl.Marker>()
+const SOURCE_ID = 'masjids'
+const SELECTED_SOURCE_ID = 'masjid-selected'
+const MARKER_LAYER_ID = 'masjid-markers'
+const COUNT_LAYER_ID = 'masjid-cluster-counts'
+const SELECTED_LAYER_ID = 'masjid-marker-selected'
+
+/** Marker color by the feature's region property */
+const REGION_COLOR = [
+  'match',
+  ['get', 'region'],
+  'north', MARKER_CONFIG.COLORS.north,
+  'east', MARKER_CONFIG.COLORS.east,
+  'westSouth', MARKER_CONFIG.COLORS.westSouth,
+  MARKER_CONFIG.COLORS.north,
+] as ExpressionSpecification
+
+/** Cluster circles grow with the number of masjids they hold */
+const MARKER_RADIUS = [
+  'step',
+  ['get', 'count'],
+  MARKER_CONFIG.SIZE / 2,
+  2, 16,
+  10, 20,
+  50, 26,
+] as ExpressionSpecification
+
+const CLUSTER_FILTER: FilterSpecification = ['>', ['get', 'count'], 1]
+
+function withRegionFilter(
+  filter: FilterSpecification,
+  regionFilter: FilterSpecification | null
+): FilterSpecification {
+  return (regionFilter ? ['all', filter, regionFilter] : filter) as FilterSpecification
+}
+
+function selectedFeature(masjid?: Masjid | null): GeoJSON.FeatureCollection {
+  return {
+    type: 'FeatureCollection',
+    features: masjid
+      ? [{
+          type: 'Feature',
+          geometry: { type: 'Point', coordinates: [masjid.coordinates.lng, masjid.coordinates.lat] },
+          properties: { id: masjid.id, region: masjid.region },
+        }]
+      : [],
+  }
+}
 
 /**
- * Create a custom HTML marker element for a masjid.
- * Uses an inner div for visual styling so hover transforms
- * don't conflict with MapLibre's positioning transforms on the outer element.
+ * Markers come from the vector tiles built by scripts/vector_tiles.py, so
+ * the map only downloads the tiles in view. Each zoom's tiles hold the
+ * clusters precomputed for it (unclustered points at the highest zoom),
+ * so one circle layer and one count layer cover every zoom. The full
+ * record is loaded by the parent when a marker is selected.
  */
-function createMarkerElement(
-  masjid: Masjid,
-  isSelected: boolean
-): HTMLDivElement {
-  const el = document.createElement('div')
-  const inner = document.createElement('div')
-  const size = isSelected ? MARKER_CONFIG.SELECTED_SIZE : MARKER_CONFIG.SIZE
-  const color = MARKER_CONFIG.COLORS[masjid.region]
-
-  el.className = 'masjid-marker'
-  el.style.cssText = `cursor: pointer;`
-
-  inner.style.cssText = `
-    width: ${size}px;
-    height: ${size}px;
-    background-color: ${color};
-    border: 3px solid white;
-    border-radius: 50%;
-    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.3);
-    transition: transform 0.2s ease, box-shadow 0.2s ease;
-  `
-
-  // Add hover effect on inner element
-  el.addEventListener('mouseenter', () => {
-    inner.style.transform = 'scale(1.15)'
-    inner.style.boxShadow = `0 4px 12px rgba(0, 0, 0, 0.4), 0 0 0 4px ${color}40`
+function addMarkerLayers(map: maplibregl.Map, tilesUrl: string) {
+  if (map.getSource(SOURCE_ID)) return
+
+  map.addSource(SOURCE_ID, {
+    type: 'vector',
+    tiles: [`${PMTILES_PROTOCOL}://${tilesUrl}/{z}/{x}/{y}`],
+    minzoom: TILES_MIN_ZOOM,
+    maxzoom: TILES_MAX_ZOOM,
   })
-  el.addEventListener('mouseleave', () => {
-    if (!isSelected) {
-      inner.style.transform = 'scale(1)'
-      inner.style.boxShadow = '0 2px 8px rgba(0, 0, 0, 0.3)'
-    }
+  map.addSource(SELECTED_SOURCE_ID, { type: 'geojson', data: selectedFeature() })
+
+  map.addLayer({
+    id: MARKER_LAYER_ID,
+    type: 'circle',
+    source: SOURCE_ID,
+    'source-layer': MASJID_TILES_LAYER,
+    paint: {
+      'circle-radius': MARKER_RADIUS,
+      'circle-color': REGION_COLOR,
+      'circle-stroke-width': 3,
+      'circle-stroke-color': '#ffffff',
+    },
   })
 
-  // Selected state styling on inner element
-  if (isSelected) {
-    inner.style.transform = 'scale(1.15)'
-    inner.style.boxShadow = `0 4px 12px rgba(0, 0, 0, 0.4), 0 0 0 4px ${color}40`
-  }
-
-  // Accessibility
-  el.setAttribute('role', 'button')
-  el.setAttribute('aria-label', `${masjid.masjidName} - ${masjid.readerName}`)
-  el.setAttribute('tabindex', '0')
+  map.addLayer({
+    id: COUNT_LAYER_ID,
+    type: 'symbol',
+    source: SOURCE_ID,
+    'source-layer': MASJID_TILES_LAYER,
+    filter: CLUSTER_FILTER,
+    layout: {
+      'text-field': ['to-string', ['get', 'count']],
+      'text-size': 12,
+      'text-allow-overlap': true,
+    },
+    paint: {
+      'text-color': '#ffffff',
+    },
+  })
 
-  el.appendChild(inner)
-  return el
+  map.addLayer({
+    id: SELECTED_LAYER_ID,
+    type: 'circle',
+    source: SELECTED_SOURCE_ID,
+    paint: {
+      'circle-radius': MARKER_CONFIG.SELECTED_SIZE / 2,
+      'circle-color': REGION_COLOR,
+      'circle-stroke-width': 4,
+      'circle-stroke-color': '#ffffff',
+    },
+  })
 }
 
 export function MasjidMap({
-  masjids,
+  tilesUrl = MASJID_TILES_URL,
   selectedMasjid,
   activeRegions = [],
   onMasjidSelect,
@@ -109,51 +173,56 @@ export function MasjidMap({
     onMapError: handleMapError,
   })
 
-  // Filter masjids by active regions
-  const filteredMasjids =
-    activeRegions.length === 0
-      ? masjids
-      : masjids.filter((m) => activeRegions.includes(m.region))
-
-  // Update markers when map, masjids, or selection changes
+  // Add the marker sources and layers once the style has loaded
   useEffect(() => {
-    if (!map) return
-
-    // Clear existing markers
-    markersMap.forEach((marker) => marker.remove())
-    markersMap.clear()
-
-    // Add new markers
-    filteredMasjids.forEach((masjid) => {
-      const isSelected = selectedMasjid?.id === masjid.id
-      const el = createMarkerElement(masjid, isSelected)
-
-      // Handle click
-      el.addEventListener('click', () => {
-        onMasjidSelect?.(masjid)
-      })
-
-      // Handle keyboard
-      el.addEventListener('keydown', (e) => {
-        if (e.key === 'Enter' || e.key === ' ') {
-          e.preventDefault()
-          onMasjidSelect?.(masjid)
-        }
-      })
-
-      const marker = new maplibregl.Marker({ element: el })
-        .setLngLat([masjid.coordinates.lng, masjid.coordinates.lat])
-        .addTo(map)
-
-      markersMap.set(masjid.id, marker)
-    })
-
-    // Cleanup on unmount
+    if (!map || isLoading) return
+
+    addMarkerLayers(map, tilesUrl)
+
+    const handleClick = (e: MapLayerMouseEvent) => {
+      const feature = e.features?.[0]
+      const properties = feature?.properties
+      if (!feature || !properties) return
+      if (properties.count > 1 && feature.geometry.type === 'Point') {
+        // Cluster: zoom in to where it splits up
+        const [lng, lat] = feature.geometry.coordinates
+        map.easeTo({ center: [lng, lat], zoom: properties.expansionZoom })
+      } else if (typeof properties.id === 'string') {
+        onMasjidSelect?.(properties.id)
+      }
+    }
+    const handleMouseEnter = () => {
+      map.getCanvas().style.cursor = 'pointer'
+    }
+    const handleMouseLeave = () => {
+      map.getCanvas().style.cursor = ''
+    }
+
+    map.on('click', MARKER_LAYER_ID, handleClick)
+    map.on('mouseenter', MARKER_LAYER_ID, handleMouseEnter)
+    map.on('mouseleave', MARKER_LAYER_ID, handleMouseLeave)
+
     return () => {
-      markersMap.forEach((marker) => marker.remove())
-      markersMap.clear()
+      map.off('click', MARKER_LAYER_ID, handleClick)
+      map.off('mouseenter', MARKER_LAYER_ID, handleMouseEnter)
+      map.off('mouseleave', MARKER_LAYER_ID, handleMouseLeave)
     }
-  }, [map, filteredMasjids, selectedMasjid, onMasjidSelect])
+  }, [map, isLoading, tilesUrl, onMasjidSelect])
+
+  // Apply region filters and the selection highlight
+  useEffect(() => {
+    if (!map || isLoading || !map.getLayer(MARKER_LAYER_ID)) return
+
+    const regionFilter: FilterSpecification | null =
+      activeRegions.length === 0
+        ? null
+        : ['in', ['get', 'region'], ['literal', activeRegions]]
+
+    map.setFilter(MARKER_LAYER_ID, regionFilter)
+    map.setFilter(COUNT_LAYER_ID, withRegionFilter(CLUSTER_FILTER, regionFilter))
+    map.setFilter(SELECTED_LAYER_ID, regionFilter)
+    map.getSource<GeoJSONSource>(SELECTED_SOURCE_ID)?.setData(selectedFeature(selectedMasjid))
+  }, [map, isLoading, activeRegions, selectedMasjid])
 
   // Fly to selected masjid, or zoom back out when dismissed
   const prevSelectedRef = useRef<Masjid | null | undefined>(undefined)
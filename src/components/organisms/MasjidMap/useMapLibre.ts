@@ -7,8 +7,12 @@
 import { useEffect, useRef, useState, useCallback } from 'react'
 import maplibregl from 'maplibre-gl'
 import { MAP_CONFIG } from '@/constants/map'
+import { PMTILES_PROTOCOL, loadPMTile } from '@/lib/pmtiles'
 import type { Coordinates } from '@/types'
 
+// Masjid marker tiles are read from a PMTiles archive
+maplibregl.addProtocol(PMTILES_PROTOCOL, loadPMTile)
+
 interface UseMapLibreOptions {
   /** Container element ref */
   containerRef: React.RefObject<HTMLDivElement | null>
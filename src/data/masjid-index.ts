@@ -0,0 +1,160 @@
+/**
+ * Masjid Spatial Index
+ *
+ * Auto-generated by scripts/generate_masjids_ts.py from the masjid dataset.
+ * Each masjid's nearest neighbours with great-circle distances.
+ */
+
+export const NEIGHBOR_COUNT = 8
+
+/** Masjid id -> nearest masjids as [id, distance in metres], nearest first */
+export const NEAREST_MASJIDS: Record<string, [string, number][]> = {
+  'n-001': [['n-043', 1254], ['n-042', 2468], ['n-016', 2503], ['n-029', 3014], ['n-044', 3113], ['n-008', 3304], ['n-024', 3439], ['n-053', 3588]],
+  'n-002': [['n-007', 1463], ['n-038', 1762], ['n-008', 2606], ['n-024', 3025], ['n-001', 3614], ['n-043', 3751], ['n-034', 4283], ['n-035', 4283]],
+  'n-003': [['n-017', 145], ['n-005', 2878], ['n-006', 3284], ['n-030', 4006], ['n-032', 4121], ['n-004', 5583], ['n-031', 6192], ['n-007', 6442]],
+  'n-004': [['n-031', 771], ['n-034', 1649], ['n-035', 1649], ['n-032', 1916], ['n-030', 2199], ['n-050', 2860], ['n-047', 2863], ['n-005', 3302]],
+  'n-005': [['n-030', 1240], ['n-032', 1451], ['n-003', 2878], ['n-017', 3017], ['n-004', 3302], ['n-007', 3699], ['n-031', 3707], ['n-034', 4377]],
+  'n-006': [['n-003', 3284], ['n-017', 3295], ['n-005', 4841], ['n-030', 6058], ['n-032', 6290], ['n-007', 7241], ['n-038', 7529], ['n-004', 8115]],
+  'n-007': [['n-002', 1463], ['n-038', 1923], ['n-030', 3104], ['n-008', 3233], ['n-032', 3257], ['n-024', 3614], ['n-005', 3699], ['n-035', 3796]],
+  'n-008': [['n-024', 418], ['n-038', 1365], ['n-043', 2524], ['n-002', 2606], ['n-044', 3118], ['n-016', 3153], ['n-007', 3233], ['n-001', 3304]],
+  'n-009': [['n-052', 610], ['n-014', 1818], ['n-022', 2047], ['n-040', 2090], ['n-011', 2233], ['n-049', 2834], ['n-054', 2989], ['n-015', 3597]],
+  'n-010': [['n-033', 686], ['n-048', 1245], ['n-027', 2425], ['n-023', 2740], ['n-026', 2895], ['n-013', 3413], ['n-012', 3493], ['n-051', 3509]],
+  'n-011': [['n-014', 431], ['n-049', 914], ['n-052', 1900], ['n-009', 2233], ['n-046', 2403], ['n-013', 2756], ['n-019', 2872], ['n-054', 2996]],
+  'n-012': [['n-033', 2812], ['n-045', 3336], ['n-023', 3459], ['n-050', 3488], ['n-010', 3493], ['n-047', 3805], ['n-027', 4343], ['n-048', 4729]],
+  'n-013': [['n-026', 1853], ['n-049', 1859], ['n-051', 2185], ['n-048', 2242], ['n-054', 2250], ['n-039', 2632], ['n-011', 2756], ['n-014', 2859]],
+  'n-014': [['n-011', 431], ['n-049', 1127], ['n-052', 1536], ['n-009', 1818], ['n-054', 2762], ['n-046', 2831], ['n-013', 2859], ['n-019', 3298]],
+  'n-015': [['n-039', 708], ['n-054', 940], ['n-029', 1164], ['n-051', 1441], ['n-026', 2061], ['n-013', 2952], ['n-049', 3518], ['n-053', 3521]],
+  'n-016': [['n-044', 675], ['n-042', 938], ['n-043', 1414], ['n-001', 2503], ['n-024', 2965], ['n-037', 3139], ['n-008', 3153], ['n-018', 4210]],
+  'n-017': [['n-003', 145], ['n-005', 3017], ['n-006', 3295], ['n-030', 4138], ['n-032', 4249], ['n-004', 5689], ['n-031', 6305], ['n-007', 6587]],
+  'n-018': [['n-037', 2500], ['ws-002', 2979], ['ws-011', 3107], ['n-041', 3128], ['n-036', 3312], ['n-042', 3407], ['ws-016', 4045], ['n-016', 4210]],
+  'n-019': [['n-046', 849], ['e-001', 1740], ['n-049', 2867], ['n-011', 2872], ['e-043', 3002], ['e-017', 3018], ['e-032', 3282], ['n-014', 3298]],
+  'n-020': [['n-028', 4016], ['n-050', 5063], ['n-045', 5478], ['n-004', 6625], ['n-031', 7098], ['n-012', 7100], ['n-034', 7606], ['n-035', 7606]],
+  'n-021': [['n-040', 2779], ['e-007', 3084], ['n-052', 3180], ['n-009', 3619], ['n-014', 4161], ['e-042', 4194], ['e-035', 4230], ['n-011', 4273]],
+  'n-022': [['n-040', 1803], ['n-009', 2047], ['n-053', 2059], ['ws-002', 2480], ['n-052', 2556], ['n-036', 3029], ['n-014', 3830], ['n-054', 3893]],
+  'n-023': [['n-027', 1222], ['n-033', 2610], ['n-010', 2740], ['n-012', 3459], ['n-048', 3554], ['e-043', 4693], ['n-013', 4923], ['e-002', 5134]],
+  'n-024': [['n-008', 418], ['n-038', 1712], ['n-043', 2529], ['n-044', 2853], ['n-016', 2965], ['n-002', 3025], ['n-001', 3439], ['n-007', 3614]],
+  'n-025': [['e-035', 3183], ['ws-011', 3587], ['n-041', 3734], ['e-028', 4271], ['e-042', 4386], ['n-036', 4713], ['e-044', 5475], ['ws-003', 6038]],
+  'n-026': [['n-051', 650], ['n-039', 1407], ['n-048', 1743], ['n-013', 1853], ['n-054', 2009], ['n-015', 2061], ['n-010', 2895], ['n-029', 2990]],
+  'n-027': [['n-023', 1222], ['n-010', 2425], ['n-033', 2615], ['n-048', 2824], ['n-013', 3801], ['e-043', 3883], ['n-012', 4343], ['n-026', 4423]],
+  'n-028': [['n-020', 4016], ['n-045', 4298], ['n-050', 7248], ['n-012', 7399], ['n-047', 9665], ['n-004', 9679], ['n-031', 9926], ['n-023', 9933]],
+  'n-029': [['n-015', 1164], ['n-039', 1604], ['n-054', 2044], ['n-051', 2340], ['n-053', 2870], ['n-026', 2990], ['n-001', 3014], ['n-022', 3977]],
+  'n-030': [['n-032', 293], ['n-005', 1240], ['n-004', 2199], ['n-031', 2502], ['n-007', 3104], ['n-034', 3140], ['n-035', 3140], ['n-003', 4006]],
+  'n-031': [['n-004', 771], ['n-034', 883], ['n-035', 883], ['n-047', 2191], ['n-032', 2258], ['n-030', 2502], ['n-050', 2824], ['n-005', 3707]],
+  'n-032': [['n-030', 293], ['n-005', 1451], ['n-004', 1916], ['n-031', 2258], ['n-034', 2937], ['n-035', 2937], ['n-007', 3257], ['n-003', 4121]],
+  'n-033': [['n-010', 686], ['n-048', 1918], ['n-023', 2610], ['n-027', 2615], ['n-012', 2812], ['n-026', 3503], ['n-047', 3796], ['n-051', 4092]],
+  'n-034': [['n-035', 0], ['n-031', 883], ['n-047', 1449], ['n-004', 1649], ['n-050', 2914], ['n-032', 2937], ['n-030', 3140], ['n-007', 3796]],
+  'n-035': [['n-034', 0], ['n-031', 883], ['n-047', 1449], ['n-004', 1649], ['n-050', 2914], ['n-032', 2937], ['n-030', 3140], ['n-007', 3796]],
+  'n-036': [['n-041', 1503], ['ws-002', 1566], ['ws-011', 2132], ['n-022', 3029], ['n-053', 3311], ['n-018', 3312], ['e-035', 3358], ['n-040', 3600]],
+  'n-037': [['n-018', 2500], ['n-042', 2854], ['n-044', 2950], ['ws-016', 3097], ['n-016', 3139], ['ws-001', 4378], ['n-043', 4494], ['ws-019', 5055]],
+  'n-038': [['n-008', 1365], ['n-024', 1712], ['n-002', 1762], ['n-007', 1923], ['n-043', 3592], ['n-001', 4039], ['n-016', 4451], ['n-044', 4471]],
+  'n-039': [['n-015', 708], ['n-051', 762], ['n-054', 1195], ['n-026', 1407], ['n-029', 1604], ['n-013', 2632], ['n-048', 3149], ['n-049', 3572]],
+  'n-040': [['n-022', 1803], ['n-009', 2090], ['n-052', 2181], ['n-021', 2779], ['e-035', 3330], ['n-036', 3600], ['n-014', 3717], ['ws-002', 3792]],
+  'n-041': [['ws-011', 643], ['n-036', 1503], ['ws-002', 2823], ['n-018', 3128], ['e-035', 3543], ['n-025', 3734], ['n-022', 4521], ['n-053', 4682]],
+  'n-042': [['n-016', 938], ['n-044', 1476], ['n-043', 1778], ['n-001', 2468], ['n-037', 2854], ['n-018', 3407], ['n-024', 3833], ['n-053', 3967]],
+  'n-043': [['n-001', 1254], ['n-016', 1414], ['n-042', 1778], ['n-044', 1934], ['n-008', 2524], ['n-024', 2529], ['n-038', 3592], ['n-002', 3751]],
+  'n-044': [['n-016', 675], ['n-042', 1476], ['n-043', 1934], ['n-024', 2853], ['n-037', 2950], ['n-001', 3113], ['n-008', 3118], ['n-018', 4421]],
+  'n-045': [['n-012', 3336], ['n-028', 4298], ['n-050', 4827], ['n-020', 5478], ['n-023', 5648], ['n-033', 6058], ['n-047', 6517], ['n-010', 6713]],
+  'n-046': [['n-019', 849], ['n-049', 2181], ['n-011', 2403], ['e-001', 2576], ['n-014', 2831], ['e-043', 3067], ['n-013', 3122], ['e-017', 3679]],
+  'n-047': [['n-034', 1449], ['n-035', 1449], ['n-031', 2191], ['n-050', 2607], ['n-004', 2863], ['n-033', 3796], ['n-012', 3805], ['n-010', 4169]],
+  'n-048': [['n-010', 1245], ['n-026', 1743], ['n-033', 1918], ['n-013', 2242], ['n-051', 2388], ['n-027', 2824], ['n-039', 3149], ['n-023', 3554]],
+  'n-049': [['n-011', 914], ['n-014', 1127], ['n-013', 1859], ['n-046', 2181], ['n-054', 2581], ['n-052', 2644], ['n-009', 2834], ['n-019', 2867]],
+  'n-050': [['n-047', 2607], ['n-031', 2824], ['n-004', 2860], ['n-034', 2914], ['n-035', 2914], ['n-012', 3488], ['n-032', 4770], ['n-045', 4827]],
+  'n-051': [['n-026', 650], ['n-039', 762], ['n-015', 1441], ['n-054', 1579], ['n-013', 2185], ['n-029', 2340], ['n-048', 2388], ['n-049', 3486]],
+  'n-052': [['n-009', 610], ['n-014', 1536], ['n-011', 1900], ['n-040', 2181], ['n-022', 2556], ['n-049', 2644], ['n-021', 3180], ['n-054', 3322]],
+  'n-053': [['ws-002', 1873], ['n-022', 2059], ['n-029', 2870], ['n-036', 3311], ['n-015', 3521], ['n-001', 3588], ['n-009', 3610], ['n-040', 3851]],
+  'n-054': [['n-015', 940], ['n-039', 1195], ['n-051', 1579], ['n-026', 2009], ['n-029', 2044], ['n-013', 2250], ['n-049', 2581], ['n-014', 2762]],
+  'e-001': [['n-019', 1740], ['e-017', 1775], ['e-032', 1837], ['e-026', 1979], ['e-037', 2283], ['n-046', 2576], ['e-033', 3100], ['e-043', 3232]],
+  'e-002': [['e-015', 1080], ['e-039', 1221], ['e-043', 1507], ['e-011', 1668], ['e-017', 2810], ['e-001', 4135], ['e-022', 4208], ['n-019', 4362]],
+  'e-003': [['e-048', 876], ['e-041', 1049], ['e-027', 2485], ['e-005', 2716], ['e-024', 3632], ['e-004', 3804], ['e-040', 3851], ['e-029', 4380]],
+  'e-004': [['e-006', 1233], ['e-027', 1862], ['e-047', 2711], ['e-045', 2759], ['e-018', 3004], ['e-030', 3008], ['e-019', 3175], ['e-013', 3379]],
+  'e-005': [['e-048', 2505], ['e-003', 2716], ['e-041', 3183], ['e-037', 3660], ['e-033', 3743], ['e-032', 3896], ['e-007', 3925], ['e-026', 4039]],
+  'e-006': [['e-004', 1233], ['e-027', 1980], ['e-047', 3220], ['e-040', 3278], ['e-045', 3377], ['e-030', 3378], ['e-052', 3473], ['e-019', 3879]],
+  'e-007': [['n-021', 3084], ['e-024', 3528], ['e-051', 3747], ['e-005', 3925], ['e-042', 3959], ['e-046', 4011], ['e-029', 4187], ['e-037', 4453]],
+  'e-008': [['e-012', 349], ['e-031', 514], ['e-023', 659], ['e-050', 915], ['e-038', 1059], ['e-053', 1115], ['e-013', 1328], ['e-014', 1334]],
+  'e-009': [['e-011', 11509], ['e-025', 11744], ['e-010', 11886], ['e-049', 11909], ['e-015', 12066], ['e-039', 12970], ['e-002', 13083], ['e-022', 13594]],
+  'e-010': [['e-025', 1098], ['e-022', 2003], ['e-049', 2398], ['e-033', 3790], ['e-039', 3906], ['e-017', 4013], ['e-011', 4111], ['e-015', 4383]],
+  'e-011': [['e-015', 588], ['e-039', 1577], ['e-002', 1668], ['e-043', 3143], ['e-017', 3495], ['e-022', 3955], ['e-010', 4111], ['e-025', 5125]],
+  'e-012': [['e-008', 349], ['e-031', 634], ['e-023', 1003], ['e-050', 1251], ['e-038', 1268], ['e-053', 1353], ['e-014', 1644], ['e-013', 1678]],
+  'e-013': [['e-019', 254], ['e-050', 546], ['e-023', 695], ['e-014', 711], ['e-045', 793], ['e-018', 815], ['e-047', 1066], ['e-053', 1104]],
+  'e-014': [['e-038', 673], ['e-013', 711], ['e-019', 813], ['e-023', 956], ['e-050', 1017], ['e-054', 1109], ['e-031', 1137], ['e-045', 1202]],
+  'e-015': [['e-011', 588], ['e-002', 1080], ['e-039', 1211], ['e-043', 2559], ['e-017', 3157], ['e-022', 3951], ['e-010', 4383], ['e-001', 4747]],
+  'e-016': [['e-054', 532], ['e-030', 1252], ['e-014', 1393], ['e-047', 1641], ['e-038', 1731], ['e-052', 1749], ['e-045', 1778], ['e-019', 1816]],
+  'e-017': [['e-001', 1775], ['e-039', 1949], ['e-022', 2247], ['e-026', 2476], ['e-043', 2546], ['e-002', 2810], ['e-032', 2933], ['n-019', 3018]],
+  'e-018': [['e-053', 640], ['e-050', 683], ['e-013', 815], ['e-019', 861], ['e-023', 953], ['e-045', 1141], ['e-047', 1450], ['e-014', 1510]],
+  'e-019': [['e-013', 254], ['e-045', 538], ['e-050', 773], ['e-014', 813], ['e-047', 816], ['e-018', 861], ['e-023', 946], ['e-030', 1065]],
+  'e-020': [['e-021', 887], ['e-036', 1067], ['e-053', 1231], ['e-046', 1396], ['e-029', 1697], ['e-018', 1738], ['e-051', 1810], ['e-050', 1835]],
+  'e-021': [['e-020', 887], ['e-046', 1320], ['e-036', 1493], ['e-051', 1791], ['e-029', 1933], ['e-053', 2079], ['e-012', 2363], ['e-008', 2462]],
+  'e-022': [['e-010', 2003], ['e-033', 2155], ['e-017', 2247], ['e-026', 2650], ['e-025', 2876], ['e-039', 2995], ['e-001', 3498], ['e-032', 3505]],
+  'e-023': [['e-050', 275], ['e-008', 659], ['e-013', 695], ['e-053', 760], ['e-031', 897], ['e-019', 946], ['e-018', 953], ['e-014', 956]],
+  'e-024': [['e-051', 990], ['e-029', 995], ['e-046', 1457], ['e-036', 1651], ['e-020', 2678], ['e-021', 2777], ['e-048', 2790], ['e-053', 3392]],
+  'e-025': [['e-010', 1098], ['e-049', 1308], ['e-022', 2876], ['e-033', 4272], ['e-039', 5003], ['e-017', 5025], ['e-011', 5125], ['e-026', 5233]],
+  'e-026': [['e-032', 878], ['e-033', 1221], ['e-037', 1655], ['e-001', 1979], ['e-017', 2476], ['e-022', 2650], ['n-019', 3660], ['e-005', 4039]],
+  'e-027': [['e-004', 1862], ['e-006', 1980], ['e-040', 2386], ['e-003', 2485], ['e-041', 2652], ['e-048', 2762], ['e-024', 4217], ['e-029', 4463]],
+  'e-028': [['e-042', 2626], ['e-021', 4087], ['n-025', 4271], ['e-035', 4688], ['e-020', 4912], ['e-046', 5010], ['e-012', 5332], ['e-051', 5355]],
+  'e-029': [['e-051', 524], ['e-036', 657], ['e-046', 731], ['e-024', 995], ['e-020', 1697], ['e-021', 1933], ['e-053', 2427], ['e-018', 2546]],
+  'e-030': [['e-047', 439], ['e-045', 697], ['e-054', 741], ['e-019', 1065], ['e-016', 1252], ['e-013', 1286], ['e-014', 1330], ['e-052', 1760]],
+  'e-031': [['e-008', 514], ['e-012', 634], ['e-038', 644], ['e-023', 897], ['e-014', 1137], ['e-050', 1169], ['e-013', 1406], ['e-053', 1547]],
+  'e-032': [['e-037', 803], ['e-026', 878], ['e-001', 1837], ['e-033', 1986], ['e-017', 2933], ['n-019', 3282], ['e-022', 3505], ['e-005', 3896]],
+  'e-033': [['e-026', 1221], ['e-032', 1986], ['e-022', 2155], ['e-037', 2637], ['e-017', 3034], ['e-001', 3100], ['e-005', 3743], ['e-010', 3790]],
+  'e-034': [['e-040', 8107], ['e-041', 10056], ['e-049', 10059], ['e-027', 10467], ['e-003', 11053], ['e-006', 11120], ['e-025', 11359], ['e-048', 11914]],
+  'e-035': [['e-042', 2887], ['n-025', 3183], ['n-040', 3330], ['n-036', 3358], ['n-041', 3543], ['ws-011', 3937], ['n-021', 4230], ['n-022', 4406]],
+  'e-036': [['e-029', 657], ['e-046', 765], ['e-051', 951], ['e-020', 1067], ['e-021', 1493], ['e-024', 1651], ['e-053', 1802], ['e-018', 2004]],
+  'e-037': [['e-032', 803], ['e-026', 1655], ['e-001', 2283], ['e-033', 2637], ['n-019', 3393], ['e-017', 3644], ['e-005', 3660], ['n-046', 4177]],
+  'e-038': [['e-031', 644], ['e-014', 673], ['e-008', 1059], ['e-023', 1063], ['e-013', 1233], ['e-012', 1268], ['e-050', 1268], ['e-019', 1412]],
+  'e-039': [['e-015', 1211], ['e-002', 1221], ['e-011', 1577], ['e-017', 1949], ['e-043', 2094], ['e-022', 2995], ['e-001', 3586], ['e-010', 3906]],
+  'e-040': [['e-027', 2386], ['e-006', 3278], ['e-041', 3283], ['e-003', 3851], ['e-004', 3918], ['e-048', 4521], ['e-005', 6442], ['e-047', 6459]],
+  'e-041': [['e-003', 1049], ['e-048', 1922], ['e-027', 2652], ['e-005', 3183], ['e-040', 3283], ['e-004', 4308], ['e-006', 4631], ['e-024', 4674]],
+  'e-042': [['e-028', 2626], ['e-035', 2887], ['e-007', 3959], ['n-021', 4194], ['n-025', 4386], ['e-021', 4662], ['e-046', 4932], ['e-051', 5071]],
+  'e-043': [['e-002', 1507], ['e-039', 2094], ['e-017', 2546], ['e-015', 2559], ['n-019', 3002], ['n-046', 3067], ['e-011', 3143], ['e-001', 3232]],
+  'e-044': [['ws-003', 628], ['ws-013', 4312], ['ws-012', 4648], ['ws-039', 4900], ['ws-030', 5061], ['n-025', 5475], ['ws-018', 6001], ['ws-025', 6076]],
+  'e-045': [['e-047', 314], ['e-019', 538], ['e-030', 697], ['e-013', 793], ['e-018', 1141], ['e-014', 1202], ['e-054', 1249], ['e-050', 1284]],
+  'e-046': [['e-051', 472], ['e-029', 731], ['e-036', 765], ['e-021', 1320], ['e-020', 1396], ['e-024', 1457], ['e-053', 2436], ['e-018', 2728]],
+  'e-047': [['e-045', 314], ['e-030', 439], ['e-019', 816], ['e-013', 1066], ['e-054', 1110], ['e-014', 1346], ['e-018', 1450], ['e-050', 1582]],
+  'e-048': [['e-003', 876], ['e-041', 1922], ['e-005', 2505], ['e-027', 2762], ['e-024', 2790], ['e-029', 3594], ['e-004', 3666], ['e-051', 3767]],
+  'e-049': [['e-025', 1308], ['e-010', 2398], ['e-022', 3978], ['e-033', 4948], ['e-026', 6046], ['e-017', 6201], ['e-039', 6303], ['e-011', 6413]],
+  'e-050': [['e-023', 275], ['e-013', 546], ['e-053', 627], ['e-018', 683], ['e-019', 773], ['e-008', 915], ['e-014', 1017], ['e-031', 1169]],
+  'e-051': [['e-046', 472], ['e-029', 524], ['e-036', 951], ['e-024', 990], ['e-021', 1791], ['e-020', 1810], ['e-053', 2742], ['e-018', 2949]],
+  'e-052': [['e-016', 1749], ['e-054', 1754], ['e-030', 1760], ['e-047', 2129], ['e-045', 2433], ['e-019', 2818], ['e-014', 2848], ['e-013', 3021]],
+  'e-053': [['e-050', 627], ['e-018', 640], ['e-023', 760], ['e-013', 1104], ['e-008', 1115], ['e-020', 1231], ['e-019', 1273], ['e-012', 1353]],
+  'e-054': [['e-016', 532], ['e-030', 741], ['e-014', 1109], ['e-047', 1110], ['e-045', 1249], ['e-019', 1341], ['e-013', 1461], ['e-038', 1623]],
+  'ws-001': [['ws-019', 1247], ['ws-016', 2098], ['ws-020', 3624], ['ws-021', 4119], ['ws-007', 4275], ['n-037', 4378], ['ws-008', 4508], ['n-018', 5975]],
+  'ws-002': [['n-036', 1566], ['n-053', 1873], ['n-022', 2480], ['n-041', 2823], ['n-018', 2979], ['ws-011', 3353], ['n-040', 3792], ['n-042', 4193]],
+  'ws-003': [['e-044', 628], ['ws-013', 3696], ['ws-012', 4363], ['ws-039', 4417], ['ws-030', 4747], ['ws-018', 5396], ['ws-024', 5598], ['ws-025', 5598]],
+  'ws-004': [['ws-036', 7008], ['ws-023', 7312], ['ws-040', 7803], ['ws-015', 8597], ['ws-028', 8959], ['ws-010', 9856], ['ws-029', 10623], ['ws-018', 10942]],
+  'ws-005': [['ws-006', 0], ['ws-030', 1753], ['ws-012', 1959], ['ws-037', 2146], ['ws-022', 2767], ['ws-017', 3163], ['ws-039', 3332], ['ws-034', 3701]],
+  'ws-006': [['ws-005', 0], ['ws-030', 1753], ['ws-012', 1959], ['ws-037', 2146], ['ws-022', 2767], ['ws-017', 3163], ['ws-039', 3332], ['ws-034', 3701]],
+  'ws-007': [['ws-020', 2167], ['ws-021', 3106], ['ws-008', 3981], ['ws-001', 4275], ['ws-019', 4667], ['ws-016', 6370], ['ws-032', 7397], ['n-037', 8210]],
+  'ws-008': [['ws-021', 876], ['ws-020', 1861], ['ws-019', 3764], ['ws-007', 3981], ['ws-001', 4508], ['ws-016', 5907], ['ws-032', 6708], ['ws-015', 7603]],
+  'ws-009': [['ws-032', 4771], ['ws-007', 9698], ['ws-020', 10333], ['ws-021', 10351], ['ws-008', 10664], ['ws-036', 12111], ['ws-015', 13158], ['ws-019', 13740]],
+  'ws-010': [['ws-018', 2049], ['ws-029', 3230], ['ws-022', 3242], ['ws-026', 3452], ['ws-039', 3575], ['ws-040', 3880], ['ws-028', 4007], ['ws-013', 4763]],
+  'ws-011': [['n-041', 643], ['n-036', 2132], ['n-018', 3107], ['ws-002', 3353], ['n-025', 3587], ['e-035', 3937], ['n-022', 5157], ['n-053', 5225]],
+  'ws-012': [['ws-030', 466], ['ws-039', 1852], ['ws-005', 1959], ['ws-006', 1959], ['ws-022', 2629], ['ws-037', 3025], ['ws-018', 4243], ['ws-003', 4363]],
+  'ws-013': [['ws-018', 2785], ['ws-024', 3046], ['ws-025', 3046], ['ws-003', 3696], ['ws-039', 3766], ['ws-014', 3778], ['ws-040', 4240], ['e-044', 4312]],
+  'ws-014': [['ws-024', 794], ['ws-025', 794], ['ws-013', 3778], ['ws-023', 4300], ['ws-015', 4683], ['ws-040', 4718], ['ws-018', 5985], ['ws-003', 6377]],
+  'ws-015': [['ws-036', 3931], ['ws-023', 4487], ['ws-014', 4683], ['ws-024', 5416], ['ws-025', 5416], ['ws-040', 5812], ['ws-008', 7603], ['ws-013', 7825]],
+  'ws-016': [['ws-001', 2098], ['ws-019', 2162], ['n-037', 3097], ['n-018', 4045], ['ws-020', 5489], ['ws-011', 5749], ['ws-021', 5758], ['ws-008', 5907]],
+  'ws-017': [['ws-035', 1034], ['ws-034', 1084], ['ws-037', 2487], ['ws-027', 2944], ['ws-005', 3163], ['ws-006', 3163], ['ws-030', 4844], ['ws-038', 4853]],
+  'ws-018': [['ws-010', 2049], ['ws-039', 2393], ['ws-013', 2785], ['ws-022', 3305], ['ws-040', 3689], ['ws-030', 4077], ['ws-012', 4243], ['ws-026', 4649]],
+  'ws-019': [['ws-001', 1247], ['ws-016', 2162], ['ws-020', 3407], ['ws-021', 3599], ['ws-008', 3764], ['ws-007', 4667], ['n-037', 5055], ['n-018', 6200]],
+  'ws-020': [['ws-021', 1001], ['ws-008', 1861], ['ws-007', 2167], ['ws-019', 3407], ['ws-001', 3624], ['ws-016', 5489], ['ws-032', 7051], ['n-037', 7990]],
+  'ws-021': [['ws-008', 876], ['ws-020', 1001], ['ws-007', 3106], ['ws-019', 3599], ['ws-001', 4119], ['ws-016', 5758], ['ws-032', 6688], ['ws-015', 8418]],
+  'ws-022': [['ws-039', 1999], ['ws-030', 2182], ['ws-026', 2267], ['ws-012', 2629], ['ws-005', 2767], ['ws-006', 2767], ['ws-010', 3242], ['ws-018', 3305]],
+  'ws-023': [['ws-040', 1368], ['ws-014', 4300], ['ws-024', 4450], ['ws-025', 4450], ['ws-015', 4487], ['ws-013', 4950], ['ws-018', 4955], ['ws-010', 5244]],
+  'ws-024': [['ws-025', 0], ['ws-014', 794], ['ws-013', 3046], ['ws-023', 4450], ['ws-040', 4634], ['ws-018', 5411], ['ws-015', 5416], ['ws-003', 5598]],
+  'ws-025': [['ws-024', 0], ['ws-014', 794], ['ws-013', 3046], ['ws-023', 4450], ['ws-040', 4634], ['ws-018', 5411], ['ws-015', 5416], ['ws-003', 5598]],
+  'ws-026': [['ws-029', 2035], ['ws-022', 2267], ['ws-010', 3452], ['ws-028', 4017], ['ws-039', 4185], ['ws-005', 4259], ['ws-006', 4259], ['ws-030', 4339]],
+  'ws-027': [['ws-035', 2017], ['ws-034', 2256], ['ws-031', 2411], ['ws-017', 2944], ['ws-033', 3715], ['ws-038', 4705], ['ws-037', 5378], ['ws-006', 5943]],
+  'ws-028': [['ws-029', 1984], ['ws-010', 4007], ['ws-026', 4017], ['ws-022', 5735], ['ws-018', 6055], ['ws-040', 6586], ['ws-039', 7074], ['ws-023', 7694]],
+  'ws-029': [['ws-028', 1984], ['ws-026', 2035], ['ws-010', 3230], ['ws-022', 3926], ['ws-018', 5087], ['ws-039', 5521], ['ws-030', 6106], ['ws-038', 6151]],
+  'ws-030': [['ws-012', 466], ['ws-039', 1703], ['ws-005', 1753], ['ws-006', 1753], ['ws-022', 2182], ['ws-037', 3159], ['ws-018', 4077], ['ws-026', 4339]],
+  'ws-031': [['ws-033', 1966], ['ws-027', 2411], ['ws-035', 4394], ['ws-034', 4626], ['ws-017', 5352], ['ws-038', 5934], ['ws-037', 7759], ['ws-006', 8326]],
+  'ws-032': [['ws-009', 4771], ['ws-021', 6688], ['ws-008', 6708], ['ws-020', 7051], ['ws-007', 7397], ['ws-036', 8131], ['ws-015', 8486], ['ws-019', 10286]],
+  'ws-033': [['ws-031', 1966], ['ws-027', 3715], ['ws-035', 5373], ['ws-034', 5933], ['ws-017', 6404], ['ws-038', 7846], ['ws-037', 8582], ['e-016', 8648]],
+  'ws-034': [['ws-017', 1084], ['ws-035', 1114], ['ws-027', 2256], ['ws-037', 3494], ['ws-005', 3701], ['ws-006', 3701], ['ws-038', 3923], ['ws-031', 4626]],
+  'ws-035': [['ws-017', 1034], ['ws-034', 1114], ['ws-027', 2017], ['ws-037', 3366], ['ws-005', 4194], ['ws-006', 4194], ['ws-031', 4394], ['ws-038', 4977]],
+  'ws-036': [['ws-015', 3931], ['ws-023', 6974], ['ws-004', 7008], ['ws-032', 8131], ['ws-040', 8302], ['ws-014', 8564], ['ws-024', 9259], ['ws-025', 9259]],
+  'ws-037': [['ws-005', 2146], ['ws-006', 2146], ['ws-017', 2487], ['ws-012', 3025], ['ws-030', 3159], ['ws-035', 3366], ['ws-034', 3494], ['ws-022', 4838]],
+  'ws-038': [['ws-034', 3923], ['ws-027', 4705], ['ws-017', 4853], ['ws-026', 4907], ['ws-035', 4977], ['ws-005', 5513], ['ws-006', 5513], ['ws-031', 5934]],
+  'ws-039': [['ws-030', 1703], ['ws-012', 1852], ['ws-022', 1999], ['ws-018', 2393], ['ws-005', 3332], ['ws-006', 3332], ['ws-010', 3575], ['ws-013', 3766]],
+  'ws-040': [['ws-023', 1368], ['ws-018', 3689], ['ws-010', 3880], ['ws-013', 4240], ['ws-024', 4634], ['ws-025', 4634], ['ws-014', 4718], ['ws-015', 5812]],
+}
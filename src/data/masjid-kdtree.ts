@@ -0,0 +1,13 @@
+/**
+ * Masjid KD-Tree
+ *
+ * Auto-generated by scripts/generate_masjids_ts.py from the masjid dataset.
+ * Static KD-tree over unit vectors, queried by src/lib/spatial-index.ts.
+ * Loaded on demand by src/lib/masjid-chunks.ts when a search needs it.
+ */
+
+/** KD-tree node order (kdbush layout: the median of each range is its node) */
+export const KD_IDS: string[] = ['e-037', 'e-032', 'e-001', 'e-026', 'e-051', 'e-007', 'e-033', 'e-005', 'n-019', 'n-014', 'n-011', 'n-049', 'n-052', 'e-028', 'e-042', 'n-046', 'n-021', 'n-013', 'e-039', 'e-015', 'e-011', 'e-009', 'e-022', 'e-049', 'e-025', 'e-010', 'e-017', 'n-033', 'n-012', 'n-045', 'n-028', 'n-010', 'e-043', 'e-002', 'n-023', 'n-027', 'e-024', 'e-014', 'e-023', 'e-013', 'e-030', 'ws-033', 'e-016', 'e-052', 'e-054', 'e-038', 'e-031', 'e-012', 'e-008', 'ws-017', 'ws-031', 'ws-027', 'ws-035', 'ws-034', 'e-050', 'e-048', 'e-003', 'e-041', 'e-027', 'e-006', 'e-004', 'e-034', 'e-040', 'e-047', 'e-021', 'e-036', 'e-029', 'e-046', 'e-020', 'e-019', 'e-045', 'e-018', 'e-053', 'n-048', 'n-044', 'n-024', 'n-008', 'n-043', 'n-037', 'n-042', 'n-001', 'n-016', 'ws-016', 'ws-032', 'ws-009', 'ws-007', 'ws-020', 'ws-008', 'ws-021', 'ws-019', 'ws-001', 'n-029', 'n-031', 'n-050', 'n-020', 'n-034', 'n-051', 'n-026', 'n-047', 'n-035', 'n-004', 'n-006', 'n-005', 'n-003', 'n-017', 'n-030', 'n-038', 'n-002', 'n-032', 'n-007', 'n-039', 'ws-039', 'ws-030', 'ws-012', 'ws-022', 'ws-038', 'ws-026', 'ws-005', 'ws-006', 'ws-029', 'ws-004', 'ws-036', 'ws-023', 'ws-015', 'ws-040', 'ws-028', 'ws-010', 'ws-018', 'ws-013', 'ws-014', 'n-022', 'n-015', 'n-054', 'n-009', 'ws-037', 'n-025', 'n-040', 'e-035', 'n-053', 'ws-011', 'n-018', 'n-036', 'ws-002', 'n-041', 'ws-024', 'ws-025', 'e-044', 'ws-003']
+
+/** Unit vectors of KD_IDS, flattened as x, y, z */
+export const KD_COORDS: number[] = [0.6222097, 0.6612724, 0.4190154, 0.6221403, 0.6612711, 0.4191205, 0.6222227, 0.661072, 0.4193121, 0.6220429, 0.6613047, 0.419212, 0.6222434, 0.6618844, 0.4179978, 0.6224214, 0.661475, 0.4183808, 0.6218965, 0.6614255, 0.4192386, 0.6219576, 0.6616962, 0.4187207, 0.6224214, 0.6608845, 0.4193127, 0.6228106, 0.6607, 0.4190256, 0.6227623, 0.6607178, 0.4190694, 0.622773, 0.6606341, 0.4191854, 0.6229041, 0.6607493, 0.4188089, 0.6228858, 0.661549, 0.4175719, 0.6228404, 0.6613616, 0.4179361, 0.6225078, 0.6607864, 0.4193392, 0.6227055, 0.6611128, 0.4185304, 0.6228473, 0.6604363, 0.4193867, 0.6219789, 0.6609844, 0.4198117, 0.6219413, 0.6609111, 0.4199829, 0.6218711, 0.6609464, 0.4200312, 0.6206796, 0.6612198, 0.4213612, 0.6217955, 0.6613258, 0.4195456, 0.6213122, 0.6617014, 0.4196695, 0.6214424, 0.6615497, 0.4197159, 0.6215626, 0.6614272, 0.4197309, 0.6220557, 0.6610881, 0.4195344, 0.6228975, 0.6600592, 0.4199054, 0.622877, 0.6598364, 0.4202858, 0.6227157, 0.6596859, 0.4207608, 0.6227662, 0.6592908, 0.4213051, 0.622892, 0.6601206, 0.4198172, 0.6222344, 0.6607924, 0.4197353, 0.6220715, 0.6608414, 0.4198996, 0.6225797, 0.6602443, 0.4200857, 0.6225951, 0.6603364, 0.4199182, 0.6221545, 0.6618875, 0.4181252, 0.6221189, 0.662324, 0.4174865, 0.622186, 0.6622133, 0.4175622, 0.6221013, 0.6622775, 0.4175864, 0.6219568, 0.6624182, 0.4175785, 0.6221621, 0.6630947, 0.4161968, 0.6220023, 0.6624878, 0.4174004, 0.6217876, 0.6626236, 0.4175046, 0.6219965, 0.6624473, 0.4174732, 0.6221943, 0.6622965, 0.4174178, 0.622258, 0.6622217, 0.4174415, 0.6223071, 0.6621475, 0.4174861, 0.6222643, 0.6621747, 0.4175067, 0.6228896, 0.6624012, 0.4162129, 0.6223764, 0.6630261, 0.4159855, 0.6226137, 0.6627459, 0.4160769, 0.6227694, 0.66251, 0.4162196, 0.6228715, 0.6625031, 0.4160778, 0.62216, 0.662216, 0.4175966, 0.6218633, 0.6619595, 0.4184443, 0.6217586, 0.6620127, 0.4185158, 0.6216371, 0.6620645, 0.4186143, 0.6216418, 0.6622836, 0.4182605, 0.6216368, 0.6624529, 0.4179999, 0.6217766, 0.6623192, 0.4180037, 0.6204001, 0.6628827, 0.4191541, 0.6213513, 0.6624506, 0.4184278, 0.6219708, 0.6623733, 0.4176289, 0.6223846, 0.6619047, 0.4177555, 0.6222102, 0.6619832, 0.4178909, 0.6221888, 0.6619444, 0.417984, 0.6222777, 0.6618932, 0.4179327, 0.6222873, 0.6620036, 0.4177437, 0.6220701, 0.6622974, 0.4176014, 0.6220042, 0.6623377, 0.4176356, 0.6221098, 0.6622039, 0.4176906, 0.6221883, 0.6621481, 0.4176621, 0.6229179, 0.6602065, 0.4196436, 0.6240549, 0.6598207, 0.4185595, 0.6240729, 0.6595689, 0.4189294, 0.6240331, 0.6595735, 0.4189814, 0.6238554, 0.6598673, 0.4187836, 0.6241178, 0.6600224, 0.4181475, 0.6238956, 0.6599871, 0.4185348, 0.6237027, 0.6599572, 0.4188693, 0.6239721, 0.6598766, 0.418595, 0.6243081, 0.6601191, 0.4177107, 0.6257079, 0.6595849, 0.4164582, 0.6262152, 0.6590426, 0.4165542, 0.6250868, 0.659554, 0.4174386, 0.6249575, 0.6598003, 0.4172429, 0.6249121, 0.659984, 0.4170204, 0.6249478, 0.6598906, 0.4171146, 0.6245434, 0.6600436, 0.4174781, 0.6245636, 0.6599262, 0.4176334, 0.6233328, 0.6602039, 0.4190311, 0.6235589, 0.6593947, 0.4199678, 0.6232707, 0.6594562, 0.4202989, 0.6232464, 0.6590454, 0.4209786, 0.623494, 0.659498, 0.419902, 0.6231116, 0.6602271, 0.4193235, 0.623052, 0.6602307, 0.4194063, 0.62332, 0.6596403, 0.4199367, 0.623494, 0.659498, 0.419902, 0.6236042, 0.6593072, 0.4200379, 0.6245978, 0.6585986, 0.4196729, 0.6240089, 0.6590465, 0.419846, 0.6242429, 0.6587071, 0.4200307, 0.6242504, 0.658691, 0.4200449, 0.6238654, 0.6591777, 0.4198533, 0.6239974, 0.6594854, 0.4191734, 0.6237845, 0.6596031, 0.4193049, 0.6238339, 0.6591869, 0.4198856, 0.6238673, 0.659438, 0.4194415, 0.6231693, 0.6602388, 0.4192194, 0.6236534, 0.6617325, 0.4161327, 0.6234448, 0.6618818, 0.416208, 0.6234302, 0.6618539, 0.4162741, 0.6235903, 0.6619365, 0.4159028, 0.6230893, 0.6626481, 0.4155204, 0.6236261, 0.6621, 0.4155889, 0.6232669, 0.6620842, 0.4161524, 0.6232669, 0.6620842, 0.4161524, 0.6238325, 0.6620561, 0.415349, 0.6251348, 0.6611773, 0.4147903, 0.6253916, 0.6604447, 0.4155696, 0.6245489, 0.6611124, 0.4157752, 0.6249631, 0.6605852, 0.4159907, 0.6243966, 0.6612634, 0.4157638, 0.6240429, 0.661997, 0.415127, 0.6239848, 0.6617043, 0.4156807, 0.6239443, 0.6615627, 0.4159666, 0.6240077, 0.6612911, 0.4163033, 0.6244079, 0.6608614, 0.4163856, 0.623203, 0.6606135, 0.4185783, 0.6231922, 0.6602808, 0.4191191, 0.623082, 0.6603783, 0.4191292, 0.6229774, 0.6606895, 0.4187942, 0.6230592, 0.6621141, 0.4164158, 0.6233672, 0.6610828, 0.4175917, 0.6230316, 0.6608247, 0.4185002, 0.6231324, 0.6610277, 0.4180291, 0.6234201, 0.6603788, 0.4186253, 0.6236126, 0.6606677, 0.4178822, 0.6238474, 0.6603039, 0.4181066, 0.6234521, 0.6606346, 0.418174, 0.6234942, 0.6604779, 0.4183586, 0.6235541, 0.660671, 0.4179644, 0.624312, 0.6609376, 0.4164085, 0.624312, 0.6609376, 0.4164085, 0.6235712, 0.6613821, 0.4168125, 0.6236259, 0.6613822, 0.4167305]
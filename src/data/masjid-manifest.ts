@@ -0,0 +1,165 @@
+/**
+ * Masjid Chunk Manifest
+ *
+ * Auto-generated by scripts/generate_masjids_ts.py. Maps each masjid id
+ * to its region and each region to the chunk holding its records.
+ */
+
+import type { Masjid, Region } from '@/types'
+
+export const MASJID_REGIONS: Record<string, Region> = {
+  'n-001': 'north',
+  'n-002': 'north',
+  'n-003': 'north',
+  'n-004': 'north',
+  'n-005': 'north',
+  'n-006': 'north',
+  'n-007': 'north',
+  'n-008': 'north',
+  'n-009': 'north',
+  'n-010': 'north',
+  'n-011': 'north',
+  'n-012': 'north',
+  'n-013': 'north',
+  'n-014': 'north',
+  'n-015': 'north',
+  'n-016': 'north',
+  'n-017': 'north',
+  'n-018': 'north',
+  'n-019': 'north',
+  'n-020': 'north',
+  'n-021': 'north',
+  'n-022': 'north',
+  'n-023': 'north',
+  'n-024': 'north',
+  'n-025': 'north',
+  'n-026': 'north',
+  'n-027': 'north',
+  'n-028': 'north',
+  'n-029': 'north',
+  'n-030': 'north',
+  'n-031': 'north',
+  'n-032': 'north',
+  'n-033': 'north',
+  'n-034': 'north',
+  'n-035': 'north',
+  'n-036': 'north',
+  'n-037': 'north',
+  'n-038': 'north',
+  'n-039': 'north',
+  'n-040': 'north',
+  'n-041': 'north',
+  'n-042': 'north',
+  'n-043': 'north',
+  'n-044': 'north',
+  'n-045': 'north',
+  'n-046': 'north',
+  'n-047': 'north',
+  'n-048': 'north',
+  'n-049': 'north',
+  'n-050': 'north',
+  'n-051': 'north',
+  'n-052': 'north',
+  'n-053': 'north',
+  'n-054': 'north',
+  'e-001': 'east',
+  'e-002': 'east',
+  'e-003': 'east',
+  'e-004': 'east',
+  'e-005': 'east',
+  'e-006': 'east',
+  'e-007': 'east',
+  'e-008': 'east',
+  'e-009': 'east',
+  'e-010': 'east',
+  'e-011': 'east',
+  'e-012': 'east',
+  'e-013': 'east',
+  'e-014': 'east',
+  'e-015': 'east',
+  'e-016': 'east',
+  'e-017': 'east',
+  'e-018': 'east',
+  'e-019': 'east',
+  'e-020': 'east',
+  'e-021': 'east',
+  'e-022': 'east',
+  'e-023': 'east',
+  'e-024': 'east',
+  'e-025': 'east',
+  'e-026': 'east',
+  'e-027': 'east',
+  'e-028': 'east',
+  'e-029': 'east',
+  'e-030': 'east',
+  'e-031': 'east',
+  'e-032': 'east',
+  'e-033': 'east',
+  'e-034': 'east',
+  'e-035': 'east',
+  'e-036': 'east',
+  'e-037': 'east',
+  'e-038': 'east',
+  'e-039': 'east',
+  'e-040': 'east',
+  'e-041': 'east',
+  'e-042': 'east',
+  'e-043': 'east',
+  'e-044': 'east',
+  'e-045': 'east',
+  'e-046': 'east',
+  'e-047': 'east',
+  'e-048': 'east',
+  'e-049': 'east',
+  'e-050': 'east',
+  'e-051': 'east',
+  'e-052': 'east',
+  'e-053': 'east',
+  'e-054': 'east',
+  'ws-001': 'westSouth',
+  'ws-002': 'westSouth',
+  'ws-003': 'westSouth',
+  'ws-004': 'westSouth',
+  'ws-005': 'westSouth',
+  'ws-006': 'westSouth',
+  'ws-007': 'westSouth',
+  'ws-008': 'westSouth',
+  'ws-009': 'westSouth',
+  'ws-010': 'westSouth',
+  'ws-011': 'westSouth',
+  'ws-012': 'westSouth',
+  'ws-013': 'westSouth',
+  'ws-014': 'westSouth',
+  'ws-015': 'westSouth',
+  'ws-016': 'westSouth',
+  'ws-017': 'westSouth',
+  'ws-018': 'westSouth',
+  'ws-019': 'westSouth',
+  'ws-020': 'westSouth',
+  'ws-021': 'westSouth',
+  'ws-022': 'westSouth',
+  'ws-023': 'westSouth',
+  'ws-024': 'westSouth',
+  'ws-025': 'westSouth',
+  'ws-026': 'westSouth',
+  'ws-027': 'westSouth',
+  'ws-028': 'westSouth',
+  'ws-029': 'westSouth',
+  'ws-030': 'westSouth',
+  'ws-031': 'westSouth',
+  'ws-032': 'westSouth',
+  'ws-033': 'westSouth',
+  'ws-034': 'westSouth',
+  'ws-035': 'westSouth',
+  'ws-036': 'westSouth',
+  'ws-037': 'westSouth',
+  'ws-038': 'westSouth',
+  'ws-039': 'westSouth',
+  'ws-040': 'westSouth',
+}
+
+export const REGION_CHUNKS: Record<Region, () => Promise<{ MASJIDS: Masjid[] }>> = {
+  north: () => import('./regions/north'),
+  east: () => import('./regions/east'),
+  westSouth: () => import('./regions/westSouth'),
+}
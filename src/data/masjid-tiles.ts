@@ -0,0 +1,11 @@
+/**
+ * Masjid Map Tiles
+ *
+ * Auto-generated by scripts/vector_tiles.py. URL of the PMTiles archive of
+ * masjid markers, its source layer and the zoom range it covers.
+ */
+
+export const MASJID_TILES_URL = '/data/masjids.pmtiles?v=2f1dbe9e6e91'
+export const MASJID_TILES_LAYER = 'masjids'
+export const TILES_MIN_ZOOM = 9
+export const TILES_MAX_ZOOM = 16
@@ -0,0 +1,498 @@
+/**
+ * Masjid Data: East Region (الشرق)
+ *
+ * Auto-generated by scripts/generate_masjids_ts.py. Loaded on demand
+ * through REGION_CHUNKS in src/data/masjid-manifest.ts.
+ */
+
+import type { Masjid } from '@/types'
+
+export const MASJIDS: Masjid[] = [
+  {
+    id: 'e-001',
+    readerName: 'عبدالله العليان',
+    masjidName: 'غرناطة، مسجد سيد الشهداء',
+    region: 'east',
+    coordinates: { lat: 24.7911664, lng: 46.7339892 },
+    googleMapsUrl: 'https://maps.app.goo.gl/4A5LhMiwrmPS5eC57?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-001.m4a',
+  },
+  {
+    id: 'e-002',
+    readerName: 'عبدالعزيز م الأحمد',
+    masjidName: 'قرطبة، جامع البسام',
+    region: 'east',
+    coordinates: { lat: 24.8282505, lng: 46.7309626 },
+    googleMapsUrl: 'https://maps.app.goo.gl/vtcAc4VTiPEicec6A?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-002.m4a',
+  },
+  {
+    id: 'e-003',
+    readerName: 'محمد اللحيدان',
+    masjidName: 'الأندلس، جامع الناصر',
+    region: 'east',
+    coordinates: { lat: 24.7409168, lng: 46.7959884 },
+    googleMapsUrl: 'https://maps.app.goo.gl/uFg7cv7h5KZb1ppE8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-003.m4a',
+  },
+  {
+    id: 'e-004',
+    readerName: 'عاصم اللحيدان',
+    masjidName: 'السلام، جامع العواد',
+    region: 'east',
+    coordinates: { lat: 24.7086136, lng: 46.8083909 },
+    googleMapsUrl: 'https://maps.app.goo.gl/qefFS2YY4B31dSFYA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-004.m4a',
+  },
+  {
+    id: 'e-005',
+    readerName: 'عبدالله الحمّيد',
+    masjidName: 'الملك فيصل، جامع اللحيدان',
+    region: 'east',
+    coordinates: { lat: 24.7538431, lng: 46.7731631 },
+    googleMapsUrl: 'https://maps.app.goo.gl/nN5kozSkENc8sJLV6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-005.m4a',
+  },
+  {
+    id: 'e-006',
+    readerName: 'عبدالملك المسعود',
+    masjidName: 'السلام، جامع إمام الدعوة',
+    region: 'east',
+    coordinates: { lat: 24.7083747, lng: 46.8205896 },
+    googleMapsUrl: 'https://maps.app.goo.gl/1kYtGPTtLDCrwKJ4A?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-006.m4a',
+  },
+  {
+    id: 'e-007',
+    readerName: 'عبدالملك الراجح',
+    masjidName: 'الملك عبدالله، جامع نورة الغصن',
+    region: 'east',
+    coordinates: { lat: 24.7324005, lng: 46.7422902 },
+    googleMapsUrl: 'https://maps.app.goo.gl/2HiA2grhNr7w9CHi8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-007.m4a',
+  },
+  {
+    id: 'e-008',
+    readerName: 'ناصر العصفور وحمزة الطيار',
+    masjidName: 'الجزيرة، جامع الراجحي',
+    region: 'east',
+    coordinates: { lat: 24.6772732, lng: 46.7797386 },
+    googleMapsUrl: 'https://maps.app.goo.gl/X25i9HyhiVF7sKQv8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-008.m4a',
+  },
+  {
+    id: 'e-009',
+    readerName: 'طاهر الصميلي',
+    masjidName: 'الرمال، جامع سلطان البابطين',
+    region: 'east',
+    coordinates: { lat: 24.9205552, lng: 46.8113792 },
+    googleMapsUrl: 'https://maps.app.goo.gl/cKq344ieedEZJrzL8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-009.m4a',
+  },
+  {
+    id: 'e-010',
+    readerName: 'بدر الألمعي',
+    masjidName: 'المونسية، جامع الخضير',
+    region: 'east',
+    coordinates: { lat: 24.8176009, lng: 46.7797006 },
+    googleMapsUrl: 'https://maps.app.goo.gl/AhKrp72kWo7U7TbB6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-010.m4a',
+  },
+  {
+    id: 'e-011',
+    readerName: 'نايف الجاسر',
+    masjidName: 'المونسية، جامع صالح الصقري',
+    region: 'east',
+    coordinates: { lat: 24.8365567, lng: 46.7447234 },
+    googleMapsUrl: 'https://maps.app.goo.gl/kAhs1JB8AJ89WkB46?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-011.m4a',
+  },
+  {
+    id: 'e-012',
+    readerName: 'عبدالعزيز الدسيماني',
+    masjidName: 'الصفا، جامع الراجحي القديم',
+    region: 'east',
+    coordinates: { lat: 24.6759751, lng: 46.7765929 },
+    googleMapsUrl: 'https://maps.app.goo.gl/nH2QkYTxHdqnsujw8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-012.m4a',
+  },
+  {
+    id: 'e-013',
+    readerName: 'عبدالعزيز الجريسي',
+    masjidName: 'الجزيرة، مسجد جعفر الطيار',
+    region: 'east',
+    coordinates: { lat: 24.6823005, lng: 46.7916663 },
+    googleMapsUrl: 'https://maps.app.goo.gl/PqNwrPJR2c6zXN2f6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-013.m4a',
+  },
+  {
+    id: 'e-014',
+    readerName: 'عبدالرحمن العوّيد',
+    masjidName: 'الجزيرة، مسجد الجوير',
+    region: 'east',
+    coordinates: { lat: 24.6760003, lng: 46.7928666 },
+    googleMapsUrl: 'https://maps.app.goo.gl/kj6KkFWgA9J5HP3K7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-014.m4a',
+  },
+  {
+    id: 'e-015',
+    readerName: 'يوسف السعيد',
+    masjidName: 'قرطبة، مسجد المقبل',
+    region: 'east',
+    coordinates: { lat: 24.8335091, lng: 46.739965 },
+    googleMapsUrl: 'https://maps.app.goo.gl/nUhbz4Pe2ViAc12XA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1788650603373031871?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'e-016',
+    readerName: 'بندر الجميعة',
+    masjidName: 'الفيحاء، جامع عكاشة بن محصن',
+    region: 'east',
+    coordinates: { lat: 24.6705739, lng: 46.8052949 },
+    googleMapsUrl: 'https://maps.app.goo.gl/3vzS55FXZPr6P2Wy6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-016.m4a',
+  },
+  {
+    id: 'e-017',
+    readerName: 'هادي آل عسكر',
+    masjidName: 'قرطبة، جامع حمد البابطين',
+    region: 'east',
+    coordinates: { lat: 24.8051986, lng: 46.742363 },
+    googleMapsUrl: 'https://maps.app.goo.gl/Jno5RyVyQMYmhqZM7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-017.m4a',
+  },
+  {
+    id: 'e-018',
+    readerName: 'مالك العبدالمنعم',
+    masjidName: 'الروابي، مسجد العمرين',
+    region: 'east',
+    coordinates: { lat: 24.6888691, lng: 46.788096 },
+    googleMapsUrl: 'https://maps.app.goo.gl/9gsV8837BBd4VCFd7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-018.m4a',
+  },
+  {
+    id: 'e-019',
+    readerName: 'محمد القاسم',
+    masjidName: 'الجزيرة، جامع العمر',
+    region: 'east',
+    coordinates: { lat: 24.6832461, lng: 46.7939579 },
+    googleMapsUrl: 'https://maps.app.goo.gl/Ls2Gh7nNPxwNifqD7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-019.m4a',
+  },
+  {
+    id: 'e-020',
+    readerName: 'إسماعيل المقحم',
+    masjidName: 'الربوة، مسجد الفالح',
+    region: 'east',
+    coordinates: { lat: 24.6922174, lng: 46.7712879 },
+    googleMapsUrl: 'https://maps.app.goo.gl/jmV9ED3NEN7bEryn7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-020.m4a',
+  },
+  {
+    id: 'e-021',
+    readerName: 'عمير شميم',
+    masjidName: 'الربوة، مسجد الفاضل',
+    region: 'east',
+    coordinates: { lat: 24.6929635, lng: 46.7625481 },
+    googleMapsUrl: 'https://maps.app.goo.gl/ZiHByuKGGyqC59qm7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-021.m4a',
+  },
+  {
+    id: 'e-022',
+    readerName: 'سلمان العتيبي',
+    masjidName: 'اليرموك، جامع البلوي',
+    region: 'east',
+    coordinates: { lat: 24.8059047, lng: 46.7646092 },
+    googleMapsUrl: 'https://maps.app.goo.gl/ZNkKSMB1QfVCtuQJ9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-022.m4a',
+  },
+  {
+    id: 'e-023',
+    readerName: 'علي النجيدي',
+    masjidName: 'الجزيرة، جامع الحمد',
+    region: 'east',
+    coordinates: { lat: 24.6807756, lng: 46.7849994 },
+    googleMapsUrl: 'https://maps.app.goo.gl/zJX6zStYYcpTUVvWA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-023.m4a',
+  },
+  {
+    id: 'e-024',
+    readerName: 'عبدالملك السالم',
+    masjidName: 'الريان، مسجد العبيدان',
+    region: 'east',
+    coordinates: { lat: 24.7162815, lng: 46.7723796 },
+    googleMapsUrl: 'https://maps.app.goo.gl/S3s6TE5yh8E4WouE8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-024.m4a',
+  },
+  {
+    id: 'e-025',
+    readerName: 'عبدالعزيز المقبل',
+    masjidName: 'اليرموك، جامع ناشي الدوسري',
+    region: 'east',
+    coordinates: { lat: 24.8166502, lng: 46.7905267 },
+    googleMapsUrl: 'https://maps.app.goo.gl/nvEq55NVRQiRsdvz7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-025.m4a',
+  },
+  {
+    id: 'e-026',
+    readerName: 'نجيب الصبي',
+    masjidName: 'الحمراء، جامع الإيمان',
+    region: 'east',
+    coordinates: { lat: 24.7848449, lng: 46.7523193 },
+    googleMapsUrl: 'https://maps.app.goo.gl/xnhw2LkbfxqEiVgAA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-026.m4a',
+  },
+  {
+    id: 'e-027',
+    readerName: 'فهد السديس',
+    masjidName: 'النسيم، مسجد السديس',
+    region: 'east',
+    coordinates: { lat: 24.7248138, lng: 46.8130553 },
+    googleMapsUrl: 'https://maps.app.goo.gl/zULwvcagJsU2f4Wr9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-027.m4a',
+  },
+  {
+    id: 'e-028',
+    readerName: 'عبدالرحمن العمري',
+    masjidName: 'الملز، جامع طارق مراد',
+    region: 'east',
+    coordinates: { lat: 24.681386, lng: 46.7241578 },
+    googleMapsUrl: 'https://maps.app.goo.gl/ksqtUQMGBE2JRuDp7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1450405321982320647?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'e-029',
+    readerName: 'عبدالعزيز القرني',
+    masjidName: 'الريان، جامع أبي بكر الصديق',
+    region: 'east',
+    coordinates: { lat: 24.7073733, lng: 46.7732593 },
+    googleMapsUrl: 'https://maps.app.goo.gl/SbP5ctBjX8yEbpVA7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-029.m4a',
+  },
+  {
+    id: 'e-030',
+    readerName: 'عبدالملك العمري',
+    masjidName: 'الفيحاء، جامع الدخيل',
+    region: 'east',
+    coordinates: { lat: 24.6818052, lng: 46.8043783 },
+    googleMapsUrl: 'https://maps.app.goo.gl/joccBy3Fzvo9RjMV6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-030.m4a',
+  },
+  {
+    id: 'e-031',
+    readerName: 'عبدالله العمار',
+    masjidName: 'الجزيرة، مسجد روضة الصالحين',
+    region: 'east',
+    coordinates: { lat: 24.6731616, lng: 46.7820525 },
+    googleMapsUrl: 'https://maps.app.goo.gl/FpmALRVFVpeyDs3u9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-031.m4a',
+  },
+  {
+    id: 'e-032',
+    readerName: 'خالد الجميعة',
+    masjidName: 'الحمراء، جامع الغويري',
+    region: 'east',
+    coordinates: { lat: 24.7790758, lng: 46.7463876 },
+    googleMapsUrl: 'https://maps.app.goo.gl/HjMfYcNCTMLVUUGu7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-032.m4a',
+  },
+  {
+    id: 'e-033',
+    readerName: 'محمد الحافي',
+    masjidName: 'الحمراء، جامع لطيفة آل الشيخ',
+    region: 'east',
+    coordinates: { lat: 24.7865236, lng: 46.7642709 },
+    googleMapsUrl: 'https://maps.app.goo.gl/MoRL1RWNo9L182qo8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-033.m4a',
+  },
+  {
+    id: 'e-034',
+    readerName: 'عبدالرحمن الرويلي',
+    masjidName: 'الجنادرية، جامع المهيد',
+    region: 'east',
+    coordinates: { lat: 24.7811959, lng: 46.8960643 },
+    googleMapsUrl: 'https://maps.app.goo.gl/AVPgHu4GVt9Q5Twd6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-034.m4a',
+  },
+  {
+    id: 'e-035',
+    readerName: 'عبدالرحمن العنقري',
+    masjidName: 'السليمانية، جامع الربيّع',
+    region: 'east',
+    coordinates: { lat: 24.7102217, lng: 46.6902986 },
+    googleMapsUrl: 'https://maps.app.goo.gl/iHJbpoNo1kjx5pef8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-035.m4a',
+  },
+  {
+    id: 'e-036',
+    readerName: 'عبدالعزيز الفراج',
+    masjidName: 'الريان، مسجد مصعب بن عمير',
+    region: 'east',
+    coordinates: { lat: 24.7015008, lng: 46.7739527 },
+    googleMapsUrl: 'https://maps.app.goo.gl/fH3KxpKW66fHcnT39?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-036.m4a',
+  },
+  {
+    id: 'e-037',
+    readerName: 'أنس الميمان',
+    masjidName: 'المغرزات، جامع والدة هشام الموسى',
+    region: 'east',
+    coordinates: { lat: 24.7724403, lng: 46.7432539 },
+    googleMapsUrl: 'https://maps.app.goo.gl/sUg7qzQ2VSDm61Mr5?g_st=iw',
+    audioUrl: 'https://t.me/guraa46/58',
+  },
+  {
+    id: 'e-038',
+    readerName: 'عبدالكريم الزغيبي',
+    masjidName: 'الصفا، جامع نور الهدى',
+    region: 'east',
+    coordinates: { lat: 24.6716672, lng: 46.7882095 },
+    googleMapsUrl: 'https://maps.app.goo.gl/7GyrVr6EQwgoqY9QA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-038.m4a',
+  },
+  {
+    id: 'e-039',
+    readerName: 'وليد الشهري',
+    masjidName: 'قرطبة، جامع البدراني',
+    region: 'east',
+    coordinates: { lat: 24.8227008, lng: 46.7414081 },
+    googleMapsUrl: 'https://maps.app.goo.gl/qk4ujHpJ6zMKqP276?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-039.m4a',
+  },
+  {
+    id: 'e-040',
+    readerName: 'أنس الجعفري',
+    masjidName: 'النسيم، جامع التوحيد',
+    region: 'east',
+    coordinates: { lat: 24.7353667, lng: 46.8336277 },
+    googleMapsUrl: 'https://maps.app.goo.gl/H1u3JpqZFtCmqg3YA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1794804263123558613?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'e-041',
+    readerName: 'براك الشمري',
+    masjidName: 'النهضة، جامع اللحيدان',
+    region: 'east',
+    coordinates: { lat: 24.7471333, lng: 46.803807 },
+    googleMapsUrl: 'https://maps.app.goo.gl/Wa7KAqHmKRkS8p8n6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-041.m4a',
+  },
+  {
+    id: 'e-042',
+    readerName: 'مجاهد الدبيان',
+    masjidName: 'الحمراء، مسجد الحمد',
+    region: 'east',
+    coordinates: { lat: 24.7043564, lng: 46.7181404 },
+    googleMapsUrl: 'https://maps.app.goo.gl/F7BKWEkqPbkqWz7q7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-042.m4a',
+  },
+  {
+    id: 'e-043',
+    readerName: 'علي آل عسكر',
+    masjidName: 'قرطبة، جامع العبيلان',
+    region: 'east',
+    coordinates: { lat: 24.8178764, lng: 46.7213566 },
+    googleMapsUrl: 'https://maps.app.goo.gl/fi2qkS9VAKW7cFTdA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-043.m4a',
+  },
+  {
+    id: 'e-044',
+    readerName: 'عبدالعزيز الفريج',
+    masjidName: 'عليشة، مسجد الثنيان',
+    region: 'east',
+    coordinates: { lat: 24.6335071, lng: 46.6854948 },
+    googleMapsUrl: 'https://maps.app.goo.gl/n2GnBcRB8VwhSsaD9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/55',
+  },
+  {
+    id: 'e-045',
+    readerName: 'بدر البدر',
+    masjidName: 'الفيحاء، مسجد هارون الرشيد',
+    region: 'east',
+    coordinates: { lat: 24.6854043, lng: 46.7987279 },
+    googleMapsUrl: 'https://maps.app.goo.gl/MZx2dn3YACxbNL2b7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/59',
+  },
+  {
+    id: 'e-046',
+    readerName: 'عثمان الأنصاري',
+    masjidName: 'الربوة، جامع المصري',
+    region: 'east',
+    coordinates: { lat: 24.7041398, lng: 46.7669615 },
+    googleMapsUrl: 'https://maps.app.goo.gl/cuYvbj4jvcy6bR286?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-046.m4a',
+  },
+  {
+    id: 'e-047',
+    readerName: 'معاذ المطلق',
+    masjidName: 'الفيحاء، جامع زيد بن ثابت',
+    region: 'east',
+    coordinates: { lat: 24.6849832, lng: 46.8018007 },
+    googleMapsUrl: 'https://maps.app.goo.gl/tYrSkriLNNABhBro9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/62',
+  },
+  {
+    id: 'e-048',
+    readerName: 'عبدالرحمن السلمي',
+    masjidName: 'الأندلس، مسجد التركي',
+    region: 'east',
+    coordinates: { lat: 24.7364113, lng: 46.7888752 },
+    googleMapsUrl: 'https://maps.app.goo.gl/rWv92ygmqjqpNPyg6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-048.m4a',
+  },
+  {
+    id: 'e-049',
+    readerName: 'أحمد الشهري',
+    masjidName: 'الرمال، مسجد هيا الناجم',
+    region: 'east',
+    coordinates: { lat: 24.813721, lng: 46.8030744 },
+    googleMapsUrl: 'https://maps.app.goo.gl/XXrLGWimR5ywnjZX8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-049.m4a',
+  },
+  {
+    id: 'e-050',
+    readerName: 'عبدالحكيم العبود',
+    masjidName: 'الروابي، جامع طيبة',
+    region: 'east',
+    coordinates: { lat: 24.6829412, lng: 46.7863096 },
+    googleMapsUrl: 'https://maps.app.goo.gl/X4E3vK5jnttkoZLF6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-050.m4a',
+  },
+  {
+    id: 'e-051',
+    readerName: 'فيصل الرشود',
+    masjidName: 'الربوة، جامع الموسى',
+    region: 'east',
+    coordinates: { lat: 24.7082447, lng: 46.7681598 },
+    googleMapsUrl: 'https://maps.app.goo.gl/fqarJZuwsZpcVXtw6?g_st=ic',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-051.m4a',
+  },
+  {
+    id: 'e-052',
+    readerName: 'فارس العمران',
+    masjidName: 'الروابي، مسجد الفاروق',
+    region: 'east',
+    coordinates: { lat: 24.6771453, lng: 46.8210262 },
+    googleMapsUrl: 'https://maps.app.goo.gl/iQpx6o3SkDXg8JFW6?g_st=ic',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-052.m4a',
+  },
+  {
+    id: 'e-053',
+    readerName: 'ميدان اليوسف',
+    masjidName: 'الروابي، جامع العبود',
+    region: 'east',
+    coordinates: { lat: 24.687073, lng: 46.7820798 },
+    googleMapsUrl: 'https://maps.app.goo.gl/L6zyrPgXTDKpF2au5?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-053.m4a',
+  },
+  {
+    id: 'e-054',
+    readerName: 'عثمان السليماني',
+    masjidName: 'الفيحاء، جامع الدويش',
+    region: 'east',
+    coordinates: { lat: 24.6751653, lng: 46.803808 },
+    googleMapsUrl: 'https://maps.app.goo.gl/PPsKGkUwh55vzcoi7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/e-054.m4a',
+    notes: 'رمضان فقط',
+  },
+]
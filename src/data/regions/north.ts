@@ -0,0 +1,499 @@
+/**
+ * Masjid Data: North Region (الشمال)
+ *
+ * Auto-generated by scripts/generate_masjids_ts.py. Loaded on demand
+ * through REGION_CHUNKS in src/data/masjid-manifest.ts.
+ */
+
+import type { Masjid } from '@/types'
+
+export const MASJIDS: Masjid[] = [
+  {
+    id: 'n-001',
+    readerName: 'أحمد السويلم',
+    masjidName: 'حطين، جامع حطين',
+    region: 'north',
+    coordinates: { lat: 24.7632238, lng: 46.6177797 },
+    googleMapsUrl: 'https://maps.app.goo.gl/DnSeU4L9tFpq9LnW7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-001.m4a',
+  },
+  {
+    id: 'n-002',
+    readerName: 'عبدالرحمن الماجد',
+    masjidName: 'الملقا، جامع الماجد',
+    region: 'north',
+    coordinates: { lat: 24.7907117, lng: 46.5986755 },
+    googleMapsUrl: 'https://www.google.com/maps/place/%D8%AC%D8%A7%D9%85%D8%B9+%D8%A7%D9%84%D8%B4%D9%8A%D8%AE+%D9%85%D8%AD%D9%85%D8%AF+%D8%B9%D8%A8%D8%AF%D8%A7%D9%84%D9%84%D9%87+%D8%A7%D8%A8%D8%B1%D8%A7%D9%87%D9%8A%D9%85+%D8%A7%D9%84%D9%85%D8%A7%D8%AC%D8%AF%D8%8C+%D8%B4%D8%A7%D8%B1%D8%B9+%D8%A7%D9%84%D8%A3%D8%B4%D9%82%D8%B1%D8%8C+%D8%AD%D9%8A%D8%8C+%D8%A7%D9%84%D9%85%D9%84%D9%82%D8%A7%D8%8C+%D8%A7%D9%84%D8%B1%D9%8A%D8%A7%D8%B6+13522%E2%80%AD/@24.7907117,46.5986755,15z/data=!4m6!3m5!1s0x3e2ee3297a03e40b:0x4dfef4480f2d02f2!8m2!3d24.7907117!4d46.5986755!16s%2Fg%2F11rckl4cj3',
+    audioUrl: 'https://t.me/guraa46/38',
+  },
+  {
+    id: 'n-003',
+    readerName: 'أحمد العبيدي',
+    masjidName: 'الملقا، جامع الخنين',
+    region: 'north',
+    coordinates: { lat: 24.8365254, lng: 46.5387812 },
+    googleMapsUrl: 'https://www.google.com/maps/place/data=!4m2!3m1!1s0x3e2ee7c3119c5ccb:0x673011464445d5fb?entry=s&sa=X&ved=1t:8290&hl=ar-sa&ictx=111',
+    audioUrl: 'https://x.com/outsidetel/status/1798813097773203845?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'n-004',
+    readerName: 'سامي السلمي',
+    masjidName: 'القيروان، جامع سارة الموسى',
+    region: 'north',
+    coordinates: { lat: 24.8369832, lng: 46.5941099 },
+    googleMapsUrl: 'https://www.google.com/maps/place/RHPV%2BQJX+%D8%AC%D8%A7%D9%85%D8%B9+%D8%B3%D8%A7%D8%B1%D9%87+%D8%A8%D9%86%D8%AA+%D9%85%D9%88%D8%B3%D9%89+%D8%A7%D9%84%D9%85%D9%88%D8%B3%D9%89%D8%8C+%D8%A7%D9%84%D8%A7%D9%85%D9%8A%D8%B1+%D8%B3%D8%B9%D9%88%D8%AF+%D8%A8%D9%86+%D8%B9%D8%A8%D8%AF%D8%A7%D9%84%D9%84%D9%87+%D8%A8%D9%86+%D8%AC%D9%84%D9%88%D9%8A%D8%8C+%D8%A7%D9%84%D9%82%D9%8A%D8%B1%D9%88%D8%A7%D9%86%D8%8C+%D8%A7%D9%84%D8%B1%D9%8A%D8%A7%D8%B6+11514%E2%80%AD/@24.8369832,46.5941099,15z/data=!4m6!3m5!1s0x3e2ee55b27f07afb:0x351df9d76b2e81d1!8m2!3d24.8369832!4d46.5941099!16s%2Fg%2F11fklrp066?hl=ar-sa',
+    audioUrl: 'https://t.me/guraa46/39',
+  },
+  {
+    id: 'n-005',
+    readerName: 'ظُفر القليب',
+    masjidName: 'القيروان، جامع حصة الراجحي',
+    region: 'north',
+    coordinates: { lat: 24.8248671, lng: 46.5642398 },
+    googleMapsUrl: 'https://maps.app.goo.gl/ZUsYmy9s8iruFTyx8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/40',
+  },
+  {
+    id: 'n-006',
+    readerName: 'ماجد الحازمي',
+    masjidName: 'القيروان، جامع محمد المهنا',
+    region: 'north',
+    coordinates: { lat: 24.813941, lng: 46.5178096 },
+    googleMapsUrl: 'https://maps.app.goo.gl/Yg8rgHn9RobZwYKT9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1836524174669500805?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'n-007',
+    readerName: 'عبدالله المشعل',
+    masjidName: 'الملقا، مسجد موضي السبهان',
+    region: 'north',
+    coordinates: { lat: 24.7993323, lng: 46.5877219 },
+    googleMapsUrl: 'https://maps.app.goo.gl/AUQ5AEsAVMUuWdi16?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/41',
+  },
+  {
+    id: 'n-008',
+    readerName: 'عبدالله المنصور',
+    masjidName: 'حطين، جامع العجلان',
+    region: 'north',
+    coordinates: { lat: 24.7702958, lng: 46.5859966 },
+    googleMapsUrl: 'https://maps.app.goo.gl/urGkgd2U45BVyzBn8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1871619941482611034?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'n-009',
+    readerName: 'إبراهيم الحيدري',
+    masjidName: 'المصيف، مسجد العجلان',
+    region: 'north',
+    coordinates: { lat: 24.7584816, lng: 46.6827777 },
+    googleMapsUrl: 'https://maps.app.goo.gl/cjibhkD7dAZqA63V8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/Quraa_Riyadh/400',
+  },
+  {
+    id: 'n-010',
+    readerName: 'محمد العزوني',
+    masjidName: 'الياسمين، مسجد حصة الجريسي',
+    region: 'north',
+    coordinates: { lat: 24.8230443, lng: 46.662059 },
+    googleMapsUrl: 'https://maps.app.goo.gl/feQrqmauUnD9r5BJ9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-010.m4a',
+  },
+  {
+    id: 'n-011',
+    readerName: 'عبدالله الحسن',
+    masjidName: 'التعاون، جامع موضي العنقري',
+    region: 'north',
+    coordinates: { lat: 24.7758491, lng: 46.6938784 },
+    googleMapsUrl: 'https://maps.app.goo.gl/8oXXGLXxPbzRUkA18?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-011.m4a',
+  },
+  {
+    id: 'n-012',
+    readerName: 'عبدالعزيز التميمي',
+    masjidName: 'النرجس، جامع بامجلي',
+    region: 'north',
+    coordinates: { lat: 24.8526354, lng: 46.6504329 },
+    googleMapsUrl: 'https://maps.app.goo.gl/T6PsVPy62ciNndXW6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-012.m4a',
+  },
+  {
+    id: 'n-013',
+    readerName: 'عبدالعزيز التركي',
+    masjidName: 'الندى، جامع والدة الأمير بندر',
+    region: 'north',
+    coordinates: { lat: 24.7958747, lng: 46.6777854 },
+    googleMapsUrl: 'https://maps.app.goo.gl/cps1VPbKKmpS8AE58?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/42',
+  },
+  {
+    id: 'n-014',
+    readerName: 'عبدالعزيز الوثلان',
+    masjidName: 'التعاون، جامع القاضي',
+    region: 'north',
+    coordinates: { lat: 24.7730818, lng: 46.69089 },
+    googleMapsUrl: 'https://maps.app.goo.gl/vJA9juFKHvdWJJet5?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-014.m4a',
+  },
+  {
+    id: 'n-015',
+    readerName: 'عبدالرحمن الحسين',
+    masjidName: 'الغدير، جامع عبدالعزيز الماجد',
+    region: 'north',
+    coordinates: { lat: 24.7789858, lng: 46.655218 },
+    googleMapsUrl: 'https://maps.app.goo.gl/MH1tZYjwqrFt21187?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1559588001931575296?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'n-016',
+    readerName: 'عبدالعزيز عسيري',
+    masjidName: 'حطين، جامع الجوهرة الطويل',
+    region: 'north',
+    coordinates: { lat: 24.7459154, lng: 46.6019332 },
+    googleMapsUrl: 'https://maps.app.goo.gl/1uYNi17Nrz5UfDke9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1620888055862427648?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'n-017',
+    readerName: 'إبراهيم عسيري',
+    masjidName: 'الملقا، جامع بدر الراجحي',
+    region: 'north',
+    coordinates: { lat: 24.8374197, lng: 46.5377366 },
+    googleMapsUrl: 'https://maps.app.goo.gl/dUtQgjNs9bqbPCF86?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-017.m4a',
+  },
+  {
+    id: 'n-018',
+    readerName: 'علي الحازمي',
+    masjidName: 'جامع سكن أعضاء هيئة التدريس القديم',
+    region: 'north',
+    coordinates: { lat: 24.7151074, lng: 46.6261653 },
+    googleMapsUrl: 'https://maps.app.goo.gl/Jib91XvEqHJpdfZi6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/44',
+  },
+  {
+    id: 'n-019',
+    readerName: 'عبدالعزيز الدمخ',
+    masjidName: 'الفلاح، جامع التوحيد',
+    region: 'north',
+    coordinates: { lat: 24.7912053, lng: 46.7167479 },
+    googleMapsUrl: 'https://maps.app.goo.gl/HUBQeMsJ9VFV2Hn8A?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1839361790502924479?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'n-020',
+    readerName: 'طارق المحيسني',
+    masjidName: 'النرجس، جامع الموسى',
+    region: 'north',
+    coordinates: { lat: 24.896389, lng: 46.5991676 },
+    googleMapsUrl: 'https://maps.app.goo.gl/rmCh26sSYMZEWWH69?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-020.m4a',
+    notes: 'رمضان فقط',
+  },
+  {
+    id: 'n-021',
+    readerName: 'إبراهيم الشطيري',
+    masjidName: 'الواحة، مسجد عبدالرحمن الرومي',
+    region: 'north',
+    coordinates: { lat: 24.7418425, lng: 46.7135775 },
+    googleMapsUrl: 'https://maps.app.goo.gl/T6yggb5773v1qz7z5?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/61',
+  },
+  {
+    id: 'n-022',
+    readerName: 'سعود الحمدان',
+    masjidName: 'الملك فهد، مسجد مصعب بن عمير',
+    region: 'north',
+    coordinates: { lat: 24.7448646, lng: 46.669133 },
+    googleMapsUrl: 'https://maps.app.goo.gl/8GWtZSfCitttdDv37?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-022.m4a',
+  },
+  {
+    id: 'n-023',
+    readerName: 'عبدالله الموسى',
+    masjidName: 'واجهة روشن، جامع طرجم بن سعيدان',
+    region: 'north',
+    coordinates: { lat: 24.8400008, lng: 46.68176 },
+    googleMapsUrl: 'https://maps.app.goo.gl/EHPijWsYuyCe9BkG8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/st_msjd/status/1893386892718035225?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'n-024',
+    readerName: 'عبدالإله بن عون',
+    masjidName: 'الدرعية، مسجد الجوهرة السياري',
+    region: 'north',
+    coordinates: { lat: 24.7670124, lng: 46.5839721 },
+    googleMapsUrl: 'https://maps.app.goo.gl/yaVxF7Dd5zdJDVQP6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-024.m4a',
+  },
+  {
+    id: 'n-025',
+    readerName: 'خالد العبودي',
+    masjidName: 'العليا، جامع السلمان',
+    region: 'north',
+    coordinates: { lat: 24.6826338, lng: 46.6819065 },
+    googleMapsUrl: 'https://maps.app.goo.gl/1LzTgAGkLg6fxb6C8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-025.m4a',
+  },
+  {
+    id: 'n-026',
+    readerName: 'زياد النشوان',
+    masjidName: 'الربيع، جامع أنس بن مالك',
+    region: 'north',
+    coordinates: { lat: 24.7971125, lng: 46.6594827 },
+    googleMapsUrl: 'https://maps.app.goo.gl/JKCEYaCugzxo5FoR9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/46',
+  },
+  {
+    id: 'n-027',
+    readerName: 'ياسر الخميس',
+    masjidName: 'النرجس، جامع عبدالله السليمي',
+    region: 'north',
+    coordinates: { lat: 24.8294206, lng: 46.6850418 },
+    googleMapsUrl: 'https://maps.app.goo.gl/BC75hcn36HUVQzC48?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-027.m4a',
+  },
+  {
+    id: 'n-028',
+    readerName: 'أحمد العبيدان',
+    masjidName: 'النرجس، جامع المهيدب',
+    region: 'north',
+    coordinates: { lat: 24.9170112, lng: 46.6318613 },
+    googleMapsUrl: 'https://maps.app.goo.gl/5sH2drTp4MX5jybz5?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-028.m4a',
+  },
+  {
+    id: 'n-029',
+    readerName: 'محمد المضيان',
+    masjidName: 'الغدير، جامع الغدير',
+    region: 'north',
+    coordinates: { lat: 24.7734345, lng: 46.6454376 },
+    googleMapsUrl: 'https://maps.app.goo.gl/F7j3zUUEt3s7c87H7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/47',
+  },
+  {
+    id: 'n-030',
+    readerName: 'محمد اليحيى',
+    masjidName: 'القيروان، مسجد هيا العجلان',
+    region: 'north',
+    coordinates: { lat: 24.825325, lng: 46.5765126 },
+    googleMapsUrl: 'https://maps.app.goo.gl/gjK8udsQCd1eesn39?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/48',
+  },
+  {
+    id: 'n-031',
+    readerName: 'فهد الكثيري',
+    masjidName: 'القيروان، جامع الحميدان',
+    region: 'north',
+    coordinates: { lat: 24.8325564, lng: 46.5999861 },
+    googleMapsUrl: 'https://maps.app.goo.gl/dmKm2215EULysG58A?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-031.m4a',
+  },
+  {
+    id: 'n-032',
+    readerName: 'مهنا المهنا',
+    masjidName: 'القيروان، مسجد دلّيل آل الشيخ',
+    region: 'north',
+    coordinates: { lat: 24.8273662, lng: 46.578356 },
+    googleMapsUrl: 'https://maps.app.goo.gl/1CkgY9xn52SznvqF6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/49',
+  },
+  {
+    id: 'n-033',
+    readerName: 'عبدالرحمن السويدان',
+    masjidName: 'الياسمين، مسجد أنس بن مالك',
+    region: 'north',
+    coordinates: { lat: 24.8286147, lng: 46.6591444 },
+    googleMapsUrl: 'https://maps.app.goo.gl/2B6eUmmET18ZyNes7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/50',
+  },
+  {
+    id: 'n-034',
+    readerName: 'سند الضويلع',
+    masjidName: 'القيروان، جامع نورة الجميح',
+    region: 'north',
+    coordinates: { lat: 24.8283983, lng: 46.6074398 },
+    googleMapsUrl: 'https://maps.app.goo.gl/AhPv3tFTtLxyPDxP6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-034.m4a',
+  },
+  {
+    id: 'n-035',
+    readerName: 'ناصر السليم',
+    masjidName: 'الرحمانية، جامع الأميرة لطيفة',
+    region: 'north',
+    coordinates: { lat: 24.8283983, lng: 46.6074398 },
+    googleMapsUrl: 'https://maps.app.goo.gl/AhPv3tFTtLxyPDxP6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-035.m4a',
+  },
+  {
+    id: 'n-036',
+    readerName: 'صابر عبدالحكم',
+    masjidName: 'الخزامى، جامع عبدالرحمن الموسى',
+    region: 'north',
+    coordinates: { lat: 24.7193563, lng: 46.6586164 },
+    googleMapsUrl: 'https://maps.app.goo.gl/c2XbmTSKS88Ft6mdA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-036.m4a',
+  },
+  {
+    id: 'n-037',
+    readerName: 'محمد الجليل',
+    masjidName: 'الملقا، جامع نورة الحقباني',
+    region: 'north',
+    coordinates: { lat: 24.7176849, lng: 46.6015738 },
+    googleMapsUrl: 'https://maps.app.goo.gl/bTiQJeAM7fiykTFv8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-037.m4a',
+  },
+  {
+    id: 'n-038',
+    readerName: 'فهد العبدالعزيز',
+    masjidName: 'الربيع، مسجد والدة أحمد البلوي',
+    region: 'north',
+    coordinates: { lat: 24.782409, lng: 46.583812 },
+    googleMapsUrl: 'https://maps.app.goo.gl/7CYAeP71KyKPhQGx9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/51',
+  },
+  {
+    id: 'n-039',
+    readerName: 'زيد السلمي',
+    masjidName: 'القيروان، مسجد حسن الحصان',
+    region: 'north',
+    coordinates: { lat: 24.7853124, lng: 46.6544509 },
+    googleMapsUrl: 'https://maps.app.goo.gl/Q34bdnV7buLA5FXg8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/52',
+  },
+  {
+    id: 'n-040',
+    readerName: 'مشاري الفهيد',
+    masjidName: 'المرسلات، مسجد عثمان بن بشر',
+    region: 'north',
+    coordinates: { lat: 24.7399338, lng: 46.6861405 },
+    googleMapsUrl: 'https://maps.app.goo.gl/52KkKkW2C8rBy6Zw9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-040.m4a',
+  },
+  {
+    id: 'n-041',
+    readerName: 'إبراهيم الدوسري',
+    masjidName: 'الرحمانية، جامع الملك عبدالله',
+    region: 'north',
+    coordinates: { lat: 24.7061355, lng: 46.655513 },
+    googleMapsUrl: 'https://maps.app.goo.gl/wwYvb3VVdqrsvfzm6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-041.m4a',
+  },
+  {
+    id: 'n-042',
+    readerName: 'أحمد الجبير',
+    masjidName: 'النخيل، جامع الزامل',
+    region: 'north',
+    coordinates: { lat: 24.7421168, lng: 46.6102286 },
+    googleMapsUrl: 'https://maps.app.goo.gl/rRey4Pe3u4caoLTU6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-042.m4a',
+  },
+  {
+    id: 'n-043',
+    readerName: 'سلطان العمري',
+    masjidName: 'حطين، جامع الحكمة',
+    region: 'north',
+    coordinates: { lat: 24.7578119, lng: 46.6068793 },
+    googleMapsUrl: 'https://maps.app.goo.gl/kL6rdRxkXPXqc6vV9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-043.m4a',
+  },
+  {
+    id: 'n-044',
+    readerName: 'نايف السالم',
+    masjidName: 'حطين، جامع وسمية المعمر',
+    region: 'north',
+    coordinates: { lat: 24.7436768, lng: 46.5957159 },
+    googleMapsUrl: 'https://maps.app.goo.gl/iMPcyc1y5zzEfxPN9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-044.m4a',
+  },
+  {
+    id: 'n-045',
+    readerName: 'عبدالرحمن السويد',
+    masjidName: 'الملقا، مسجد المزيعل',
+    region: 'north',
+    coordinates: { lat: 24.8826263, lng: 46.6513155 },
+    googleMapsUrl: 'https://maps.app.goo.gl/VZt56WDpB1gtEbDC6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-045.m4a',
+    notes: 'رمضان فقط',
+  },
+  {
+    id: 'n-046',
+    readerName: 'عبدالعزيز العويرضي',
+    masjidName: 'الندى، مسجد هيلة العبودي',
+    region: 'north',
+    coordinates: { lat: 24.7928735, lng: 46.7085365 },
+    googleMapsUrl: 'https://maps.app.goo.gl/WgFvUyht7vhsVdHs7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/54',
+  },
+  {
+    id: 'n-047',
+    readerName: 'سعد الدويس',
+    masjidName: 'العارض، جامع عبدالعزيز الموسى',
+    region: 'north',
+    coordinates: { lat: 24.8305904, lng: 46.6215938 },
+    googleMapsUrl: 'https://maps.app.goo.gl/aUpaTTUhgw1dqqTa8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-047.m4a',
+  },
+  {
+    id: 'n-048',
+    readerName: 'أسامة عطران',
+    masjidName: 'الياسمين، مسجد الدهمش',
+    region: 'north',
+    coordinates: { lat: 24.8120902, lng: 46.6645913 },
+    googleMapsUrl: 'https://maps.app.goo.gl/e1RGG8AujPatuoKP8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-048.m4a',
+  },
+  {
+    id: 'n-049',
+    readerName: 'سلطان المسعري',
+    masjidName: 'الوادي، جامع زامل السليم',
+    region: 'north',
+    coordinates: { lat: 24.7831695, lng: 46.6897595 },
+    googleMapsUrl: 'https://maps.app.goo.gl/r6omPdVk7k98hZt38?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/Quraa_Riyadh/420',
+  },
+  {
+    id: 'n-050',
+    readerName: 'عبدالعزيز الخنين',
+    masjidName: 'القيروان، مسجد القيروان',
+    region: 'north',
+    coordinates: { lat: 24.8534574, lng: 46.615878 },
+    googleMapsUrl: 'https://maps.app.goo.gl/TX7rUZbFFQTdpRmB8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/53',
+  },
+  {
+    id: 'n-051',
+    readerName: 'سعد التوم',
+    masjidName: 'الربيع، جامع الهداب',
+    region: 'north',
+    coordinates: { lat: 24.7918834, lng: 46.6565934 },
+    googleMapsUrl: 'https://maps.app.goo.gl/pgauocqkonNYnyzP9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-051.m4a',
+  },
+  {
+    id: 'n-052',
+    readerName: 'عاصم عقيل',
+    masjidName: 'المصيف، مسجد عبدالرحمن بن عوف',
+    region: 'north',
+    coordinates: { lat: 24.7594096, lng: 46.6887295 },
+    googleMapsUrl: 'https://maps.app.goo.gl/msKyaxx6zk8V57TCA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-052.m4a',
+  },
+  {
+    id: 'n-053',
+    readerName: 'عبدالمحسن العسكر',
+    masjidName: 'النخيل، جامع الأميرة نورة بنت عبدالله',
+    region: 'north',
+    coordinates: { lat: 24.7478251, lng: 46.649006 },
+    googleMapsUrl: 'https://maps.app.goo.gl/vGzPhRoXYQiuUJ7v8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-053.m4a',
+  },
+  {
+    id: 'n-054',
+    readerName: 'ريان الدوسري',
+    masjidName: 'النفل، جامع سليمان اليحيا',
+    region: 'north',
+    coordinates: { lat: 24.779625, lng: 46.6644977 },
+    googleMapsUrl: 'https://maps.app.goo.gl/Wza24DgpauqWgW4f9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/n-054.m4a',
+  },
+]
@@ -0,0 +1,371 @@
+/**
+ * Masjid Data: West & South Region (الغرب والجنوب)
+ *
+ * Auto-generated by scripts/generate_masjids_ts.py. Loaded on demand
+ * through REGION_CHUNKS in src/data/masjid-manifest.ts.
+ */
+
+import type { Masjid } from '@/types'
+
+export const MASJIDS: Masjid[] = [
+  {
+    id: 'ws-001',
+    readerName: 'ماجد الزامل',
+    masjidName: 'عرقة، جامع الطيار',
+    region: 'westSouth',
+    coordinates: { lat: 24.685266, lng: 46.5769807 },
+    googleMapsUrl: 'https://maps.app.goo.gl/7RMQK2tYynPWYyUr6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/majedalzamil_Quran/554',
+  },
+  {
+    id: 'ws-002',
+    readerName: 'عمر النبراوي',
+    masjidName: 'عرقة، جامع عبدالمحسن بن سعيد',
+    region: 'westSouth',
+    coordinates: { lat: 24.7310042, lng: 46.6499 },
+    googleMapsUrl: 'https://maps.app.goo.gl/6EYfabCGEpZ22Vit9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-002.m4a',
+  },
+  {
+    id: 'ws-003',
+    readerName: 'حسن دغريري',
+    masjidName: 'عليشة، جامع الخريف',
+    region: 'westSouth',
+    coordinates: { lat: 24.6283391, lng: 46.6829916 },
+    googleMapsUrl: 'https://maps.app.goo.gl/6B35xKjigQdwGksD7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-003.m4a',
+  },
+  {
+    id: 'ws-004',
+    readerName: 'عبدالإله السويدان',
+    masjidName: 'السويدي، مسجد عبدالله بن مسعود',
+    region: 'westSouth',
+    coordinates: { lat: 24.5061137, lng: 46.6050074 },
+    googleMapsUrl: 'https://maps.app.goo.gl/8GVN17FRjir5A8JB8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1637576091882733572?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'ws-005',
+    readerName: 'عمار الجبرين',
+    masjidName: 'السويدي، جامع القصر',
+    region: 'westSouth',
+    coordinates: { lat: 24.5919083, lng: 46.7297934 },
+    googleMapsUrl: 'https://maps.app.goo.gl/4FV53gGv62rxdkjm9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1853824404519526869?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'ws-006',
+    readerName: 'عبدالله البكران',
+    masjidName: 'لبن، جامع الدغيثر',
+    region: 'westSouth',
+    coordinates: { lat: 24.5919083, lng: 46.7297934 },
+    googleMapsUrl: 'https://maps.app.goo.gl/4FV53gGv62rxdkjm9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1754204858930852190?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'ws-007',
+    readerName: 'سعود آل جمعة',
+    masjidName: 'لبن، جامع الرشيد',
+    region: 'westSouth',
+    coordinates: { lat: 24.6729831, lng: 46.5368913 },
+    googleMapsUrl: 'https://maps.app.goo.gl/6VAQnSzsbsayeBv18?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1683658330357616640?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'ws-008',
+    readerName: 'عبدالله العلياني',
+    masjidName: 'لبن، جامع هيلة الباني',
+    region: 'westSouth',
+    coordinates: { lat: 24.6466125, lng: 46.5635307 },
+    googleMapsUrl: 'https://maps.app.goo.gl/A9AFJ81WDDF61W4V7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/tilawat4/148',
+  },
+  {
+    id: 'ws-009',
+    readerName: 'مسعود القليب',
+    masjidName: 'نمار، جامع عبدالله بن مسعود',
+    region: 'westSouth',
+    coordinates: { lat: 24.6172273, lng: 46.4630983 },
+    googleMapsUrl: 'https://maps.app.goo.gl/mjozHfUYfnoFQdRm7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1569156883021266945?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'ws-010',
+    readerName: 'خالد الجليل',
+    masjidName: 'أم الحمام، جامع الملك خالد',
+    region: 'westSouth',
+    coordinates: { lat: 24.5621924, lng: 46.6804606 },
+    googleMapsUrl: 'https://maps.app.goo.gl/1mxAtNUWAMdUXYzFA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1382402749090967554?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'ws-011',
+    readerName: 'عبدالملك الحامد',
+    masjidName: 'شبرا، مسجد عبدالله البرغش',
+    region: 'westSouth',
+    coordinates: { lat: 24.7009556, lng: 46.6526873 },
+    googleMapsUrl: 'https://maps.app.goo.gl/R4PAFAqhvYsT1ttN7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1681482338859905024?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'ws-012',
+    readerName: 'مطرف المطرف',
+    masjidName: 'البديعة، مسجد الغيهب',
+    region: 'westSouth',
+    coordinates: { lat: 24.5995793, lng: 46.7123533 },
+    googleMapsUrl: 'https://maps.app.goo.gl/xhhnCX4XuBcFA95L9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-012.m4a',
+  },
+  {
+    id: 'ws-013',
+    readerName: 'محمد الحميد',
+    masjidName: 'العوالي، مسجد هيا الشثري',
+    region: 'westSouth',
+    coordinates: { lat: 24.6014175, lng: 46.6615437 },
+    googleMapsUrl: 'https://maps.app.goo.gl/SMMqbzoJRiga8C6i7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-013.m4a',
+  },
+  {
+    id: 'ws-014',
+    readerName: 'أحمد العبيد',
+    masjidName: 'العريجاء، جامع الأمير عبدالله بن سعد',
+    region: 'westSouth',
+    coordinates: { lat: 24.6066049, lng: 46.6246163 },
+    googleMapsUrl: 'https://maps.app.goo.gl/JmJxqM8FGSZtYRJX9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1537117053718515712?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'ws-015',
+    readerName: 'هلال الحارثي',
+    masjidName: 'طويق، جامع غزوى المطيري',
+    region: 'westSouth',
+    coordinates: { lat: 24.5817223, lng: 46.5872421 },
+    googleMapsUrl: 'https://maps.app.goo.gl/Tkj36vgLS4cxa5mm8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-015.m4a',
+  },
+  {
+    id: 'ws-016',
+    readerName: 'فارس السبيعي',
+    masjidName: 'عرقة، مسجد نورة الهلال',
+    region: 'westSouth',
+    coordinates: { lat: 24.6901412, lng: 46.5970439 },
+    googleMapsUrl: 'https://maps.app.goo.gl/SWFuJ8LJorqRgk6Y9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-016.m4a',
+  },
+  {
+    id: 'ws-017',
+    readerName: 'مهند الدواس',
+    masjidName: 'العزيزية، مسجد أبي دجانة',
+    region: 'westSouth',
+    coordinates: { lat: 24.5957223, lng: 46.7607944 },
+    googleMapsUrl: 'https://maps.app.goo.gl/fCLAa9CUC8yuMner7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-017.m4a',
+  },
+  {
+    id: 'ws-018',
+    readerName: 'مرزوق الأحمد',
+    masjidName: 'شبرا، جامع الراجحي',
+    region: 'westSouth',
+    coordinates: { lat: 24.5802048, lng: 46.6761956 },
+    googleMapsUrl: 'https://maps.app.goo.gl/DpT6TCDChxcEq48x5?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-018.m4a',
+  },
+  {
+    id: 'ws-019',
+    readerName: 'ثامر الزير',
+    masjidName: 'عرقة، جامع الجريسي',
+    region: 'westSouth',
+    coordinates: { lat: 24.6754738, lng: 46.5829941 },
+    googleMapsUrl: 'https://maps.app.goo.gl/fhALkv6svCwGosBS6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-019.m4a',
+  },
+  {
+    id: 'ws-020',
+    readerName: 'سعيد القحطاني',
+    masjidName: 'عرقة، جامع حصة آل سعود',
+    region: 'westSouth',
+    coordinates: { lat: 24.66064, lng: 46.5534869 },
+    googleMapsUrl: 'https://maps.app.goo.gl/bcqZSLibG69PzSmz8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/37',
+  },
+  {
+    id: 'ws-021',
+    readerName: 'فهد قحل',
+    masjidName: 'لبن، جامع عبدالله العجلان',
+    region: 'westSouth',
+    coordinates: { lat: 24.6525558, lng: 46.5578485 },
+    googleMapsUrl: 'https://maps.app.goo.gl/JCpeaPZ7p6HZ6dVD6?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/tlawaatt/1308',
+  },
+  {
+    id: 'ws-022',
+    readerName: 'عبدالعزيز اليحيى',
+    masjidName: 'الشفاء، جامع الهويش',
+    region: 'westSouth',
+    coordinates: { lat: 24.576185, lng: 46.7085806 },
+    googleMapsUrl: 'https://maps.app.goo.gl/JvEXkNAZAAgK5ErW9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/tlawaatt/705',
+  },
+  {
+    id: 'ws-023',
+    readerName: 'نايف الحميدي',
+    masjidName: 'السويدي، مسجد طارق بن زياد',
+    region: 'westSouth',
+    coordinates: { lat: 24.5681414, lng: 46.6290209 },
+    googleMapsUrl: 'https://maps.app.goo.gl/e9Q6fJE6VxwyiuiKA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-023.m4a',
+  },
+  {
+    id: 'ws-024',
+    readerName: 'ثامر العامري',
+    masjidName: 'العريجاء، جامع آل عشيوان',
+    region: 'westSouth',
+    coordinates: { lat: 24.6080495, lng: 46.6323096 },
+    googleMapsUrl: 'https://maps.app.goo.gl/YmJqco5ehjKweFmF7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/57',
+  },
+  {
+    id: 'ws-025',
+    readerName: 'محمد الجساس',
+    masjidName: 'الشفاء، جامع الأميرة هيا',
+    region: 'westSouth',
+    coordinates: { lat: 24.6080495, lng: 46.6323096 },
+    googleMapsUrl: 'https://maps.app.goo.gl/YmJqco5ehjKweFmF7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-025.m4a',
+  },
+  {
+    id: 'ws-026',
+    readerName: 'طلال باكرمان',
+    masjidName: 'العزيزية، جامع خديجة بغلف',
+    region: 'westSouth',
+    coordinates: { lat: 24.556405, lng: 46.7139976 },
+    googleMapsUrl: 'https://maps.app.goo.gl/dUb1fGEMgxFQtCZv9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-026.m4a',
+  },
+  {
+    id: 'ws-027',
+    readerName: 'محمد القرعاني',
+    masjidName: 'العزيزية، مسجد أسيد بن حضير',
+    region: 'westSouth',
+    coordinates: { lat: 24.5871544, lng: 46.7883407 },
+    googleMapsUrl: 'https://maps.app.goo.gl/UVaxdpmADdVoEeYQ8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-027.m4a',
+  },
+  {
+    id: 'ws-028',
+    readerName: 'فهد البواردي',
+    masjidName: 'الشفاء، جامع سليمان العودة',
+    region: 'westSouth',
+    coordinates: { lat: 24.5273173, lng: 46.6904415 },
+    googleMapsUrl: 'https://maps.app.goo.gl/TSPaJoQS5JfxaL6t8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-028.m4a',
+  },
+  {
+    id: 'ws-029',
+    readerName: 'عادل السنيد',
+    masjidName: 'الشفاء، جامع العقيلي',
+    region: 'westSouth',
+    coordinates: { lat: 24.541294, lng: 46.7026395 },
+    googleMapsUrl: 'https://maps.app.goo.gl/Jt2UUtWPXezromQR8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://x.com/outsidetel/status/1864727521905737749?s=61&t=jRNjWatPaIND0-092qCaHw',
+  },
+  {
+    id: 'ws-030',
+    readerName: 'عبدالله الخراز',
+    masjidName: 'اليمامة، مجمع الصحابة',
+    region: 'westSouth',
+    coordinates: { lat: 24.5954139, lng: 46.7128874 },
+    googleMapsUrl: 'https://maps.app.goo.gl/FwZ74Wbiu8foFFb6A?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-030.m4a',
+  },
+  {
+    id: 'ws-031',
+    readerName: 'عبداللطيف العجلان',
+    masjidName: 'المنصورة، جامع القاسم',
+    region: 'westSouth',
+    coordinates: { lat: 24.581396, lng: 46.8113256 },
+    googleMapsUrl: 'https://maps.app.goo.gl/DRUiayy6KfQUM7AT8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-031.m4a',
+  },
+  {
+    id: 'ws-032',
+    readerName: 'رياض عسيري',
+    masjidName: 'لبن، جامع الباهلي',
+    region: 'westSouth',
+    coordinates: { lat: 24.6111824, lng: 46.5098208 },
+    googleMapsUrl: 'https://maps.app.goo.gl/oDqPHoHyKTpSHNMp8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-032.m4a',
+  },
+  {
+    id: 'ws-033',
+    readerName: 'محمد العيد',
+    masjidName: 'العزيزية، جامع مها الدوسري',
+    region: 'westSouth',
+    coordinates: { lat: 24.5947095, lng: 46.8241269 },
+    googleMapsUrl: 'https://maps.google.com/?q=%D9%85%D8%B3%D8%AC%D8%AF%20%D9%85%D9%87%D8%A7%20%D9%81%D8%A7%D9%84%D8%AD%20%D8%A7%D9%84%D8%AF%D9%88%D8%B3%D8%B1%D9%8A%D8%8C%207667%D8%8C%20%D8%A7%D9%84%D8%B9%D8%B2%D9%8A%D8%B2%D9%8A%D8%A9%D8%8C%20%D8%A7%D9%84%D8%B1%D9%8A%D8%A7%D8%B6%2014511%202631&ftid=0x3e2f09d88b2462ed:0x5f9ffe680877d19&entry=gps&lucs=,94242493,94224825,94227247,94227248,47071704,47069508,94218641,94203019,47084304,94208458,94208447&g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-033.m4a',
+  },
+  {
+    id: 'ws-034',
+    readerName: 'صالح الصويلحي',
+    masjidName: 'العزيزية، جامع شيخ الإسلام',
+    region: 'westSouth',
+    coordinates: { lat: 24.5872094, lng: 46.7660281 },
+    googleMapsUrl: 'https://maps.app.goo.gl/fVdqny6ELFLy9yqC8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-034.m4a',
+  },
+  {
+    id: 'ws-035',
+    readerName: 'علي الغنام',
+    masjidName: 'العزيزية، جامع محمد آل سعود',
+    region: 'westSouth',
+    coordinates: { lat: 24.5961436, lng: 46.771009 },
+    googleMapsUrl: 'https://maps.app.goo.gl/sH37LXrQN5aLuU3R7?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-035.m4a',
+  },
+  {
+    id: 'ws-036',
+    readerName: 'عبدالمحسن المحيسني',
+    masjidName: 'طويق، مسجد سعد القباني',
+    region: 'westSouth',
+    coordinates: { lat: 24.555195, lng: 46.5615526 },
+    googleMapsUrl: 'https://maps.app.goo.gl/45stPnPM5uqyyMZGA?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-036.m4a',
+  },
+  {
+    id: 'ws-037',
+    readerName: 'عبدالله الحارثي',
+    masjidName: 'المنصورة، جامع فاطمة الزهراء',
+    region: 'westSouth',
+    coordinates: { lat: 24.6085079, lng: 46.7406142 },
+    googleMapsUrl: 'https://maps.app.goo.gl/SJEyRdgR1UhZfmps8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://masjid.nawaf-alsheddi.com/youtube-audio/ws-037.m4a',
+  },
+  {
+    id: 'ws-038',
+    readerName: 'سعد القريشي',
+    masjidName: 'الحاير، جامع الأمير فهد آل سعود',
+    region: 'westSouth',
+    coordinates: { lat: 24.5520954, lng: 46.7622864 },
+    googleMapsUrl: 'https://maps.app.goo.gl/zJSW38vW9ya3H76w8?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/64',
+  },
+  {
+    id: 'ws-039',
+    readerName: 'أيوب الشبانات',
+    masjidName: 'الدريهمية، مسجد الجوهرة العبد السالم',
+    region: 'westSouth',
+    coordinates: { lat: 24.5906703, lng: 46.6968712 },
+    googleMapsUrl: 'https://maps.app.goo.gl/X5oNpeN476JKGRTa9?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/63',
+  },
+  {
+    id: 'ws-040',
+    readerName: 'محمد السعيد',
+    masjidName: 'السويدي، مسجد أبوبكر الصديق',
+    region: 'westSouth',
+    coordinates: { lat: 24.5674279, lng: 46.6425285 },
+    googleMapsUrl: 'https://maps.app.goo.gl/1TNoESk3QMebhdVs5?g_st=com.google.maps.preview.copy',
+    audioUrl: 'https://t.me/guraa46/66',
+  },
+]
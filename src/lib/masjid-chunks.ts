@@ -0,0 +1,68 @@
+/**
+ * Masjid Chunk Loading
+ *
+ * Loads masjid records per region chunk (see src/data/masjid-manifest.ts)
+ * instead of the full dataset. Promises are cached, so they can be passed
+ * straight to React's `use()` from page components. The KD-tree behind
+ * nearest-masjid searches is a chunk of its own, fetched on first search.
+ */
+
+import { MASJID_REGIONS, REGION_CHUNKS } from '@/data/masjid-manifest'
+import { NEAREST_MASJIDS } from '@/data/masjid-index'
+import type { Coordinates, Masjid, Region } from '@/types'
+
+export interface NearestMasjid {
+  masjid: Masjid
+  /** Great-circle distance in metres */
+  distance: number
+}
+
+const regionCache = new Map<Region, Promise<Masjid[]>>()
+const masjidCache = new Map<string, Promise<Masjid | undefined>>()
+const relatedCache = new Map<string, Promise<Masjid[]>>()
+
+export function loadRegionMasjids(region: Region): Promise<Masjid[]> {
+  let chunk = regionCache.get(region)
+  if (!chunk) {
+    chunk = REGION_CHUNKS[region]().then((module) => module.MASJIDS)
+    regionCache.set(region, chunk)
+  }
+  return chunk
+}
+
+export function loadMasjid(id: string): Promise<Masjid | undefined> {
+  let masjid = masjidCache.get(id)
+  if (!masjid) {
+    const region = MASJID_REGIONS[id]
+    masjid = region
+      ? loadRegionMasjids(region).then((masjids) => masjids.find((m) => m.id === id))
+      : Promise.resolve(undefined)
+    masjidCache.set(id, masjid)
+  }
+  return masjid
+}
+
+/** Nearest other masjids, loading only the chunks they live in */
+export function loadRelatedMasjids(id: string, limit = 4): Promise<Masjid[]> {
+  const key = `${id}:${limit}`
+  let related = relatedCache.get(key)
+  if (!related) {
+    const ids = (NEAREST_MASJIDS[id] ?? []).slice(0, limit).map(([neighbourId]) => neighbourId)
+    related = Promise.all(ids.map(loadMasjid)).then((masjids) =>
+      masjids.filter((m): m is Masjid => m !== undefined)
+    )
+    relatedCache.set(key, related)
+  }
+  return related
+}
+
+/** Masjids nearest to a point, nearest first, loading only the chunks they live in */
+export async function loadNearestMasjids(point: Coordinates, limit = 4): Promise<NearestMasjid[]> {
+  const { findNearest } = await import('@/lib/spatial-index')
+  const nearest = findNearest(point, limit)
+  const masjids = await Promise.all(nearest.map(({ id }) => loadMasjid(id)))
+  return nearest.flatMap(({ distance }, i) => {
+    const masjid = masjids[i]
+    return masjid ? [{ masjid, distance }] : []
+  })
+}
@@ -0,0 +1,203 @@
+/**
+ * PMTiles Protocol
+ *
+ * Serves vector tiles to MapLibre straight out of the PMTiles archive
+ * generated by scripts/vector_tiles.py. The header and root directory
+ * are fetched once per archive; after that each tile is a single HTTP
+ * range request, so only the tiles in view are downloaded. Leaf
+ * directories, which large archives page their entries into, are fetched
+ * on first use and cached. Supports the subset the generator writes:
+ * uncompressed directories and tiles.
+ *
+ * Tile URLs look like `pmtiles://<archive url>/{z}/{x}/{y}`.
+ */
+
+import type { RequestParameters } from 'maplibre-gl'
+
+export const PMTILES_PROTOCOL = 'pmtiles'
+
+const HEADER_FETCH_BYTES = 16384
+// The spec allows leaves to point at further leaves; the generator writes one level
+const MAX_DIRECTORY_DEPTH = 3
+const COMPRESSION_NONE = 1
+const TILE_URL = /^pmtiles:\/\/(.+)\/(\d+)\/(\d+)\/(\d+)$/
+
+interface Entry {
+  tileId: number
+  offset: number
+  length: number
+  runLength: number
+}
+
+interface Archive {
+  leafDirectoryOffset: number
+  tileDataOffset: number
+  entries: Entry[]
+  leaves: Map<number, Promise<Entry[]>>
+}
+
+const archives = new Map<string, Promise<Archive>>()
+
+function readUint64(view: DataView, offset: number): number {
+  return view.getUint32(offset, true) + view.getUint32(offset + 4, true) * 2 ** 32
+}
+
+function readVarint(bytes: Uint8Array, position: { pos: number }): number {
+  let value = 0
+  let shift = 0
+  let byte: number
+  do {
+    byte = bytes[position.pos++]
+    value += (byte & 0x7f) * 2 ** shift
+    shift += 7
+  } while (byte & 0x80)
+  return value
+}
+
+function parseDirectory(bytes: Uint8Array): Entry[] {
+  const position = { pos: 0 }
+  const count = readVarint(bytes, position)
+  const entries: Entry[] = []
+
+  let tileId = 0
+  for (let i = 0; i < count; i++) {
+    tileId += readVarint(bytes, position)
+    entries.push({ tileId, offset: 0, length: 0, runLength: 0 })
+  }
+  for (const entry of entries) entry.runLength = readVarint(bytes, position)
+  for (const entry of entries) entry.length = readVarint(bytes, position)
+  entries.forEach((entry, i) => {
+    const offset = readVarint(bytes, position)
+    // 0 means "directly after the previous entry"
+    entry.offset = offset === 0 && i > 0
+      ? entries[i - 1].offset + entries[i - 1].length
+      : offset - 1
+  })
+  return entries
+}
+
+/** Position of a tile on the PMTiles Hilbert curve across all zooms */
+export function zxyToTileId(z: number, x: number, y: number): number {
+  let tileId = ((4 ** z) - 1) / 3
+  const n = 2 ** z
+  for (let s = n / 2; s >= 1; s /= 2) {
+    const rx = (x & s) > 0 ? 1 : 0
+    const ry = (y & s) > 0 ? 1 : 0
+    tileId += s * s * ((3 * rx) ^ ry)
+    if (ry === 0) {
+      if (rx === 1) {
+        x = n - 1 - x
+        y = n - 1 - y
+      }
+      ;[x, y] = [y, x]
+    }
+  }
+  return tileId
+}
+
+function findEntry(entries: Entry[], tileId: number): Entry | undefined {
+  let lo = 0
+  let hi = entries.length - 1
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1
+    if (entries[mid].tileId > tileId) hi = mid - 1
+    else lo = mid + 1
+  }
+  const entry = entries[hi]
+  if (!entry) return undefined
+  // A run length of 0 marks a leaf directory covering the ids from tileId on
+  if (entry.runLength === 0) return entry
+  return tileId < entry.tileId + entry.runLength ? entry : undefined
+}
+
+async function fetchRange(
+  url: string,
+  offset: number,
+  length: number,
+  signal?: AbortSignal
+): Promise<ArrayBuffer> {
+  const response = await fetch(url, {
+    headers: { Range: `bytes=${offset}-${offset + length - 1}` },
+    signal,
+  })
+  if (!response.ok) {
+    throw new Error(`Failed to load ${url}: ${response.status}`)
+  }
+  const buffer = await response.arrayBuffer()
+  // Servers that ignore Range return the whole archive
+  return response.status === 200 ? buffer.slice(offset, offset + length) : buffer
+}
+
+function loadArchive(url: string): Promise<Archive> {
+  let archive = archives.get(url)
+  if (!archive) {
+    archive = fetchRange(url, 0, HEADER_FETCH_BYTES).then((buffer) => {
+      const view = new DataView(buffer)
+      const magic = new TextDecoder().decode(new Uint8Array(buffer, 0, 7))
+      if (magic !== 'PMTiles' || view.getUint8(7) !== 3) {
+        throw new Error(`${url} is not a PMTiles v3 archive`)
+      }
+      if (view.getUint8(97) !== COMPRESSION_NONE || view.getUint8(98) !== COMPRESSION_NONE) {
+        throw new Error(`${url} uses compression this reader does not support`)
+      }
+      const rootOffset = readUint64(view, 8)
+      const rootLength = readUint64(view, 16)
+      return {
+        leafDirectoryOffset: readUint64(view, 40),
+        tileDataOffset: readUint64(view, 56),
+        entries: parseDirectory(new Uint8Array(buffer, rootOffset, rootLength)),
+        leaves: new Map(),
+      }
+    })
+    // Let a failed load be retried on the next tile request
+    archive.catch(() => archives.delete(url))
+    archives.set(url, archive)
+  }
+  return archive
+}
+
+function loadLeaf(url: string, archive: Archive, entry: Entry): Promise<Entry[]> {
+  let leaf = archive.leaves.get(entry.offset)
+  if (!leaf) {
+    leaf = fetchRange(url, archive.leafDirectoryOffset + entry.offset, entry.length).then((buffer) =>
+      parseDirectory(new Uint8Array(buffer))
+    )
+    leaf.catch(() => archive.leaves.delete(entry.offset))
+    archive.leaves.set(entry.offset, leaf)
+  }
+  return leaf
+}
+
+/** Directory entry of a tile, following leaf directories from the root */
+async function getTileEntry(url: string, archive: Archive, tileId: number): Promise<Entry | undefined> {
+  let entries = archive.entries
+  for (let depth = 0; depth <= MAX_DIRECTORY_DEPTH; depth++) {
+    const entry = findEntry(entries, tileId)
+    if (!entry || entry.runLength > 0) return entry
+    entries = await loadLeaf(url, archive, entry)
+  }
+  throw new Error(`${url}: leaf directories nested too deeply`)
+}
+
+/**
+ * MapLibre protocol handler; register with
+ * `maplibregl.addProtocol(PMTILES_PROTOCOL, loadPMTile)`.
+ */
+export async function loadPMTile(
+  params: RequestParameters,
+  abortController: AbortController
+): Promise<{ data: ArrayBuffer }> {
+  const match = TILE_URL.exec(params.url)
+  if (!match) {
+    throw new Error(`Invalid PMTiles tile URL: ${params.url}`)
+  }
+  const [, url, z, x, y] = match
+  const archive = await loadArchive(url)
+  const entry = await getTileEntry(url, archive, zxyToTileId(Number(z), Number(x), Number(y)))
+  if (!entry) {
+    // Empty tile
+    return { data: new ArrayBuffer(0) }
+  }
+  const data = await fetchRange(url, archive.tileDataOffset + entry.offset, entry.length, abortController.signal)
+  return { data }
+}
@@ -0,0 +1,66 @@
+/**
+ * Spatial Index
+ *
+ * Nearest-masjid queries over the static KD-tree generated into
+ * src/data/masjid-kdtree.ts. Points are unit vectors, so chord distance
+ * orders results exactly like great-circle distance. Each index range
+ * [lo, hi] has its node at the middle slot, split on axis depth % 3.
+ */
+
+import { KD_COORDS, KD_IDS } from '@/data/masjid-kdtree'
+import type { Coordinates } from '@/types'
+
+const EARTH_RADIUS_M = 6371008.8
+
+export interface NearbyMasjid {
+  id: string
+  /** Great-circle distance in metres */
+  distance: number
+}
+
+function toUnitVector({ lat, lng }: Coordinates): [number, number, number] {
+  const phi = (lat * Math.PI) / 180
+  const lambda = (lng * Math.PI) / 180
+  return [Math.cos(phi) * Math.cos(lambda), Math.cos(phi) * Math.sin(lambda), Math.sin(phi)]
+}
+
+function chordToMetres(chord2: number): number {
+  return 2 * EARTH_RADIUS_M * Math.asin(Math.min(1, Math.sqrt(chord2) / 2))
+}
+
+/**
+ * Find the `k` masjids nearest to a point, nearest first.
+ */
+export function findNearest(point: Coordinates, k: number): NearbyMasjid[] {
+  const target = toUnitVector(point)
+  // Sorted ascending by squared chord distance, at most k entries
+  const best: { slot: number; d2: number }[] = []
+
+  const search = (lo: number, hi: number, axis: number) => {
+    if (lo > hi) return
+    const mid = (lo + hi) >> 1
+    let d2 = 0
+    for (let a = 0; a < 3; a++) {
+      const diff = KD_COORDS[mid * 3 + a] - target[a]
+      d2 += diff * diff
+    }
+    if (best.length < k || d2 < best[best.length - 1].d2) {
+      let i = best.length
+      while (i > 0 && best[i - 1].d2 > d2) i--
+      best.splice(i, 0, { slot: mid, d2 })
+      if (best.length > k) best.pop()
+    }
+
+    const delta = target[axis] - KD_COORDS[mid * 3 + axis]
+    const next = (axis + 1) % 3
+    const [nearLo, nearHi, farLo, farHi] =
+      delta < 0 ? [lo, mid - 1, mid + 1, hi] : [mid + 1, hi, lo, mid - 1]
+    search(nearLo, nearHi, next)
+    if (best.length < k || delta * delta < best[best.length - 1].d2) {
+      search(farLo, farHi, next)
+    }
+  }
+
+  if (k > 0) search(0, KD_IDS.length - 1, 0)
+  return best.map(({ slot, d2 }) => ({ id: KD_IDS[slot], distance: chordToMetres(d2) }))
+}
@@ -2,20 +2,40 @@
  * HomePage
  *
  * Full-screen interactive map with region filters and masjid selection.
+ * The locate button selects the masjid nearest to the user.
  */
 
-import { useState } from 'react'
+import { useCallback, useState } from 'react'
 import { MasjidMap, BottomSheet, RegionFilterBar, SettingsSheet } from '@/components/organisms'
 import { PageHead } from '@/components/seo'
 import { useMasjidStore } from '@/stores/useMasjidStore'
-import { Settings } from '@/design-tokens'
+import { loadMasjid, loadNearestMasjids } from '@/lib/masjid-chunks'
+import { Locate, Settings } from '@/design-tokens'
 import { SITE_URL, SITE_NAME, SITE_DESCRIPTION } from '@/lib/seo'
 
 export default function HomePage() {
-  const { masjids, selectedMasjid, activeRegions, selectMasjid, toggleRegion } =
+  const { selectedMasjid, activeRegions, selectMasjid, toggleRegion } =
     useMasjidStore()
   const [isSettingsOpen, setIsSettingsOpen] = useState(false)
 
+  // Markers only carry an id; load the full record from its region chunk
+  const handleMasjidSelect = useCallback(
+    (id: string) => {
+      loadMasjid(id).then((masjid) => {
+        if (masjid) selectMasjid(masjid)
+      })
+    },
+    [selectMasjid]
+  )
+
+  const handleLocate = useCallback(() => {
+    navigator.geolocation?.getCurrentPosition(({ coords }) => {
+      loadNearestMasjids({ lat: coords.latitude, lng: coords.longitude }, 1).then(([nearest]) => {
+        if (nearest) selectMasjid(nearest.masjid)
+      })
+    })
+  }, [selectMasjid])
+
   return (
     <div className="h-screen w-screen relative overflow-hidden bg-night-deepest">
       <PageHead
@@ -29,10 +49,9 @@ export default function HomePage() {
 
       {/* Full-screen map */}
       <MasjidMap
-        masjids={masjids}
         selectedMasjid={selectedMasjid}
         activeRegions={activeRegions}
-        onMasjidSelect={selectMasjid}
+        onMasjidSelect={handleMasjidSelect}
         className="absolute inset-0"
       />
 
@@ -60,6 +79,16 @@ export default function HomePage() {
         <Settings className="w-4 h-4 text-text-secondary" />
       </button>
 
+      {/* Nearest masjid button */}
+      <button
+        onClick={handleLocate}
+        className="absolute bottom-16 left-4 z-10 w-10 h-10 rounded-full bg-night-medium border border-border-subtle flex items-center justify-center hover:bg-night-soft transition-colors"
+        title="أقرب مسجد"
+        aria-label="أقرب مسجد"
+      >
+        <Locate className="w-4 h-4 text-text-secondary" />
+      </button>
+
       {/* Settings bottom sheet */}
       <SettingsSheet
         isOpen={isSettingsOpen}
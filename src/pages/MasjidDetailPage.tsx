@@ -6,8 +6,9 @@
  * Generates 148 unique pages with reader info, location, and audio.
  */
 
+import { use } from 'react'
 import { useParams, Link } from 'react-router-dom'
-import { getMasjidById, getRelatedMasjids } from '@/lib/masjid-utils'
+import { loadMasjid, loadRelatedMasjids } from '@/lib/masjid-chunks'
 import {
   getMasjidTitle,
   getMasjidDescription,
@@ -28,7 +29,8 @@ function isDirectAudioUrl(url: string): boolean {
 
 export default function MasjidDetailPage() {
   const { id } = useParams<{ id: string }>()
-  const masjid = getMasjidById(id!)
+  // Suspends until the chunk holding this masjid is loaded
+  const masjid = use(loadMasjid(id!))
 
   if (!masjid) {
     return (
@@ -43,7 +45,7 @@ export default function MasjidDetailPage() {
     )
   }
 
-  const relatedMasjids = getRelatedMasjids(masjid)
+  const relatedMasjids = use(loadRelatedMasjids(masjid.id))
   const isAudioFile = isDirectAudioUrl(masjid.audioUrl)
 
   return (
@@ -184,7 +186,7 @@ export default function MasjidDetailPage() {
               id="related-heading"
               className="text-lg font-semibold text-text-primary mb-4 text-right"
             >
-              مساجد أخرى في {REGION_LABELS[masjid.region]}
+              مساجد قريبة
             </h3>
             <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
               {relatedMasjids.map((related) => (
@@ -6,8 +6,9 @@
  * Generates 3 pages (north, east, westSouth) listing all masjids in the region.
  */
 
+import { use } from 'react'
 import { useParams, Link } from 'react-router-dom'
-import { getMasjidsByRegion } from '@/lib/masjid-utils'
+import { loadRegionMasjids } from '@/lib/masjid-chunks'
 import { getRegionTitle, getRegionDescription, getRegionUrl, SITE_URL } from '@/lib/seo'
 import { REGION_LABELS } from '@/constants/map'
 import { PageHead, BreadcrumbJsonLd } from '@/components/seo'
@@ -33,7 +34,8 @@ export default function RegionListingPage() {
     )
   }
 
-  const masjids = getMasjidsByRegion(typedRegion)
+  // Suspends until this region's chunk is loaded
+  const masjids = use(loadRegionMasjids(typedRegion))
 
   return (
     <div className="min-h-screen bg-night-deepest" dir="rtl">
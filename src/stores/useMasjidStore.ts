@@ -5,11 +5,9 @@
  */
 
 import { create } from 'zustand'
-import { MASJIDS } from '@/data/masjids'
 import type { Masjid, Region } from '@/types'
 
 interface MasjidState {
-  masjids: Masjid[]
   selectedMasjid: Masjid | null
   activeRegions: Region[]
 
@@ -18,7 +16,6 @@ interface MasjidState {
 }
 
 export const useMasjidStore = create<MasjidState>((set) => ({
-  masjids: MASJIDS,
   selectedMasjid: null,
   activeRegions: [],
 